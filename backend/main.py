@@ -1,19 +1,7 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 from models.api_models import ReadingRequest, ReadingResponse, CardInfo
-from models.reading import ReadingService
-from models.spreads import (
-    SpreadPosition,
-    GenericSpread,
-    SingleCardSpread,
-    ThreeCardSpread,
-    CelticCrossSpread,
-    FiveCardCrossSpread,
-    SevenCardHorseshoeSpread,
-    FourCardDecisionSpread,
-    SixCardRelationshipSpread,
-    TwelveCardSpread,
-)
+from arcanum.reading import ReadingService
 from models.practice_models import (
     StartPracticeRequest,
     StartPracticeResponse,
@@ -26,10 +14,24 @@ from models.practice_models import (
     ScenarioCategory,
 )
 from services.practice_service import PracticeService
+from services.card_catalog import get_card_catalog
+from services.spreads_config_service import get_spreads_config_service
+from services.enhanced_cards import get_enhanced_card_service, parse_fields
+from services.static_payloads import PayloadSource, StaticPayload, StaticPayloadCache
+from services.startup import LazyService, ServiceInitializer, ServiceUnavailableError
+from services.prompt_store import get_prompt_store
+from services.state_store import StateMapping, get_state_store
+from services.training_store import DEFAULT_PAGE_SIZE as TRAINING_PAGE_SIZE, get_training_store
 from fastapi.staticfiles import StaticFiles
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, List, Dict
+import asyncio
 import json
+import time
 import sys
 import os
 from datetime import datetime
@@ -40,6 +42,16 @@ from reading_generator import TarotReadingGenerator, ReadingRequest as GenReadin
 from prompt_engineer import ReadingStyle, ReadingTone
 from context_string_builder import ContextStringBuilder
 from mlx_model_service import get_model_service, ModelInfo, InferenceRequest
+from inference_queue import InferenceJob, get_inference_queue
+from reading_text import ReadingTextStream, clean_reading_text
+from batch_readings import (
+    MAX_BATCH_SIZE,
+    MAX_JSON_PROMPT_BATCH_SIZE,
+    BatchReadingBuilder,
+    get_prompt_pool,
+)
+from reading_views import SLIM_VIEW, prompt_dict, response_view, wants_prompt
+from metrics import REGISTRY, cache_families
 
 app = FastAPI()
 
@@ -53,100 +65,187 @@ app.add_middleware(
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-with open("static/tarot-images.json", "r") as f:
-    card_data = json.load(f)
+HTTP_REQUESTS = REGISTRY.counter(
+    "arcanum_http_requests", "HTTP requests handled", ["method", "route", "status"]
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "arcanum_http_request_seconds",
+    "Time until the response starts (streamed bodies excluded)",
+    ["method", "route"],
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "arcanum_http_requests_in_flight", "Requests being handled", ["method", "route"]
+)
 
+# Route template per (method, path), so /api/enhanced-cards/the_fool is
+# counted under /api/enhanced-cards/{card_id}
+_route_labels: Dict[tuple, str] = {}
 
-# Load spreads configuration to map spread IDs to spread classes
-def create_spread_from_config(
-    spread_name: str, positions_config: List[Dict]
-) -> GenericSpread:
-    """Create a GenericSpread from configuration data with validation"""
-    positions = []
-    for pos in positions_config:
-        if not all(key in pos for key in ["name", "description"]):
-            raise ValueError(f"Position missing required fields: {pos}")
-        positions.append(SpreadPosition(pos["name"], pos["description"]))
 
-    return GenericSpread(spread_name, positions)
+def route_label(scope) -> str:
+    key = (scope["method"], scope["path"])
+    label = _route_labels.get(key)
+    if label is None:
+        label = "unmatched"
+        for route in app.router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                label = route.path
+                break
+        if len(_route_labels) < 10000:
+            _route_labels[key] = label
+    return label
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    method = request.method
+    route = route_label(request.scope)
+    HTTP_IN_FLIGHT.inc(method=method, route=route)
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        HTTP_LATENCY.observe(time.perf_counter() - start, method=method, route=route)
+        HTTP_REQUESTS.inc(method=method, route=route, status=status)
+        HTTP_IN_FLIGHT.dec(method=method, route=route)
 
+reader = ReadingService()
 
-def load_spreads_mapping():
-    """Load spreads config and create mapping from spread ID to spread instances"""
-    try:
-        with open("config/spreads-config.json", "r") as f:
-            config = json.load(f)
-
-        # Legacy spread classes for compatibility
-        legacy_spreads = {
-            1: SingleCardSpread,
-            3: ThreeCardSpread,
-            4: FourCardDecisionSpread,
-            5: FiveCardCrossSpread,
-            6: SixCardRelationshipSpread,
-            7: SevenCardHorseshoeSpread,
-            10: CelticCrossSpread,
-            12: TwelveCardSpread,
-        }
+# Components that take a while to build (file parsing, tokenizer and model
+# discovery) are built concurrently in the background once the app starts.
+# The names below wait for their component on first use; /health/ready
+# reports when everything required is built and how long each one took.
+services = ServiceInitializer()
 
-        spreads_mapping = {}
-        for spread in config["spreads"]:
-            spread_id = spread["id"]
-            spread_name = spread["name"]
-            layout = config["layouts"][spread["layout"]]
-            card_count = len(layout["positions"])
 
-            # Use legacy spread class if available, otherwise create generic spread
-            if card_count in legacy_spreads:
-                spreads_mapping[spread_id] = legacy_spreads[card_count]
-            else:
-                try:
-                    spreads_mapping[spread_id] = create_spread_from_config(
-                        spread_name, layout["positions"]
-                    )
-                except Exception as pos_error:
-                    print(f"Error creating spread {spread_id}: {pos_error}")
+READING_GENERATOR_CARDS_PATH = (
+    "/Users/katelouie/code/arcanum/llm/rag/data_generation/generated_cards/all_cards.json"
+)
 
-        return spreads_mapping
-    except Exception as e:
-        print(f"Error loading spreads mapping: {e}")
-        # Fallback to legacy mapping
-        return {
-            "single-focus": SingleCardSpread,
-            "past-present-future": ThreeCardSpread,
-            "celtic-cross": CelticCrossSpread,
-        }
 
+def build_reading_generator():
+    return TarotReadingGenerator(
+        cards_json_path=READING_GENERATOR_CARDS_PATH,
+        spreads_config_path=services.get("spreads_config").config_path,
+    )
 
-spreads = load_spreads_mapping()
 
-reader = ReadingService()
+def build_enhanced_cards():
+    service = get_enhanced_card_service()
+    service.index()
+    return service
 
-# Initialize the reading generator for AI interpretations
-try:
-    reading_generator = TarotReadingGenerator(
-        cards_json_path="/Users/katelouie/code/arcanum/llm/rag/data_generation/generated_cards/all_cards.json",
-        spreads_config_path="/Users/katelouie/code/arcanum/backend/config/spreads-config.json",
-    )
-    print("✅ Reading generator initialized successfully")
-except Exception as e:
-    print(f"❌ Failed to initialize reading generator: {e}")
-    reading_generator = None
 
-# Initialize the practice service
-try:
-    practice_service = PracticeService()
-    print("✅ Practice service initialized successfully")
-except Exception as e:
-    print(f"❌ Failed to initialize practice service: {e}")
-    practice_service = None
+def build_training_store():
+    store = get_training_store()
+    store.refresh()
+    return store
+
 
+def warm_static_payloads():
+    for name in ("interpretations", "enhanced-cards", "spreads"):
+        static_payloads.get(name)
+    return static_payloads
+
+
+# Card images, numbers, suits and enhanced-card ids, indexed once by id and name
+services.register("card_catalog", get_card_catalog)
+# Spreads from config/spreads-config.json, parsed once and keyed by spread ID.
+# Reloaded when the file changes, so endpoints read it through the service.
+services.register("spreads_config", get_spreads_config_service)
+# Enhanced cards indexed by id, for single-card and projected requests
+services.register("enhanced_cards", build_enhanced_cards, depends_on=["card_catalog"])
+# Reading generator for AI interpretations; endpoints work without it
+services.register(
+    "reading_generator", build_reading_generator, depends_on=["spreads_config"], required=False
+)
+services.register(
+    "practice_service", PracticeService, depends_on=["card_catalog", "spreads_config"]
+)
+# Scans the models directory; no model is loaded until one is asked for
+services.register("model_service", get_model_service)
+services.register(
+    "static_payloads",
+    warm_static_payloads,
+    depends_on=["spreads_config", "enhanced_cards"],
+    required=False,
+)
+# Training readings and interpretations for DevMode, indexed from llm/tuning_data
+services.register("training_store", build_training_store, required=False)
+
+card_catalog = LazyService(services, "card_catalog")
+spreads_config = LazyService(services, "spreads_config")
+enhanced_cards = LazyService(services, "enhanced_cards")
+reading_generator = LazyService(services, "reading_generator")
+practice_service = LazyService(services, "practice_service")
+model_service = LazyService(services, "model_service")
+training_store = LazyService(services, "training_store")
+
+
+@app.on_event("startup")
+def start_services():
+    services.start()
+
+
+# Large JSON documents, kept serialized and compressed until their source changes
+static_payloads = StaticPayloadCache()
+static_payloads.add_file("interpretations", "interpretations.json")
+# Built from the enhanced card index, so all_cards.json is parsed only once
+static_payloads.add(
+    "enhanced-cards",
+    PayloadSource(
+        load=lambda: dict(enhanced_cards.index().cards),
+        version=lambda: enhanced_cards.index().version,
+    ),
+)
+static_payloads.add(
+    "spreads",
+    PayloadSource(
+        load=lambda: spreads_config.data,
+        version=lambda: spreads_config.snapshot().version,
+    ),
+)
+
+
+def static_payload_response(request: Request, payload: StaticPayload) -> Response:
+    """Send a cached payload, or 304 if the client already has it"""
+    headers = {
+        "ETag": payload.etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "no-cache",
+    }
+    if payload.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+
+    body, encoding = payload.encode_for(request.headers.get("accept-encoding"))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @app.get("/")
 def read_root():
     return {"message": "Hello Arcanum"}
 
 
+@app.get("/health/live")
+def health_live():
+    """The process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+def health_ready():
+    """Ready once every required component is built; includes build times"""
+    report = services.report()
+    if not report["ready"]:
+        return JSONResponse(status_code=503, content={"status": "starting", **report})
+    return {"status": "ready", **report}
+
+
 @app.get("/api/cards/{filename}")
 def get_card_image(filename: str):
     # This will serve images at /api/cards/m00.jpg, etc.
@@ -154,42 +253,101 @@ def get_card_image(filename: str):
 
 
 @app.get("/api/interpretations")
-def get_interpretations():
+def get_interpretations(request: Request):
     """Get card and position interpretations (legacy)"""
     try:
-        with open("interpretations.json", "r") as f:
-            return json.load(f)
+        return static_payload_response(request, static_payloads.get("interpretations"))
     except FileNotFoundError:
         return {"error": "Interpretations file not found"}
     except json.JSONDecodeError:
         return {"error": "Invalid interpretations JSON"}
 
 
+def _unavailable_cause(e: Exception) -> BaseException:
+    """What a service raised when it was built, or e itself"""
+    if isinstance(e, ServiceUnavailableError) and e.__cause__ is not None:
+        return e.__cause__
+    return e
+
+
+def _parse_fields_param(fields: Optional[str]):
+    if fields is None:
+        return None
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/api/enhanced-cards")
-def get_enhanced_cards():
-    """Get enhanced card interpretations from generated cards data"""
+def get_enhanced_cards(request: Request, fields: Optional[str] = None):
+    """Get enhanced card interpretations from generated cards data
+
+    With fields (e.g. "card_name,core_meanings.upright"), every card is
+    trimmed to just those fields.
+    """
     try:
-        with open(
-            "/Users/katelouie/code/arcanum/llm/rag/data_generation/generated_cards/all_cards.json",
-            "r",
-        ) as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"error": "Enhanced cards file not found"}
-    except json.JSONDecodeError:
-        return {"error": "Invalid enhanced cards JSON"}
+        if fields is None:
+            return static_payload_response(request, static_payloads.get("enhanced-cards"))
+        index = enhanced_cards.index()
+        cards, _ = index.get_many(index.cards, _parse_fields_param(fields))
+        return cards
+    except (OSError, ValueError, ServiceUnavailableError) as e:
+        cause = _unavailable_cause(e)
+        if isinstance(cause, FileNotFoundError):
+            return {"error": "Enhanced cards file not found"}
+        if isinstance(cause, json.JSONDecodeError):
+            return {"error": "Invalid enhanced cards JSON"}
+        raise
+
+
+@app.get("/api/enhanced-cards/batch")
+def get_enhanced_cards_batch(ids: str, fields: Optional[str] = None):
+    """Get several enhanced cards at once
+
+    ids is comma-separated; each id can be an enhanced-card id ("the_fool"),
+    a canonical card id ("0") or a card name ("The Fool").
+    """
+    paths = _parse_fields_param(fields)
+    card_ids = [card_id.strip() for card_id in ids.split(",") if card_id.strip()]
+    cards, missing = enhanced_cards.index().get_many(card_ids, paths)
+    return {"cards": cards, "missing": missing}
+
+
+@app.get("/api/enhanced-cards/{card_id}")
+def get_enhanced_card(card_id: str, request: Request, fields: Optional[str] = None):
+    """Get one enhanced card, optionally trimmed to some fields"""
+    try:
+        index = enhanced_cards.index()
+    except (FileNotFoundError, ServiceUnavailableError) as e:
+        if not isinstance(_unavailable_cause(e), FileNotFoundError):
+            raise
+        raise HTTPException(status_code=404, detail="Enhanced cards file not found")
+    if fields is None:
+        payload = index.payload(card_id)
+        if payload is None:
+            raise HTTPException(status_code=404, detail=f"Card not found: {card_id}")
+        return static_payload_response(request, payload)
+
+    card = index.get(card_id, _parse_fields_param(fields))
+    if card is None:
+        raise HTTPException(status_code=404, detail=f"Card not found: {card_id}")
+    return card
 
 
 @app.get("/api/spreads")
-def get_spreads_config():
+def get_spreads_config(request: Request):
     """Get available tarot spreads and layouts configuration"""
     try:
-        with open("config/spreads-config.json", "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"error": "Spreads configuration file not found"}
-    except json.JSONDecodeError:
-        return {"error": "Invalid spreads configuration JSON"}
+        return static_payload_response(request, static_payloads.get("spreads"))
+    except ServiceUnavailableError as e:
+        # The config couldn't be read when the service was built
+        cause = _unavailable_cause(e)
+        if isinstance(cause, FileNotFoundError):
+            return {"error": "Spreads configuration file not found"}
+        if isinstance(cause, json.JSONDecodeError):
+            return {"error": "Invalid spreads configuration JSON"}
+        return {"error": f"Spreads configuration not available: {cause}"}
 
 
 @app.get("/api/stories")
@@ -239,38 +397,52 @@ def get_available_stories():
 # Removed complex metadata extraction functions to avoid API hanging
 
 
+# Generated prompts by id, so the interpretation request can send the id
+# instead of uploading both prompts again
+prompt_store = get_prompt_store()
+
+
+def requested_view(http_request: Request, view: Optional[str]) -> str:
+    """The response view from ?view= or a Prefer header (400 if unknown)"""
+    try:
+        return response_view(view, http_request.headers.get("prefer"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def reading_response(response: ReadingResponse, view: str):
+    """Full responses as before; slim ones without the fields that are empty"""
+    if view == SLIM_VIEW:
+        return JSONResponse(jsonable_encoder(response, exclude_none=True))
+    return response
+
+
 @app.post("/api/reading/cards", response_model=ReadingResponse)
-def create_reading_cards_only(request: ReadingRequest):
-    """Create a reading with cards and prompts, but without MLX AI generation"""
+def create_reading_cards_only(
+    request: ReadingRequest,
+    http_request: Request,
+    view: Optional[str] = None,
+    include_prompt: bool = False,
+    prompt_handle: bool = False,
+):
+    """Create a reading with cards and prompts, but without MLX AI generation
+
+    view=slim (or "Prefer: return=minimal") leaves out combined_prompt and
+    the prompt metadata, and only builds the prompts with include_prompt=true.
+    Generated prompts are kept server-side: full_prompt.prompt_id can be sent
+    to /api/reading/ai-interpretation instead of the prompt text. A slim
+    response with prompt_handle=true has the id without the text.
+    """
+    view = requested_view(http_request, view)
+
     # Get the spread class and position names from config
+    spreads = spreads_config.registry
     if request.spread_type not in spreads:
         raise HTTPException(
             status_code=400, detail=f"Unknown spread type: {request.spread_type}"
         )
 
-    spread_class = spreads[request.spread_type]
-    spread = spread_class()
-
-    # Load position names from spreads config
-    try:
-        with open("config/spreads-config.json", "r") as f:
-            config = json.load(f)
-
-        # Find the spread configuration
-        spread_config = None
-        for s in config["spreads"]:
-            if s["id"] == request.spread_type:
-                spread_config = s
-                break
-
-        if spread_config:
-            # Override position names with the ones from config
-            custom_positions = [pos["name"] for pos in spread_config["positions"]]
-        else:
-            custom_positions = None
-    except Exception as e:
-        print(f"Error loading spread config: {e}")
-        custom_positions = None
+    spread = spreads.get(request.spread_type)
 
     # Perform the reading
     reading = reader.perform_reading(
@@ -285,75 +457,52 @@ def create_reading_cards_only(request: ReadingRequest):
     cards_info = []
 
     for index, drawn_card in enumerate(reading.cards):
-        # Find the image filename for this card
-        card_filename = None
-        print(f"Looking for card: '{drawn_card.card.name}'")
-        for card_entry in card_data["cards"]:
-            if card_entry["name"] == drawn_card.card.name:
-                card_filename = card_entry["img"]
-                print(f"Found match: {card_filename}")
-                break
-
-        # If we couldn't find the card, use a fallback filename
-        if card_filename is None:
-            card_filename = "placeholder.jpg"  # Or some default
-
         cards_info.append(
             {
                 "name": drawn_card.card.name,
-                "position": custom_positions[index]
-                if custom_positions
-                else drawn_card.position.name,
+                "position": spread.position_names[index],
                 "reversed": drawn_card.reversed,
-                "image_url": f"/static/cards_wikipedia/{card_filename}",
+                # Falls back to the placeholder image for unknown cards
+                "image_url": card_catalog.image_url(drawn_card.card.name),
             }
         )
 
-    # Always generate the prompt and full context (no MLX inference)
-    try:
-        # Create card tuples in the format expected by the generator
-        cards_with_positions = [
-            (card_info["name"], card_info["reversed"], card_info["position"])
-            for card_info in cards_info
-        ]
-
-        # Create reading request for generator
-        gen_request = GenReadingRequest(
-            question=request.question,
-            spread_id=request.spread_type,
-            cards_with_positions=cards_with_positions,
-            style=ReadingStyle.DEFAULT,
-            tone=ReadingTone.DEFAULT,
-        )
+    # Generate the prompt and full context (no MLX inference), unless a slim
+    # response without prompts was asked for
+    interpretation = None  # Cards-only endpoint doesn't generate interpretation
+    full_prompt = None
+    send_prompt = wants_prompt(view, include_prompt)
+    if send_prompt or prompt_handle:
+        try:
+            # Create card tuples in the format expected by the generator
+            cards_with_positions = [
+                (card_info["name"], card_info["reversed"], card_info["position"])
+                for card_info in cards_info
+            ]
 
-        generated_reading = reading_generator.generate_reading_prompt(gen_request)
-
-        # Prepare full prompt data
-        full_prompt = {
-            "system_prompt": generated_reading.system_prompt,
-            "user_prompt": generated_reading.user_prompt,
-            "combined_prompt": f"{generated_reading.system_prompt}\n\nUser: {generated_reading.user_prompt}\n\nAssistant:",
-            "metadata": {
-                "question_type": generated_reading.question_type.value,
-                "question_confidence": generated_reading.question_confidence,
-                "style": generated_reading.style.value,
-                "tone": generated_reading.tone.value,
-                "context_tokens": generated_reading.context_tokens,
-                "prompt_tokens": generated_reading.prompt_tokens,
-                "total_tokens": generated_reading.total_tokens,
-                "completeness": generated_reading.completeness,
-            },
-        }
+            # Create reading request for generator
+            gen_request = GenReadingRequest(
+                question=request.question,
+                spread_id=request.spread_type,
+                cards_with_positions=cards_with_positions,
+                style=ReadingStyle.DEFAULT,
+                tone=ReadingTone.DEFAULT,
+            )
 
-        interpretation = None  # Cards-only endpoint doesn't generate interpretation
-    except Exception as e:
-        print(f"Failed to generate interpretation: {e}")
-        interpretation = "Error generating reading interpretation."
-        full_prompt = None
+            generated_reading = reading_generator.generate_reading_prompt(gen_request)
+
+            # Prepare prompt data in the requested view
+            full_prompt = prompt_dict(generated_reading, view) if send_prompt else {}
+            full_prompt["prompt_id"] = prompt_store.put(
+                generated_reading.system_prompt, generated_reading.user_prompt
+            )
+        except Exception as e:
+            print(f"Failed to generate interpretation: {e}")
+            interpretation = "Error generating reading interpretation."
 
-    return ReadingResponse(
+    response = ReadingResponse(
         question=request.question,
-        spread_name=spread_config["name"] if spread_config else request.spread_type,
+        spread_name=spread.name,
         cards=cards_info,
         timestamp=reading.timestamp,
         shuffle_count=request.shuffle_count,
@@ -362,39 +511,127 @@ def create_reading_cards_only(request: ReadingRequest):
         full_prompt=full_prompt,
         ai_response=None,  # No AI response yet
     )
+    return reading_response(response, view)
+
+
+@app.get("/api/prompts/{prompt_id}")
+def get_prompt(prompt_id: str):
+    """The prompts behind a prompt_id, for clients that drew with prompt_handle=true"""
+    stored = prompt_store.get(prompt_id)
+    if stored is None:
+        raise HTTPException(
+            status_code=404, detail=f"Prompt not found or expired: {prompt_id}"
+        )
+    return {
+        "prompt_id": prompt_id,
+        "system_prompt": stored.system_prompt,
+        "user_prompt": stored.user_prompt,
+    }
+
+
+class BatchReadingItem(BaseModel):
+    question: str
+    spread_type: str
+    shuffle_count: int = 7
+    include_date: bool = False
+    rhythm: Optional[List[float]] = None
+    id: Optional[str] = None  # Copied to the result, for matching them up
+
+
+class ReadingBatchRequest(BaseModel):
+    readings: List[BatchReadingItem]
+    include_prompt: bool = True
+    prompt_handle: bool = False
+
+
+@app.post("/api/readings/batch")
+def create_readings_batch(
+    batch_request: ReadingBatchRequest,
+    request: Request,
+    format: Optional[str] = None,
+    view: Optional[str] = None,
+):
+    """Draw many readings (cards and prompts, no AI generation) in one call
+
+    Results come back in request order as {"readings": [...]}, or one JSON
+    object per line with format=ndjson (or Accept: application/x-ndjson).
+    With view=slim, prompts (if included) leave out combined_prompt and the
+    metadata. With prompt_handle=true, prompts are kept server-side and
+    each full_prompt has a prompt_id; with include_prompt=false as well,
+    only the ids are returned.
+    A request with an unknown spread gets an "error" entry; the rest of the
+    batch still runs.
+    """
+    count = len(batch_request.readings)
+    if count > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BATCH_SIZE} readings per batch",
+        )
+
+    ndjson = format == "ndjson" or "application/x-ndjson" in request.headers.get(
+        "accept", ""
+    )
+    if batch_request.include_prompt and not ndjson and count > MAX_JSON_PROMPT_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                f"At most {MAX_JSON_PROMPT_BATCH_SIZE} readings with prompts in one JSON "
+                "body; use format=ndjson, or prompt_handle=true with include_prompt=false"
+            ),
+        )
+
+    generator = services.get("reading_generator")
+    builder = BatchReadingBuilder(
+        reader=reader,
+        spreads=spreads_config.registry,
+        card_catalog=card_catalog,
+        reading_generator=generator,
+        view=requested_view(request, view),
+        prompt_pool=(
+            get_prompt_pool(READING_GENERATOR_CARDS_PATH, spreads_config.config_path)
+            if generator is not None
+            else None
+        ),
+        prompt_store=prompt_store,
+    )
+    results = builder.build(
+        [item.dict() for item in batch_request.readings],
+        include_prompt=batch_request.include_prompt,
+        prompt_handle=batch_request.prompt_handle,
+    )
+
+    if ndjson:
+        return StreamingResponse(
+            (json.dumps(result) + "\n" for result in results),
+            media_type="application/x-ndjson",
+        )
+    readings = list(results)
+    return {
+        "readings": readings,
+        "count": len(readings),
+        "errors": sum(1 for result in readings if "error" in result),
+    }
 
 
 @app.post("/api/reading", response_model=ReadingResponse)
-def create_reading(request: ReadingRequest):
+async def create_reading(
+    request: ReadingRequest,
+    http_request: Request,
+    wait_for_ai: bool = True,
+    view: Optional[str] = None,
+    include_prompt: bool = False,
+):
+    view = requested_view(http_request, view)
+
     # Get the spread class and position names from config
+    spreads = spreads_config.registry
     if request.spread_type not in spreads:
         raise HTTPException(
             status_code=400, detail=f"Unknown spread type: {request.spread_type}"
         )
 
-    spread_class = spreads[request.spread_type]
-    spread = spread_class()
-
-    # Load position names from spreads config
-    try:
-        with open("config/spreads-config.json", "r") as f:
-            config = json.load(f)
-
-        # Find the spread configuration
-        spread_config = None
-        for s in config["spreads"]:
-            if s["id"] == request.spread_type:
-                spread_config = s
-                break
-
-        if spread_config:
-            # Override position names with the ones from config
-            custom_positions = [pos["name"] for pos in spread_config["positions"]]
-        else:
-            custom_positions = None
-    except Exception as e:
-        print(f"Error loading spread config: {e}")
-        custom_positions = None
+    spread = spreads.get(request.spread_type)
 
     # Perform the reading
     reading = reader.perform_reading(
@@ -409,30 +646,12 @@ def create_reading(request: ReadingRequest):
     cards_info = []
 
     for index, drawn_card in enumerate(reading.cards):
-        # Find the image filename for this card
-        card_filename = None
-        print(f"Looking for card: '{drawn_card.card.name}'")
-        for card_entry in card_data["cards"]:
-            if card_entry["name"] == drawn_card.card.name:
-                card_filename = card_entry["img"]
-                print(f"Found match: {card_filename}")
-                break
-        if not card_filename:
-            print(f"No match found for: '{drawn_card.card.name}'")
-
-        # Use custom position name if available, otherwise use default
-        position_name = drawn_card.position or "Unknown"
-        if custom_positions and index < len(custom_positions):
-            position_name = custom_positions[index]
-
         # Create the Card info
         card_info = CardInfo(
             name=drawn_card.card.name,
-            position=position_name,
+            position=spread.position_names[index],
             reversed=drawn_card.reversed,
-            image_url=f"/static/cards_wikipedia/{card_filename}"
-            if card_filename
-            else "",
+            image_url=card_catalog.image_url(drawn_card.card.name),
         )
 
         cards_info.append(card_info)
@@ -455,25 +674,19 @@ def create_reading(request: ReadingRequest):
                 tone=ReadingTone.WARM,
             )
 
-            # Generate the reading with context and prompts
-            generated_reading = reading_generator.generate_reading_prompt(gen_request)
+            # Generate the reading with context and prompts; this counts
+            # tokens, so keep it off the event loop
+            generated_reading = await run_in_threadpool(
+                reading_generator.generate_reading_prompt, gen_request
+            )
 
-            # Prepare full prompt data
-            full_prompt = {
-                "system_prompt": generated_reading.system_prompt,
-                "user_prompt": generated_reading.user_prompt,
-                "combined_prompt": f"{generated_reading.system_prompt}\n\nUser: {generated_reading.user_prompt}\n\nAssistant:",
-                "metadata": {
-                    "question_type": generated_reading.question_type.value,
-                    "question_confidence": generated_reading.question_confidence,
-                    "style": generated_reading.style.value,
-                    "tone": generated_reading.tone.value,
-                    "context_tokens": generated_reading.context_tokens,
-                    "prompt_tokens": generated_reading.prompt_tokens,
-                    "total_tokens": generated_reading.total_tokens,
-                    "completeness": generated_reading.completeness,
-                },
-            }
+            # Prepare prompt data in the requested view (slim responses
+            # carry it only with include_prompt)
+            full_prompt = (
+                prompt_dict(generated_reading, view)
+                if wants_prompt(view, include_prompt)
+                else None
+            )
 
             # Attempt MLX inference
             ai_response = None
@@ -486,17 +699,26 @@ def create_reading(request: ReadingRequest):
                     stop_sequences=["That concludes the reading.", "###END###", "~~~"],
                 )
 
-                response = model_service.generate_text(inference_request)
-                ai_response = {
-                    "text": response.text,
-                    "tokens_generated": response.tokens_generated,
-                    "inference_time": response.inference_time,
-                    "model_id": response.model_id,
-                    "timestamp": response.timestamp,
-                }
-
-                # Use AI response as interpretation
-                interpretation = response.text
+                # Generation runs on the inference queue's worker, in order
+                job = inference_queue.submit(inference_request)
+                if wait_for_ai:
+                    await wait_for_job(job)
+                    if job.error:
+                        raise RuntimeError(job.error)
+                    response = job.response
+                    ai_response = {
+                        "text": response.text,
+                        "tokens_generated": response.tokens_generated,
+                        "inference_time": response.inference_time,
+                        "model_id": response.model_id,
+                        "timestamp": response.timestamp,
+                    }
+
+                    # Use AI response as interpretation
+                    interpretation = response.text
+                else:
+                    # The client polls /api/inference/jobs/{job_id} for the text
+                    ai_response = {"job_id": job.id, "status": job.status.value}
 
             except Exception as e:
                 print(f"MLX inference failed: {e}")
@@ -521,7 +743,7 @@ To see the full AI-generated reading, this would be processed by the MLX tarot m
             interpretation = "Interpretation generation is currently unavailable. Please try again later."
 
     # Convert to response format
-    return ReadingResponse(
+    response = ReadingResponse(
         question=reading.question,
         spread_name=reading.spread.name,
         cards=cards_info,
@@ -532,6 +754,7 @@ To see the full AI-generated reading, this would be processed by the MLX tarot m
         full_prompt=full_prompt if "full_prompt" in locals() else None,
         ai_response=ai_response if "ai_response" in locals() else None,
     )
+    return reading_response(response, view)
 
 
 # Practice System Endpoints
@@ -651,81 +874,33 @@ def get_practice_session(session_id: str):
 
 
 @app.get("/api/dev/training-readings")
-def get_training_readings():
-    """Get all training readings from both common and special datasets"""
-    try:
-        readings = []
-        interpretations_dir = "/Users/katelouie/code/arcanum/llm/tuning_data/readings"
-        interpretations_metadata_dir = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/interpretations"
-        )
-
-        # Get list of existing interpretation files and their status
-        existing_interpretations = set()
-        interpretation_status = {}
-
-        if os.path.exists(interpretations_dir):
-            for filename in os.listdir(interpretations_dir):
-                if filename.endswith(".md") and filename.startswith("reading_"):
-                    # Extract reading ID (e.g., "reading_001.md" -> "R001")
-                    reading_num = filename.replace("reading_", "").replace(".md", "")
-                    reading_id = f"R{reading_num.zfill(3)}"
-                    existing_interpretations.add(reading_id)
-
-        # Load status from interpretation metadata files
-        if os.path.exists(interpretations_metadata_dir):
-            for filename in os.listdir(interpretations_metadata_dir):
-                if filename.endswith(".json") and filename.startswith("R"):
-                    reading_id = filename.replace(".json", "")
-                    try:
-                        interpretation_file = os.path.join(
-                            interpretations_metadata_dir, filename
-                        )
-                        with open(interpretation_file, "r") as f:
-                            metadata = json.load(f)
-                            interpretation_status[reading_id] = metadata.get(
-                                "status", "not_started"
-                            )
-                    except:
-                        interpretation_status[reading_id] = "not_started"
-
-        # Load unified readings file
-        all_readings_path = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/readings/all_readings.json"
-        )
-        try:
-            with open(all_readings_path, "r") as f:
-                all_data = json.load(f)
-                for reading in all_data["tarot_reading_dataset"]["readings"]:
-                    # Source is already set from migration, but ensure it exists
-                    if "source" not in reading:
-                        reading["source"] = (
-                            "special" if reading.get("spread_config") else "common"
-                        )
-                    reading["has_interpretation"] = (
-                        reading["reading_id"] in existing_interpretations
-                    )
-
-                    # Add status from interpretation metadata, default to not_started
-                    reading_id = reading["reading_id"]
-                    if reading_id in interpretation_status:
-                        reading["status"] = interpretation_status[reading_id]
-                    else:
-                        reading["status"] = "not_started"
-
-                    readings.append(reading)
-        except FileNotFoundError:
-            print(f"Unified readings file not found: {all_readings_path}")
-            # Fallback to old files if unified doesn't exist yet
-            return _load_legacy_readings_files(existing_interpretations)
+def get_training_readings(
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = TRAINING_PAGE_SIZE,
+    cursor: Optional[int] = None,
+):
+    """Get training readings from both common and special datasets
 
+    Filter by status (not_started, draft, completed), source (common,
+    special) or category. One page of at most limit readings (default 100,
+    up to 500) is returned; pass next_cursor as cursor to get the next one.
+    next_cursor is null on the last page.
+    """
+    try:
+        page = training_store.list(status, source, category, limit, cursor)
+        by_source = training_store.counts_by("source")
         return {
-            "readings": readings,
-            "total_count": len(readings),
-            "common_count": len([r for r in readings if r["source"] == "common"]),
-            "special_count": len([r for r in readings if r["source"] == "special"]),
+            "readings": page.readings,
+            "total_count": page.total,
+            "next_cursor": page.next_cursor,
+            "common_count": by_source.get("common", 0),
+            "special_count": by_source.get("special", 0),
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error loading training readings: {str(e)}"
@@ -736,79 +911,24 @@ def get_training_readings():
 def get_training_reading(reading_id: str):
     """Get a specific training reading by ID"""
     try:
-        # Load from unified readings file
-        all_readings_path = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/readings/all_readings.json"
-        )
-        try:
-            with open(all_readings_path, "r") as f:
-                all_data = json.load(f)
-                for reading in all_data["tarot_reading_dataset"]["readings"]:
-                    if reading["reading_id"] == reading_id:
-                        # Ensure source is set
-                        if "source" not in reading:
-                            reading["source"] = (
-                                "special" if reading.get("spread_config") else "common"
-                            )
-                        reading["has_interpretation"] = False
-                        return reading
-        except FileNotFoundError:
-            print(f"Unified readings file not found: {all_readings_path}")
-            # Fallback to legacy loading if needed
-            pass
-
-        raise HTTPException(status_code=404, detail="Reading not found")
-
-    except HTTPException:
-        raise
+        reading = training_store.get(reading_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading reading: {str(e)}")
+    if reading is None:
+        raise HTTPException(status_code=404, detail="Reading not found")
+    return reading
 
 
 @app.post("/api/dev/training-readings/{reading_id}/interpretation")
 def save_reading_interpretation(reading_id: str, interpretation_data: Dict):
     """Save an interpretation for a training reading"""
     try:
-        interpretation = interpretation_data.get("interpretation", "")
-        notes = interpretation_data.get("notes", "")
-        status = interpretation_data.get("status", "draft")
-
-        # Save as markdown file in readings directory (your preferred format)
-        readings_dir = "/Users/katelouie/code/arcanum/llm/tuning_data/readings"
-        os.makedirs(readings_dir, exist_ok=True)
-
-        reading_num = reading_id.replace("R", "").lstrip("0")  # R001 -> 1
-        md_file = os.path.join(readings_dir, f"reading_{reading_num.zfill(3)}.md")
-
-        with open(md_file, "w") as f:
-            f.write(interpretation)
-
-        # Also create backup in interpretations directory
-        interpretations_dir = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/interpretations"
+        md_file = training_store.save_interpretation(
+            reading_id,
+            interpretation_data.get("interpretation", ""),
+            interpretation_data.get("notes", ""),
+            interpretation_data.get("status", "draft"),
         )
-        os.makedirs(interpretations_dir, exist_ok=True)
-
-        interpretation_entry = {
-            "reading_id": reading_id,
-            "interpretation": interpretation,
-            "notes": notes,
-            "status": status,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "markdown_file": md_file,
-        }
-
-        # Save metadata to JSON file
-        json_file = os.path.join(interpretations_dir, f"{reading_id}.json")
-        with open(json_file, "w") as f:
-            json.dump(interpretation_entry, f, indent=2)
-
-        # Also append to master interpretations file for backup
-        master_file = os.path.join(interpretations_dir, "all_interpretations.jsonl")
-        with open(master_file, "a") as f:
-            f.write(json.dumps(interpretation_entry) + "\n")
-
         return {
             "message": "Interpretation saved successfully",
             "reading_id": reading_id,
@@ -825,53 +945,15 @@ def save_reading_interpretation(reading_id: str, interpretation_data: Dict):
 def get_reading_interpretation(reading_id: str):
     """Get existing interpretation for a training reading"""
     try:
-        # Check for existing markdown file first
-        readings_dir = "/Users/katelouie/code/arcanum/llm/tuning_data/readings"
-        reading_num = reading_id.replace("R", "").lstrip("0")  # R001 -> 1
-        md_file = os.path.join(readings_dir, f"reading_{reading_num.zfill(3)}.md")
-
-        if os.path.exists(md_file):
-            with open(md_file, "r") as f:
-                content = f.read()
-
-                # Check for existing JSON metadata to get the real status
-                interpretations_dir = (
-                    "/Users/katelouie/code/arcanum/llm/tuning_data/interpretations"
-                )
-                interpretation_file = os.path.join(
-                    interpretations_dir, f"{reading_id}.json"
-                )
-                actual_status = "not_started"  # Default status
-
-                if os.path.exists(interpretation_file):
-                    with open(interpretation_file, "r") as json_f:
-                        metadata = json.load(json_f)
-                        actual_status = metadata.get("status", "not_started")
-
-                return {
-                    "reading_id": reading_id,
-                    "interpretation": content,
-                    "notes": f"Loaded from {os.path.basename(md_file)}",
-                    "status": actual_status,
-                    "source_file": md_file,
-                }
-
-        # Fall back to JSON interpretation files
-        interpretations_dir = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/interpretations"
-        )
-        interpretation_file = os.path.join(interpretations_dir, f"{reading_id}.json")
-
-        if os.path.exists(interpretation_file):
-            with open(interpretation_file, "r") as f:
-                return json.load(f)
-        else:
+        interpretation = training_store.get_interpretation(reading_id)
+        if interpretation is None:
             return {
                 "reading_id": reading_id,
                 "interpretation": "",
                 "notes": "",
                 "status": "not_started",
             }
+        return interpretation
 
     except Exception as e:
         raise HTTPException(
@@ -882,130 +964,64 @@ def get_reading_interpretation(reading_id: str):
 @app.patch("/api/dev/training-readings/{reading_id}/status")
 def update_reading_status(reading_id: str, status_data: Dict):
     """Update the status of a training reading"""
+    new_status = status_data.get("status")
     try:
-        new_status = status_data.get("status")
-        if new_status not in ["not_started", "draft", "completed"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid status. Must be one of: not_started, draft, completed",
-            )
-
-        interpretations_dir = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/interpretations"
-        )
-        interpretation_file = os.path.join(interpretations_dir, f"{reading_id}.json")
-
-        # Check if interpretation file exists
-        if os.path.exists(interpretation_file):
-            # Load existing interpretation data
-            with open(interpretation_file, "r") as f:
-                interpretation_entry = json.load(f)
-
-            # Update status and timestamp
-            interpretation_entry["status"] = new_status
-            interpretation_entry["updated_at"] = datetime.now().isoformat()
-
-            # Save updated data
-            with open(interpretation_file, "w") as f:
-                json.dump(interpretation_entry, f, indent=2)
-
-            return {
-                "message": f"Status updated to {new_status}",
-                "reading_id": reading_id,
-                "status": new_status,
-            }
-        else:
-            # Create new interpretation entry with just status
-            os.makedirs(interpretations_dir, exist_ok=True)
-            interpretation_entry = {
-                "reading_id": reading_id,
-                "interpretation": "",
-                "notes": "",
-                "status": new_status,
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-            }
-
-            with open(interpretation_file, "w") as f:
-                json.dump(interpretation_entry, f, indent=2)
-
-            return {
-                "message": f"Status set to {new_status}",
-                "reading_id": reading_id,
-                "status": new_status,
-            }
-
+        existed = training_store.set_status(reading_id, new_status)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating status: {str(e)}")
 
+    return {
+        "message": f"Status {'updated' if existed else 'set'} to {new_status}",
+        "reading_id": reading_id,
+        "status": new_status,
+    }
+
 
 @app.get("/api/dev/interpretation-progress")
 def get_interpretation_progress():
-    """Get progress statistics for interpretation writing"""
+    """Get progress statistics for interpretation writing, by reading status"""
     try:
-        readings_dir = "/Users/katelouie/code/arcanum/llm/tuning_data/readings"
+        return training_store.progress()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting progress: {str(e)}")
 
-        # Get total readings count from unified file
-        total_readings = 0
-        all_readings_path = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/readings/all_readings.json"
-        )
-        try:
-            with open(all_readings_path, "r") as f:
-                all_data = json.load(f)
-                total_readings = len(all_data["tarot_reading_dataset"]["readings"])
-        except FileNotFoundError:
-            print(f"Unified readings file not found: {all_readings_path}")
-            # Fallback to old calculation if unified file doesn't exist
-            total_readings = 0
-
-        # Count existing markdown interpretations
-        completed_count = 0
-        if os.path.exists(readings_dir):
-            for filename in os.listdir(readings_dir):
-                if filename.endswith(".md") and filename.startswith("reading_"):
-                    completed_count += 1
-
-        # For now, assume non-completed readings are "not started"
-        # Could enhance this by checking JSON metadata files for draft status
-        draft_count = 0
-        not_started_count = total_readings - completed_count - draft_count
 
-        return {
-            "total_readings": total_readings,
-            "completed": completed_count,
-            "draft": draft_count,
-            "not_started": not_started_count,
-            "completion_percentage": (completed_count / total_readings * 100)
-            if total_readings > 0
-            else 0,
-        }
+@app.post("/api/dev/training-store/import")
+def import_training_data():
+    """Rebuild the training data index from the files"""
+    try:
+        return {"readings": training_store.import_files()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error importing training data: {str(e)}")
+
+
+@app.post("/api/dev/training-store/export")
+def export_training_data(export_data: Dict):
+    """Write the training data, in the same layout, to a directory under
+    the training data's exports/ directory
 
+    name (or the older field, directory) is the export's directory name; a
+    path that would leave exports/ is rejected.
+    """
+    name = export_data.get("name") or export_data.get("directory")
+    if not name:
+        raise HTTPException(status_code=400, detail="Missing required field: name")
+    try:
+        directory = training_store.export_path(str(name))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        return {"readings": training_store.export_files(directory), "directory": directory}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting progress: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error exporting training data: {str(e)}")
 
 
 @app.post("/api/dev/training-readings")
 def create_training_reading(reading_data: Dict):
     """Create a new training reading and add it to the dataset"""
     try:
-        # Load current readings
-        all_readings_path = (
-            "/Users/katelouie/code/arcanum/llm/tuning_data/readings/all_readings.json"
-        )
-        with open(all_readings_path, "r") as f:
-            data = json.load(f)
-
-        # Generate new reading ID
-        existing_ids = {
-            reading["reading_id"]
-            for reading in data["tarot_reading_dataset"]["readings"]
-        }
-        next_id_num = 1
-        while f"R{next_id_num:03d}" in existing_ids:
-            next_id_num += 1
-        new_reading_id = f"R{next_id_num:03d}"
-
         # Validate required fields
         required_fields = ["question", "question_category", "spread_id", "cards"]
         for field in required_fields:
@@ -1034,9 +1050,8 @@ def create_training_reading(reading_data: Dict):
             if "position_index" not in card:
                 card["position_index"] = i
 
-        # Create new reading object
+        # Create new reading object; the store gives it the next reading ID
         new_reading = {
-            "reading_id": new_reading_id,
             "spread_id": reading_data["spread_id"],
             "spread_name": reading_data.get("spread_name", "Custom Spread"),
             "question_category": reading_data["question_category"],
@@ -1048,21 +1063,22 @@ def create_training_reading(reading_data: Dict):
             "source": "special" if reading_data.get("spread_config") else "common",
         }
 
-        # Add to dataset
-        data["tarot_reading_dataset"]["readings"].append(new_reading)
+        # Placeholder interpretation file
+        def placeholder_content(new_reading_id: str) -> str:
+            return f"""# Reading {new_reading_id}: {reading_data["question_category"]}
 
-        # Update metadata
-        data["tarot_reading_dataset"]["metadata"]["total_readings"] = len(
-            data["tarot_reading_dataset"]["readings"]
-        )
-        if new_reading["source"] == "common":
-            data["tarot_reading_dataset"]["metadata"]["common_readings"] += 1
-        else:
-            data["tarot_reading_dataset"]["metadata"]["special_readings"] += 1
+**Question:** {reading_data["question"]}
+
+**Cards:**
+{chr(10).join(f"- {card['position_name']}: {card['card_name']} ({card['orientation']})" for card in cards)}
+
+---
 
-        # Save updated file
-        with open(all_readings_path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+*Write your interpretation here...*
+"""
+
+        # Add to the dataset file and the index
+        new_reading_id = training_store.add_reading(new_reading, placeholder=placeholder_content)
 
         # Generate context string for new reading
         try:
@@ -1070,9 +1086,7 @@ def create_training_reading(reading_data: Dict):
 
             # Use the existing context builder directly (simpler and more reliable)
             cards_json_path = "/Users/katelouie/code/arcanum/llm/rag/data_generation/generated_cards/all_cards.json"
-            spreads_config_path = (
-                "/Users/katelouie/code/arcanum/backend/config/spreads-config.json"
-            )
+            spreads_config_path = spreads_config.config_path
 
             context_builder = ContextStringBuilder(
                 cards_json_path=cards_json_path,
@@ -1177,32 +1191,6 @@ def create_training_reading(reading_data: Dict):
 
             traceback.print_exc()
 
-        # Create placeholder interpretation file
-        try:
-            readings_dir = "/Users/katelouie/code/arcanum/llm/tuning_data/readings"
-            reading_num = new_reading_id.replace("R", "").lstrip("0")
-            md_file = os.path.join(readings_dir, f"reading_{reading_num.zfill(3)}.md")
-
-            placeholder_content = f"""# Reading {new_reading_id}: {reading_data["question_category"]}
-
-**Question:** {reading_data["question"]}
-
-**Cards:**
-{chr(10).join(f"- {card['position_name']}: {card['card_name']} ({card['orientation']})" for card in cards)}
-
----
-
-*Write your interpretation here...*
-"""
-
-            with open(md_file, "w") as f:
-                f.write(placeholder_content)
-
-        except Exception as e:
-            print(
-                f"Warning: Failed to create placeholder interpretation for {new_reading_id}: {e}"
-            )
-
         return {
             "message": "Reading created successfully",
             "reading_id": new_reading_id,
@@ -1218,16 +1206,7 @@ def create_training_reading(reading_data: Dict):
 @app.get("/api/dev/spreads")
 def get_spreads():
     """Get available spreads configuration"""
-    try:
-        spreads_config_path = (
-            "/Users/katelouie/code/arcanum/backend/config/spreads-config.json"
-        )
-        with open(spreads_config_path, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"spreads": []}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error loading spreads: {str(e)}")
+    return spreads_config.data
 
 
 @app.get("/api/dev/training-readings/{reading_id}/context")
@@ -1265,8 +1244,98 @@ def get_reading_context_string(reading_id: str):
         )
 
 
-# Initialize model service
-model_service = get_model_service()
+# Generations are queued and run one at a time by a dedicated worker
+inference_queue = get_inference_queue(model_service)
+
+
+def collect_service_metrics():
+    """Values read from the services when /metrics is scraped"""
+    queue_metrics = inference_queue.metrics()
+    # Scrapes during startup shouldn't wait for components still being built
+    current_model = (
+        model_service.get_current_model_info() if services.is_ready("model_service") else None
+    )
+    yield (
+        "arcanum_inference_queue_depth",
+        "gauge",
+        "Jobs waiting for the inference worker",
+        [("", {}, queue_metrics["queue_depth"])],
+    )
+    yield (
+        "arcanum_inference_running",
+        "gauge",
+        "Whether the inference worker is running a job",
+        [("", {}, 1 if queue_metrics["running"] else 0)],
+    )
+    yield (
+        "arcanum_model_loaded",
+        "gauge",
+        "Currently loaded model",
+        [("", {"model": current_model.id}, 1)] if current_model else [],
+    )
+    yield (
+        "arcanum_spreads_config_version",
+        "gauge",
+        "Times the spreads config has been loaded",
+        [("", {}, spreads_config.snapshot().version)]
+        if services.is_ready("spreads_config")
+        else [],
+    )
+    yield (
+        "arcanum_startup_component_seconds",
+        "gauge",
+        "Time spent building each component at startup",
+        [
+            ("", {"component": name, "status": component["status"]}, component["seconds"])
+            for name, component in services.report()["components"].items()
+            if component["seconds"] is not None
+        ],
+    )
+    yield from cache_families(
+        {
+            "readings": reader.cache.stats,
+            "static_payloads": static_payloads.stats,
+            "prompts": prompt_store.stats,
+            "enhanced_card_payloads": lambda: enhanced_cards.index().stats()
+            if services.is_ready("enhanced_cards")
+            else None,
+        }
+    )
+
+
+REGISTRY.add_collector(collect_service_metrics)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """Prometheus text-format metrics for this process"""
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+async def wait_for_job(job: InferenceJob, timeout: Optional[float] = None) -> bool:
+    """Wait for a job without holding a threadpool worker; False on timeout"""
+    loop = asyncio.get_running_loop()
+    finished = loop.create_future()
+
+    def on_done(_job: InferenceJob) -> None:
+        loop.call_soon_threadsafe(
+            lambda: finished.done() or finished.set_result(True)
+        )
+
+    inference_queue.add_done_callback(job, on_done)
+    try:
+        await asyncio.wait_for(finished, timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+def job_status(job: InferenceJob) -> Dict:
+    status = job.to_dict()
+    status["queue_position"] = inference_queue.position(job)
+    return status
 
 
 # MLX Model Management Endpoints
@@ -1326,168 +1395,185 @@ def unload_current_model():
         raise HTTPException(status_code=500, detail=f"Error unloading model: {str(e)}")
 
 
-def clean_reading_text(text: str) -> str:
-    """Extract the actual reading from model output, removing thinking/preprocessing"""
-    import re
-
-    # Handle new format with "# Reading" start marker and "That concludes the reading.###END###" end marker
-    reading_start_marker = "# Reading"
-    reading_end_marker = "That concludes the reading.###END###"
-    reading_end_marker_alt = "That concludes the reading."
-
-    # Check if text contains the new format markers
-    if reading_start_marker in text:
-        # Split on "# Reading" - everything before is "thinking"
-        parts = text.split(reading_start_marker, 1)
-        if len(parts) > 1:
-            # Take everything from "# Reading" onwards
-            text = reading_start_marker + parts[1]
-
-            # If there's an end marker, trim everything after it (including the marker itself)
-            if reading_end_marker in text:
-                text = text.split(reading_end_marker)[0].strip()
-            elif reading_end_marker_alt in text:
-                text = text.split(reading_end_marker_alt)[0].strip()
-
-            return text.strip()
-
-    # Handle Qwen3 specific thinking pattern: (thinking) ... </think> ... actual response
-    # The thinking section starts with "(thinking)" and ends with line breaks after </think> token
-    if text.startswith("(thinking)"):
-        # Look for the end of thinking section - typically after multiple line breaks
-        # The actual response usually starts after 2+ consecutive newlines
-        lines = text.split("\n")
-
-        # Find where the actual reading starts (after thinking section)
-        reading_start = 0
-        found_thinking_end = False
-
-        for i, line in enumerate(lines):
-            # Skip the thinking section
-            if not found_thinking_end:
-                # Look for transition from thinking to response
-                # Usually indicated by empty lines followed by content
-                if line.strip() == "" and i > 0:
-                    # Check if next few lines have actual content (not just empty)
-                    next_content_lines = 0
-                    for j in range(i + 1, min(i + 4, len(lines))):
-                        if j < len(lines) and lines[j].strip():
-                            next_content_lines += 1
-
-                    # If we have substantial content after empty lines, this is likely the start
-                    if next_content_lines >= 1:
-                        reading_start = i + 1
-                        found_thinking_end = True
-                        break
-
-        # Extract everything from the reading start
-        if found_thinking_end and reading_start < len(lines):
-            text = "\n".join(lines[reading_start:]).strip()
-        else:
-            # Fallback: remove everything before first substantial paragraph
-            # Look for first line that doesn't start with "(thinking)" or seem like thinking
-            for i, line in enumerate(lines):
-                if (
-                    line.strip()
-                    and not line.startswith("(thinking)")
-                    and not line.strip().startswith("I need to")
-                    and not line.strip().startswith("Let me")
-                    and len(line.strip()) > 20
-                ):  # Substantial content
-                    text = "\n".join(lines[i:]).strip()
-                    break
-
-    # Remove everything after [[END OF READING]] marker if present
-    end_marker = "[[END OF READING]]"
-    if end_marker in text:
-        text = text.split(end_marker)[0].strip()
-
-    # Clean up any remaining thinking artifacts
-    thinking_patterns = [
-        r"<thinking>.*?</thinking>",
-        r"\*\*Thinking:\*\*.*?(?=\*\*(?:Response|Reading|Answer):\*\*)",
-        r"Let me think.*?(?=\n\n[A-Z])",
-    ]
+class MLXInferenceRequest(BaseModel):
+    # Either a prompt_id from /api/reading/cards or both prompts (DevMode)
+    prompt_id: Optional[str] = None
+    system_prompt: Optional[str] = None
+    user_prompt: Optional[str] = None
+    max_tokens: int = 2000
+    temperature: float = 0.7
+    top_p: float = 0.9
 
-    for pattern in thinking_patterns:
-        text = re.sub(pattern, "", text, flags=re.DOTALL | re.IGNORECASE)
 
-    # Look for common response markers and extract everything after them
-    response_markers = [
-        r"\*\*Response:\*\*\s*",
-        r"\*\*Reading:\*\*\s*",
-        r"\*\*Answer:\*\*\s*",
-        r"Here is your tarot reading:\s*",
-        r"Your reading:\s*",
-    ]
+def mlx_inference_request(request: MLXInferenceRequest) -> InferenceRequest:
+    """The generation to run, with the stored prompts for a prompt_id"""
+    if request.prompt_id:
+        stored = prompt_store.get(request.prompt_id)
+        if stored is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Prompt not found or expired: {request.prompt_id}",
+            )
+        system_prompt, user_prompt = stored.system_prompt, stored.user_prompt
+    elif request.system_prompt is not None and request.user_prompt is not None:
+        system_prompt, user_prompt = request.system_prompt, request.user_prompt
+    else:
+        raise HTTPException(
+            status_code=422,
+            detail="Send prompt_id, or both system_prompt and user_prompt",
+        )
+    return InferenceRequest(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        max_tokens=request.max_tokens,
+        temperature=request.temperature,
+        top_p=request.top_p,
+    )
 
-    for marker in response_markers:
-        match = re.search(marker, text, re.IGNORECASE)
-        if match:
-            text = text[match.end() :].strip()
-            break
 
-    return text.strip()
+def interpretation_result(response) -> Dict:
+    """AI interpretation response, with the text cleaned up"""
+    return {
+        # Clean the response text to remove anything after [[END OF READING]]
+        "text": clean_reading_text(response.text),
+        "raw_text": response.text,  # Include the original unmodified text
+        "tokens_generated": response.tokens_generated,
+        "inference_time": response.inference_time,
+        "model_id": response.model_id,
+        "timestamp": response.timestamp,
+    }
 
 
-class MLXInferenceRequest(BaseModel):
-    system_prompt: str
-    user_prompt: str
-    max_tokens: int = 2000
-    temperature: float = 0.7
-    top_p: float = 0.9
+def inference_result(response) -> Dict:
+    return {
+        "text": response.text,
+        "tokens_generated": response.tokens_generated,
+        "inference_time": response.inference_time,
+        "model_id": response.model_id,
+        "timestamp": response.timestamp,
+    }
 
 
 @app.post("/api/reading/ai-interpretation")
-def generate_ai_interpretation(request: MLXInferenceRequest):
+async def generate_ai_interpretation(request: MLXInferenceRequest):
     """Generate AI interpretation for an existing reading using MLX model"""
+    inference_request = mlx_inference_request(request)
     try:
-        inference_request = InferenceRequest(
-            system_prompt=request.system_prompt,
-            user_prompt=request.user_prompt,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-            top_p=request.top_p,
-        )
+        job = inference_queue.submit(inference_request, interpretation_result)
+        await wait_for_job(job)
+        if job.error:
+            raise RuntimeError(job.error)
+        return job.result()
 
-        response = model_service.generate_text(inference_request)
+    except Exception as e:
+        return {"error": f"AI interpretation failed: {str(e)}"}
 
-        # Clean the response text to remove anything after [[END OF READING]]
-        cleaned_text = clean_reading_text(response.text)
 
-        return {
-            "text": cleaned_text,
-            "raw_text": response.text,  # Include the original unmodified text
-            "tokens_generated": response.tokens_generated,
-            "inference_time": response.inference_time,
-            "model_id": response.model_id,
-            "timestamp": response.timestamp,
-        }
+def sse_event(event: str, data: Dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
-    except Exception as e:
-        return {"error": f"AI interpretation failed: {str(e)}"}
+
+@app.post("/api/reading/ai-interpretation/stream")
+async def stream_ai_interpretation(request: MLXInferenceRequest, http_request: Request):
+    """Stream an AI interpretation as server-sent events
+
+    Events: "queued" (job id and queue position), "token" (cleaned text as it
+    is generated), then "done" (the full cleaned text and stats) or "error".
+    Generation stops at the reading's end marker or when the client leaves.
+    """
+    inference_request = mlx_inference_request(request)
+
+    loop = asyncio.get_running_loop()
+    pieces: asyncio.Queue = asyncio.Queue()
+
+    def on_token(text: str) -> None:
+        loop.call_soon_threadsafe(pieces.put_nowait, text)
+
+    job = inference_queue.submit(inference_request, interpretation_result, on_token)
+    inference_queue.add_done_callback(
+        job, lambda _job: loop.call_soon_threadsafe(pieces.put_nowait, None)
+    )
+
+    async def events():
+        cleaner = ReadingTextStream()
+        try:
+            yield sse_event(
+                "queued",
+                {"job_id": job.id, "queue_position": inference_queue.position(job)},
+            )
+            while (text := await pieces.get()) is not None:
+                if await http_request.is_disconnected():
+                    break
+                cleaned = cleaner.feed(text)
+                if cleaned:
+                    yield sse_event("token", {"text": cleaned})
+                if cleaner.finished:
+                    # End marker seen: nothing more to send, stop the model
+                    job.cancel()
+
+            if job.finished:
+                tail = cleaner.finish()
+                if tail:
+                    yield sse_event("token", {"text": tail})
+                if job.error:
+                    yield sse_event("error", {"error": f"AI interpretation failed: {job.error}"})
+                else:
+                    result = job.result() or {}
+                    result["text"] = cleaner.text
+                    yield sse_event("done", result)
+        finally:
+            if not job.finished:
+                job.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/reading/ai-interpretation/jobs", status_code=202)
+def submit_ai_interpretation(request: MLXInferenceRequest):
+    """Queue an AI interpretation and return its job id right away"""
+    inference_request = mlx_inference_request(request)
+    return job_status(inference_queue.submit(inference_request, interpretation_result))
+
+
+@app.get("/api/inference/jobs/{job_id}")
+def get_inference_job(job_id: str):
+    """Poll a queued generation"""
+    job = inference_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job_status(job)
+
+
+@app.get("/api/inference/jobs/{job_id}/wait")
+async def wait_for_inference_job(job_id: str, timeout: float = 30.0):
+    """Long-poll a queued generation: returns when it finishes or after timeout seconds"""
+    job = inference_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    await wait_for_job(job, min(max(timeout, 0.0), 300.0))
+    return job_status(job)
+
+
+@app.get("/api/inference/metrics")
+def get_inference_metrics():
+    """Inference queue depth, wait times and run times"""
+    return inference_queue.metrics()
 
 
 @app.post("/api/inference")
-def generate_with_mlx(request: MLXInferenceRequest):
+async def generate_with_mlx(request: MLXInferenceRequest):
     """Generate text using the currently loaded MLX model"""
+    inference_request = mlx_inference_request(request)
     try:
-        inference_request = InferenceRequest(
-            system_prompt=request.system_prompt,
-            user_prompt=request.user_prompt,
-            max_tokens=request.max_tokens,
-            temperature=request.temperature,
-        )
-
-        response = model_service.generate_text(inference_request)
-
-        return {
-            "text": response.text,
-            "tokens_generated": response.tokens_generated,
-            "inference_time": response.inference_time,
-            "model_id": response.model_id,
-            "timestamp": response.timestamp,
-        }
+        job = inference_queue.submit(inference_request, inference_result)
+        await wait_for_job(job)
+        if job.error:
+            raise RuntimeError(job.error)
+        return job.result()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Inference error: {str(e)}")
 
@@ -1526,17 +1612,19 @@ def add_new_client(client_name: str, story_file: str, story_name: str, total_ses
         "last_session_date": initial_date,
         "confidence_level": client_config["default_session_settings"]["initial_confidence"]
     }
+    client_session_store.flush()
 
-# Simple in-memory store for client session data
-# Initialize with configured clients
-client_session_store = {}
+# Client session data, in the shared state store so every worker sees it.
+# Clients already in the store keep their progress across restarts.
+client_session_store = StateMapping(get_state_store(), "client_sessions")
 for client_name, config in client_config["clients"].items():
-    client_session_store[client_name] = {
+    client_session_store.setdefault(client_name, {
         "session": client_config["default_session_settings"]["initial_session"],
         "notes": config["initial_notes"],
         "last_session_date": config["initial_date"],
         "confidence_level": client_config["default_session_settings"]["initial_confidence"]
-    }
+    })
+client_session_store.flush()
 
 # Client management is now handled entirely within the unified Ink story system
 
@@ -0,0 +1,278 @@
+"""
+Batch Readings
+
+Draws many readings in one call for POST /api/readings/batch. Requests that
+share a spread, shuffle count and date setting are drawn together with
+ReadingService.perform_readings_batch (one vectorized pass when NumPy is
+installed). Every reading uses the same spreads snapshot and card catalog.
+
+Prompt building (context assembly, templating and token counting) is CPU
+bound, so large batches build prompts in worker processes, each with its
+own reading generator; small ones use the app's generator in the request
+thread. Prompts can be kept in the prompt store so results carry an id.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from arcanum import batch
+from arcanum.reading import Reading, ReadingService
+from arcanum.spreads import SpreadRegistry
+
+from services.card_catalog import CardCatalog
+
+# Same top-level modules main.py's reading generator comes from, so the
+# style and tone enums match the ones it compares against
+from prompt_engineer import ReadingStyle, ReadingTone
+from reading_generator import ReadingRequest as GenReadingRequest, TarotReadingGenerator
+from reading_views import FULL_VIEW, prompt_dict
+
+MAX_BATCH_SIZE = 10000
+# Readings per batch when prompt text goes into a single JSON body; larger
+# batches with prompts stream as NDJSON or ask for prompt ids only
+MAX_JSON_PROMPT_BATCH_SIZE = 200
+DEFAULT_PROMPT_WORKERS = min(8, os.cpu_count() or 1)
+# Readings whose prompts are built per pool.map() call, to bound memory
+PROMPT_CHUNK_SIZE = 256
+# Prompts sent to a worker process at a time
+PROMPTS_PER_TASK = 16
+# Batches with fewer prompts than this are built in the request thread
+MIN_POOL_PROMPTS = 32
+
+# (spread_id, question, cards_with_positions)
+PromptTask = Tuple[str, str, List[Tuple[str, bool, str]]]
+
+# Per-process state, set up once by _init_prompt_worker
+_worker_generator: Optional[TarotReadingGenerator] = None
+_worker_view: str = FULL_VIEW
+
+
+def build_prompt(generator, task: PromptTask, view: str) -> Optional[Dict[str, Any]]:
+    """The full_prompt block for one reading, or None if generation fails"""
+    spread_id, question, cards_with_positions = task
+    gen_request = GenReadingRequest(
+        question=question,
+        spread_id=spread_id,
+        cards_with_positions=cards_with_positions,
+        style=ReadingStyle.DEFAULT,
+        tone=ReadingTone.DEFAULT,
+    )
+    try:
+        return prompt_dict(generator.generate_reading_prompt(gen_request), view)
+    except Exception as e:
+        print(f"Failed to generate prompt: {e}")
+        return None
+
+
+def _init_prompt_worker(cards_json_path: str, spreads_config_path: str) -> None:
+    global _worker_generator
+    _worker_generator = TarotReadingGenerator(
+        cards_json_path=cards_json_path,
+        spreads_config_path=spreads_config_path,
+    )
+
+
+def _worker_prompt(view: str, task: PromptTask) -> Optional[Dict[str, Any]]:
+    return build_prompt(_worker_generator, task, view)
+
+
+class PromptPool:
+    """Worker processes that each build prompts with their own reading generator"""
+
+    def __init__(
+        self,
+        cards_json_path: str,
+        spreads_config_path: str,
+        workers: int = DEFAULT_PROMPT_WORKERS,
+    ):
+        self.cards_json_path = cards_json_path
+        self.spreads_config_path = spreads_config_path
+        self.workers = workers
+        # Spawned rather than forked: the app process runs threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_prompt_worker,
+            initargs=(cards_json_path, spreads_config_path),
+        )
+
+    def map(self, tasks: Sequence[PromptTask], view: str) -> Iterator[Optional[Dict[str, Any]]]:
+        """Prompts for the tasks, in order"""
+        chunksize = max(1, min(PROMPTS_PER_TASK, len(tasks) // self.workers))
+        return self._executor.map(
+            _worker_prompt, [view] * len(tasks), tasks, chunksize=chunksize
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_prompt_pool: Optional[PromptPool] = None
+
+
+def get_prompt_pool(cards_json_path: str, spreads_config_path: str) -> PromptPool:
+    """Prompt worker pool shared by all batch requests"""
+    global _prompt_pool
+    if _prompt_pool is None or (
+        (_prompt_pool.cards_json_path, _prompt_pool.spreads_config_path)
+        != (cards_json_path, spreads_config_path)
+    ):
+        if _prompt_pool is not None:
+            _prompt_pool.shutdown()
+        _prompt_pool = PromptPool(cards_json_path, spreads_config_path)
+    return _prompt_pool
+
+
+class BatchReadingBuilder:
+    """Draws and formats a batch of reading requests"""
+
+    def __init__(
+        self,
+        reader: ReadingService,
+        spreads: SpreadRegistry,
+        card_catalog: CardCatalog,
+        reading_generator=None,
+        view: str = FULL_VIEW,
+        prompt_pool: Optional[PromptPool] = None,
+        prompt_store=None,
+    ):
+        """
+        Args:
+            reading_generator: Builds prompts for small batches (None = no prompts)
+            prompt_pool: Builds prompts for large batches (None = use reading_generator)
+            prompt_store: Keeps prompts so results carry a prompt_id
+        """
+        self.reader = reader
+        self.spreads = spreads
+        self.card_catalog = card_catalog
+        self.reading_generator = reading_generator
+        self.view = view
+        self.prompt_pool = prompt_pool
+        self.prompt_store = prompt_store
+
+    def draw(self, requests: List[Dict[str, Any]]) -> List[Tuple[Optional[Reading], Optional[str]]]:
+        """
+        Draw every request, returning (reading, error) in request order
+
+        Each request has question, spread_type, shuffle_count, include_date
+        and optionally rhythm. A bad request gets an error instead of a
+        reading; the rest of the batch still runs.
+        """
+        results: List[Tuple[Optional[Reading], Optional[str]]] = [(None, None)] * len(requests)
+        groups: Dict[Tuple[str, int, bool], List[int]] = {}
+        for index, request in enumerate(requests):
+            spread_type = request["spread_type"]
+            if spread_type not in self.spreads:
+                results[index] = (None, f"Unknown spread type: {spread_type}")
+                continue
+            key = (spread_type, int(request["shuffle_count"]), bool(request["include_date"]))
+            groups.setdefault(key, []).append(index)
+
+        for (spread_type, shuffle_count, include_date), indices in groups.items():
+            spread = self.spreads.get(spread_type)
+            questions = [requests[i]["question"] for i in indices]
+            rhythms = [requests[i].get("rhythm") for i in indices]
+
+            if batch.NUMPY_AVAILABLE:
+                drawn = self.reader.perform_readings_batch(
+                    questions,
+                    spread,
+                    shuffle_count=shuffle_count,
+                    include_date=include_date,
+                    rhythms=rhythms,
+                )
+                readings = [drawn[i] for i in range(len(drawn))]
+            else:
+                readings = [
+                    self.reader.perform_reading(
+                        question,
+                        spread,
+                        shuffle_count=shuffle_count,
+                        include_date=include_date,
+                        rhythm=rhythm,
+                    )
+                    for question, rhythm in zip(questions, rhythms)
+                ]
+
+            for index, reading in zip(indices, readings):
+                results[index] = (reading, None)
+        return results
+
+    def cards_info(self, reading: Reading) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": drawn_card.card.name,
+                "position": drawn_card.position,
+                "reversed": drawn_card.reversed,
+                "image_url": self.card_catalog.image_url(drawn_card.card.name),
+            }
+            for drawn_card in reading.cards
+        ]
+
+    def _prompts(self, tasks: List[PromptTask]) -> Iterator[Optional[Dict[str, Any]]]:
+        if self.prompt_pool is not None and len(tasks) >= MIN_POOL_PROMPTS:
+            return self.prompt_pool.map(tasks, self.view)
+        return (build_prompt(self.reading_generator, task, self.view) for task in tasks)
+
+    def build(
+        self,
+        requests: List[Dict[str, Any]],
+        include_prompt: bool = True,
+        prompt_handle: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Results for each request, in request order
+
+        Cards are drawn for the whole batch up front; prompts are built in
+        chunks, so results can be streamed. With prompt_handle (and a
+        prompt store), prompts are stored and each full_prompt has a
+        prompt_id; without include_prompt the id is all it holds.
+        """
+        results = []
+        for index, (request, (reading, error)) in enumerate(zip(requests, self.draw(requests))):
+            result: Dict[str, Any] = {"index": index}
+            if request.get("id") is not None:
+                result["id"] = request["id"]
+            if error:
+                result["error"] = error
+            else:
+                result.update(
+                    question=reading.question,
+                    spread_type=request["spread_type"],
+                    spread_name=reading.spread.name,
+                    seed=reading.seed,
+                    shuffle_count=reading.shuffle_count,
+                    timestamp=reading.timestamp.isoformat(),
+                    cards=self.cards_info(reading),
+                )
+            results.append(result)
+
+        store_prompts = prompt_handle and self.prompt_store is not None
+        if not (include_prompt or store_prompts) or self.reading_generator is None:
+            yield from results
+            return
+
+        for start in range(0, len(results), PROMPT_CHUNK_SIZE):
+            chunk = results[start : start + PROMPT_CHUNK_SIZE]
+            drawn = [result for result in chunk if "error" not in result]
+            tasks = [
+                (
+                    result["spread_type"],
+                    result["question"],
+                    [(card["name"], card["reversed"], card["position"]) for card in result["cards"]],
+                )
+                for result in drawn
+            ]
+            for result, prompt in zip(drawn, self._prompts(tasks)):
+                if prompt is not None and store_prompts:
+                    prompt_id = self.prompt_store.put(
+                        prompt["system_prompt"], prompt["user_prompt"], flush=False
+                    )
+                    prompt = prompt if include_prompt else {}
+                    prompt["prompt_id"] = prompt_id
+                result["full_prompt"] = prompt
+            if store_prompts:
+                self.prompt_store.flush()
+            yield from chunk
@@ -0,0 +1,160 @@
+"""
+Card Catalog
+
+One in-memory index of the 78 cards, built once at startup from
+tarot-images.json (image, number, suit) and the generated enhanced cards
+(all_cards.json). Cards can be looked up by canonical card id (0-77, see
+arcanum.deck.get_card_id) or by name, in any case or spacing. The parsed
+enhanced cards are kept so the enhanced card index can start from them
+instead of parsing the file again.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from arcanum.deck import STANDARD_CARDS
+from services.static_payloads import file_version
+
+SERVICES_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_IMAGES_PATH = os.path.join(SERVICES_DIR, "..", "static", "tarot-images.json")
+DEFAULT_ENHANCED_CARDS_PATH = os.path.join(
+    SERVICES_DIR, "..", "..", "llm", "rag", "data_generation", "generated_cards", "all_cards.json"
+)
+
+IMAGE_URL_PREFIX = "/static/cards_wikipedia/"
+PLACEHOLDER_IMAGE = "placeholder.jpg"
+
+
+def normalize_card_name(card_name: str) -> str:
+    """
+    Normalize a card name the way the enhanced cards are keyed
+
+    Examples:
+    - "The Fool" -> "the_fool"
+    - "ace of cups" -> "ace_of_cups"
+    """
+    return re.sub(r"[^a-z0-9]+", "_", card_name.lower()).strip("_")
+
+
+@dataclass(frozen=True)
+class CatalogCard:
+    """Everything the endpoints need to know about one card"""
+    card_id: int
+    name: str
+    number: str
+    arcana: str
+    suit: Optional[str]
+    image: str
+    enhanced_id: Optional[str]
+
+    @property
+    def image_url(self) -> str:
+        return f"{IMAGE_URL_PREFIX}{self.image}"
+
+
+class CardCatalog:
+    """Cards indexed by canonical id and by normalized name"""
+
+    def __init__(
+        self,
+        cards: Dict[int, CatalogCard],
+        enhanced_cards: Optional[Dict[str, Dict[str, Any]]] = None,
+        enhanced_cards_path: Optional[str] = None,
+        enhanced_cards_version: Optional[Tuple[int, int]] = None,
+    ):
+        # all_cards.json as it was parsed here, for EnhancedCardService
+        self.enhanced_cards = enhanced_cards
+        self.enhanced_cards_path = enhanced_cards_path
+        self.enhanced_cards_version = enhanced_cards_version
+        self._by_id: Mapping[int, CatalogCard] = MappingProxyType(dict(cards))
+        self._by_name: Mapping[str, CatalogCard] = MappingProxyType(
+            {normalize_card_name(card.name): card for card in cards.values()}
+        )
+
+    @classmethod
+    def load(
+        cls,
+        images_path: str = DEFAULT_IMAGES_PATH,
+        enhanced_cards_path: Optional[str] = DEFAULT_ENHANCED_CARDS_PATH,
+    ) -> "CardCatalog":
+        """
+        Build the catalog from tarot-images.json and, if it can be read,
+        the enhanced cards file
+
+        Cards missing from tarot-images.json get the placeholder image;
+        cards missing from the enhanced cards have no enhanced_id.
+        """
+        with open(images_path, "r", encoding="utf-8") as f:
+            images = {
+                normalize_card_name(entry["name"]): entry
+                for entry in json.load(f).get("cards", [])
+            }
+
+        enhanced = None
+        enhanced_version = None
+        enhanced_ids: Dict[str, str] = {}
+        if enhanced_cards_path:
+            try:
+                # Stat first: if the file changes mid-read the index reloads it
+                enhanced_version = file_version(enhanced_cards_path)
+                with open(enhanced_cards_path, "r", encoding="utf-8") as f:
+                    enhanced = json.load(f)
+                enhanced_ids = {
+                    normalize_card_name(entry.get("card_name", card_key)): card_key
+                    for card_key, entry in enhanced.items()
+                }
+            except (OSError, json.JSONDecodeError) as e:
+                enhanced = None
+                print(f"❌ Enhanced cards not indexed: {e}")
+
+        cards = {}
+        for card_id, card in enumerate(STANDARD_CARDS):
+            key = normalize_card_name(card.name)
+            entry = images.get(key, {})
+            arcana = f"{card.arcana_type.value.title()} Arcana"
+            cards[card_id] = CatalogCard(
+                card_id=card_id,
+                name=card.name,
+                number=str(entry.get("number", card.number)),
+                arcana=entry.get("arcana", arcana),
+                suit=entry.get("suit", card.suit),
+                image=entry.get("img", PLACEHOLDER_IMAGE),
+                enhanced_id=enhanced_ids.get(key),
+            )
+        return cls(cards, enhanced, enhanced_cards_path, enhanced_version)
+
+    def get(self, card: Union[int, str]) -> Optional[CatalogCard]:
+        """Look up a card by canonical id or by name"""
+        if isinstance(card, int):
+            return self._by_id.get(card)
+        return self._by_name.get(normalize_card_name(card))
+
+    def image_url(self, card_name: str) -> str:
+        """Image URL for a card, or the placeholder if it isn't known"""
+        card = self.get(card_name)
+        return card.image_url if card else f"{IMAGE_URL_PREFIX}{PLACEHOLDER_IMAGE}"
+
+    def __contains__(self, card: object) -> bool:
+        return isinstance(card, (int, str)) and self.get(card) is not None
+
+    def __iter__(self) -> Iterator[CatalogCard]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+# Global catalog instance
+_card_catalog_instance = None
+
+
+def get_card_catalog() -> CardCatalog:
+    """Get the global card catalog, building it on first use"""
+    global _card_catalog_instance
+    if _card_catalog_instance is None:
+        _card_catalog_instance = CardCatalog.load()
+    return _card_catalog_instance
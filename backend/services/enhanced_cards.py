@@ -0,0 +1,183 @@
+"""
+Enhanced Card Index
+
+The generated enhanced cards (all_cards.json) indexed by enhanced-card id,
+so single cards and field projections can be served without sending the
+whole file. Cards can also be looked up by canonical card id (0-77) or by
+name through the card catalog. The first index reuses the cards the catalog
+parsed at startup; after that it is rebuilt when the file changes.
+"""
+
+import json
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from services.card_catalog import DEFAULT_ENHANCED_CARDS_PATH, CardCatalog, get_card_catalog
+from services.static_payloads import StaticPayload, file_version
+
+FieldPath = Tuple[str, ...]
+
+
+def parse_fields(fields: str) -> List[FieldPath]:
+    """
+    Parse a fields= projection into dotted paths
+
+    Example: "core_meanings.upright,keywords" ->
+    [("core_meanings", "upright"), ("keywords",)]
+    """
+    paths = []
+    for field in fields.split(","):
+        field = field.strip()
+        if not field:
+            continue
+        path = tuple(field.split("."))
+        if not all(path):
+            raise ValueError(f"Invalid field: {field}")
+        paths.append(path)
+    if not paths:
+        raise ValueError("No fields given")
+    return paths
+
+
+def project(document: Mapping[str, Any], paths: Iterable[FieldPath]) -> Dict[str, Any]:
+    """
+    Copy only the given paths of a document, keeping their nesting
+
+    Paths that don't exist in the document are left out.
+    """
+    result: Dict[str, Any] = {}
+    for path in paths:
+        value: Any = document
+        for key in path:
+            if not isinstance(value, Mapping) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = result
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+    return result
+
+
+class EnhancedCardIndex:
+    """One parsed version of the enhanced cards, keyed by enhanced-card id"""
+
+    def __init__(self, cards: Dict[str, Dict[str, Any]], catalog: CardCatalog, version: Any = None):
+        self.cards: Mapping[str, Dict[str, Any]] = MappingProxyType(cards)
+        self.catalog = catalog
+        self.version = version
+        self._payloads: Dict[str, StaticPayload] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, card_id: str) -> Optional[str]:
+        """Enhanced-card id for an enhanced id, a canonical id ("0"-"77") or a name"""
+        if card_id in self.cards:
+            return card_id
+        card = self.catalog.get(int(card_id) if card_id.isdigit() else card_id)
+        if card is not None and card.enhanced_id in self.cards:
+            return card.enhanced_id
+        return None
+
+    def get(self, card_id: str, paths: Optional[List[FieldPath]] = None) -> Optional[Dict[str, Any]]:
+        """One card, optionally projected to paths"""
+        enhanced_id = self.resolve(card_id)
+        if enhanced_id is None:
+            return None
+        card = self.cards[enhanced_id]
+        return project(card, paths) if paths else card
+
+    def get_many(
+        self, card_ids: Iterable[str], paths: Optional[List[FieldPath]] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Cards keyed by the ids asked for, and the ids that weren't found"""
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for card_id in card_ids:
+            card = self.get(card_id, paths)
+            if card is None:
+                missing.append(card_id)
+            else:
+                found[card_id] = card
+        return found, missing
+
+    def payload(self, card_id: str) -> Optional[StaticPayload]:
+        """A whole card, serialized and compressed once and then reused"""
+        enhanced_id = self.resolve(card_id)
+        if enhanced_id is None:
+            return None
+        payload = self._payloads.get(enhanced_id)
+        if payload is None:
+            self.misses += 1
+            payload = StaticPayload.build(self.cards[enhanced_id], self.version)
+            self._payloads[enhanced_id] = payload
+        else:
+            self.hits += 1
+        return payload
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-card payload cache counts, since this index was built"""
+        lookups = self.hits + self.misses
+        return {
+            "payloads": len(self._payloads),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class EnhancedCardService:
+    """Shared EnhancedCardIndex that reloads itself when the file changes"""
+
+    def __init__(self, cards_path: str = DEFAULT_ENHANCED_CARDS_PATH, check_interval: float = 1.0):
+        self.cards_path = cards_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._index: Optional[EnhancedCardIndex] = None
+        self._next_check = 0.0
+
+    def _load(self, catalog: CardCatalog, version: Tuple[int, int]) -> Dict[str, Dict[str, Any]]:
+        # The catalog already parsed this version of the file at startup
+        if (
+            catalog.enhanced_cards is not None
+            and catalog.enhanced_cards_path == self.cards_path
+            and catalog.enhanced_cards_version == version
+        ):
+            return catalog.enhanced_cards
+        with open(self.cards_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def index(self) -> EnhancedCardIndex:
+        """The current index, rebuilt first if the file has changed"""
+        now = time.monotonic()
+        if self._index is not None and now < self._next_check:
+            return self._index
+
+        with self._lock:
+            self._next_check = now + self.check_interval
+            try:
+                version = file_version(self.cards_path)
+                if self._index is None or version != self._index.version:
+                    catalog = get_card_catalog()
+                    cards = self._load(catalog, version)
+                    self._index = EnhancedCardIndex(cards, catalog, version)
+            except (OSError, ValueError) as e:
+                if self._index is None:
+                    raise
+                print(f"❌ Enhanced cards not reloaded: {e}")
+            return self._index
+
+
+# Global service instance
+_enhanced_card_service_instance = None
+
+
+def get_enhanced_card_service() -> EnhancedCardService:
+    """Get the global enhanced card service instance"""
+    global _enhanced_card_service_instance
+    if _enhanced_card_service_instance is None:
+        _enhanced_card_service_instance = EnhancedCardService()
+    return _enhanced_card_service_instance
@@ -0,0 +1,327 @@
+"""
+Inference Job Queue
+
+Text generation takes seconds and the model service runs one generation at a
+time, so requests are queued instead of each holding a server thread while
+it waits for the model lock. submit() returns a job at once. One dedicated
+worker thread runs the jobs in order, and callers poll the job or register
+a callback for when it finishes. Queue depth, wait time and run time are
+tracked for the metrics endpoint.
+"""
+
+import itertools
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from metrics import REGISTRY
+from mlx_model_service import InferenceRequest, InferenceResponse, MLXModelService
+
+# Finished jobs kept for polling before the oldest are dropped
+DEFAULT_MAX_FINISHED = 1000
+# Recent jobs used for the wait and run time statistics
+TIMING_WINDOW = 200
+
+QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "arcanum_inference_queue_wait_seconds", "Time jobs spent queued before running"
+)
+JOB_RUN_SECONDS = REGISTRY.histogram(
+    "arcanum_inference_job_run_seconds", "Time jobs spent running"
+)
+JOBS_FINISHED = REGISTRY.counter(
+    "arcanum_inference_jobs", "Finished inference jobs", ["status"]
+)
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class InferenceJob:
+    """One queued generation and, once finished, its result"""
+
+    id: str
+    request: InferenceRequest
+    sequence: int
+    # Turns the model response into the job's result (e.g. cleans the text)
+    format_result: Optional[Callable[[InferenceResponse], Dict[str, Any]]] = None
+    # Streaming jobs get each generated piece of text, from the worker thread
+    on_token: Optional[Callable[[str], None]] = None
+    status: JobStatus = JobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    response: Optional[InferenceResponse] = None
+    error: Optional[str] = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+    _cancelled: threading.Event = field(default_factory=threading.Event, repr=False)
+    _callbacks: List[Callable[["InferenceJob"], None]] = field(default_factory=list, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def wait_time(self) -> Optional[float]:
+        """Seconds spent in the queue"""
+        return self.started_at - self.submitted_at if self.started_at else None
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Seconds spent generating"""
+        if self.started_at and self.finished_at:
+            return self.finished_at - self.started_at
+        return None
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        if self.response is None:
+            return None
+        if self.format_result:
+            return self.format_result(self.response)
+        return asdict(self.response)
+
+    def cancel(self) -> None:
+        """
+        Drop the job if it hasn't started; stop a running streaming job
+        early, keeping the text generated so far
+        """
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; False if the timeout ran out first"""
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status.value,
+            "submitted_at": self.submitted_at,
+            "wait_time": self.wait_time,
+            "run_time": self.run_time,
+            "result": self.result(),
+            "error": self.error,
+        }
+
+
+class InferenceQueue:
+    """FIFO queue of generation jobs drained by one worker thread"""
+
+    def __init__(self, model_service: MLXModelService, max_finished: int = DEFAULT_MAX_FINISHED):
+        self.model_service = model_service
+        self.max_finished = max_finished
+
+        self._queue: "queue.Queue[InferenceJob]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, InferenceJob]" = OrderedDict()
+        self._sequence = itertools.count(1)
+        self._started = 0  # sequence number of the latest job the worker picked up
+        self._worker: Optional[threading.Thread] = None
+
+        # Metrics
+        self._running: Optional[InferenceJob] = None
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._wait_times: Deque[float] = deque(maxlen=TIMING_WINDOW)
+        self._run_times: Deque[float] = deque(maxlen=TIMING_WINDOW)
+
+    def start(self) -> None:
+        """Start the worker thread if it isn't running"""
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._work, name="inference-worker", daemon=True
+                )
+                self._worker.start()
+
+    def submit(
+        self,
+        request: InferenceRequest,
+        format_result: Optional[Callable[[InferenceResponse], Dict[str, Any]]] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> InferenceJob:
+        """
+        Queue a generation and return its job right away
+
+        With on_token, the job streams: on_token gets each piece of text as
+        the model produces it.
+        """
+        self.start()
+        with self._lock:
+            job = InferenceJob(
+                id=uuid.uuid4().hex,
+                request=request,
+                sequence=next(self._sequence),
+                format_result=format_result,
+                on_token=on_token,
+            )
+            self._jobs[job.id] = job
+            self._submitted += 1
+            self._queue.put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[InferenceJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def position(self, job: InferenceJob) -> int:
+        """Jobs ahead of this one (0 when it is running or finished)"""
+        if job.status is not JobStatus.QUEUED:
+            return 0
+        return max(job.sequence - self._started - 1, 0)
+
+    def add_done_callback(self, job: InferenceJob, callback: Callable[[InferenceJob], None]) -> None:
+        """
+        Call callback(job) when the job finishes, from the worker thread
+
+        Runs it right away if the job has already finished.
+        """
+        with self._lock:
+            if not job.finished:
+                job._callbacks.append(callback)
+                return
+        callback(job)
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job.cancelled:
+                with self._lock:
+                    self._started = job.sequence
+                self._finish(job, JobStatus.CANCELLED, None, None)
+                self._queue.task_done()
+                continue
+
+            with self._lock:
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+                self._started = job.sequence
+                self._running = job
+                self._wait_times.append(job.wait_time)
+            QUEUE_WAIT_SECONDS.observe(job.wait_time)
+
+            try:
+                if job.on_token is None:
+                    response = self.model_service.generate_text(job.request)
+                else:
+                    response = self.model_service.generate_text_stream(
+                        job.request, lambda text: self._stream_token(job, text)
+                    )
+                error = None
+            except Exception as e:
+                response = None
+                error = str(e)
+
+            if error is None:
+                self._finish(job, JobStatus.DONE, response, None)
+            else:
+                self._finish(job, JobStatus.FAILED, None, error)
+            self._queue.task_done()
+
+    @staticmethod
+    def _stream_token(job: InferenceJob, text: str) -> bool:
+        """Pass a piece of text on; True stops generation"""
+        try:
+            job.on_token(text)
+        except Exception as e:
+            print(f"❌ Inference token callback failed: {e}")
+            job.cancel()
+        return job.cancelled
+
+    def _finish(
+        self,
+        job: InferenceJob,
+        status: JobStatus,
+        response: Optional[InferenceResponse],
+        error: Optional[str],
+    ) -> None:
+        with self._lock:
+            job.finished_at = time.time()
+            job.status = status
+            job.response = response
+            job.error = error
+            if status is JobStatus.DONE:
+                self._completed += 1
+            elif status is JobStatus.FAILED:
+                self._failed += 1
+            else:
+                self._cancelled += 1
+            if job.run_time is not None:
+                self._run_times.append(job.run_time)
+                JOB_RUN_SECONDS.observe(job.run_time)
+            JOBS_FINISHED.inc(status=status.value)
+            if self._running is job:
+                self._running = None
+            job._done.set()
+            callbacks, job._callbacks = job._callbacks, []
+            self._forget_old_jobs()
+
+        for callback in callbacks:
+            try:
+                callback(job)
+            except Exception as e:
+                print(f"❌ Inference job callback failed: {e}")
+
+    def _forget_old_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[job_id]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, throughput and timing of recent jobs"""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "running": self._running.id if self._running else None,
+                "running_for": time.time() - self._running.started_at if self._running else None,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+                "wait_time": _summary(self._wait_times),
+                "run_time": _summary(self._run_times),
+            }
+
+
+def _summary(times: Deque[float]) -> Dict[str, Optional[float]]:
+    if not times:
+        return {"count": 0, "mean": None, "p50": None, "p95": None, "max": None}
+    ordered = sorted(times)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+        "max": ordered[-1],
+    }
+
+
+# Global queue instance
+_inference_queue_instance = None
+
+
+def get_inference_queue(model_service: Optional[MLXModelService] = None) -> InferenceQueue:
+    """Get the global inference queue, for the global model service by default"""
+    global _inference_queue_instance
+    if _inference_queue_instance is None:
+        if model_service is None:
+            from mlx_model_service import get_model_service
+
+            model_service = get_model_service()
+        _inference_queue_instance = InferenceQueue(model_service)
+    return _inference_queue_instance
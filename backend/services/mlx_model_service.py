@@ -10,15 +10,43 @@ import time
 import os
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+from metrics import REGISTRY
+
+MODEL_LOAD_SECONDS = REGISTRY.histogram(
+    "arcanum_model_load_seconds", "Time to load a model", ["model"]
+)
+GENERATION_SECONDS = REGISTRY.histogram(
+    "arcanum_generation_seconds", "Time spent generating text", ["model", "mode"]
+)
+TOKENS_GENERATED = REGISTRY.counter(
+    "arcanum_tokens_generated", "Tokens generated by the model", ["model"]
+)
+TOKENS_PER_SECOND = REGISTRY.histogram(
+    "arcanum_tokens_per_second",
+    "Generation speed per request",
+    ["model"],
+    buckets=(1, 2, 5, 10, 15, 20, 30, 40, 50, 75, 100, 150, 200, 300),
+)
+
+
+def _record_generation(response: "InferenceResponse", mode: str) -> None:
+    GENERATION_SECONDS.observe(response.inference_time, model=response.model_id, mode=mode)
+    TOKENS_GENERATED.inc(response.tokens_generated, model=response.model_id)
+    if response.inference_time > 0:
+        TOKENS_PER_SECOND.observe(
+            response.tokens_generated / response.inference_time, model=response.model_id
+        )
+
+
 # Optional MLX imports with fallback for development
 try:
     import mlx.core as mx
     import mlx.nn as nn
-    from mlx_lm import load, generate
+    from mlx_lm import load, generate, stream_generate
 
     MLX_AVAILABLE = True
 except ImportError:
@@ -72,11 +100,8 @@ class MockMLXModel:
         self.model_path = model_path
         self.model_name = os.path.basename(model_path)
 
-    def generate(
-        self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7, **kwargs
-    ) -> str:
-        """Generate mock response for development"""
-        lines = [
+    def _mock_lines(self, prompt: str) -> List[str]:
+        return [
             f"**Mock Reading from {self.model_name}**\n",
             f"*Generated for prompt of {len(prompt)} characters*\n",
             "This reading draws upon the ancient wisdom of the tarot to offer guidance for your question. Each card in your spread carries profound meaning that speaks directly to your current situation.\n",
@@ -86,11 +111,28 @@ class MockMLXModel:
             f"\n*This was a mock response generated at {time.strftime('%H:%M:%S')} for testing purposes.*",
         ]
 
+    def generate(
+        self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7, **kwargs
+    ) -> str:
+        """Generate mock response for development"""
+        lines = self._mock_lines(prompt)
+
         # Simulate processing time
         time.sleep(0.5 + len(prompt) / 10000)  # Longer prompts take more time
 
         return "".join(lines)
 
+    def stream_generate(
+        self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7, **kwargs
+    ) -> Iterator[str]:
+        """Yield the mock response word by word, taking as long as generate()"""
+        text = "".join(self._mock_lines(prompt))
+        words = text.split(" ")
+        delay = (0.5 + len(prompt) / 10000) / len(words)
+        for i, word in enumerate(words):
+            time.sleep(delay)
+            yield word if i == 0 else " " + word
+
 
 class MLXModelService:
     """Service for managing MLX models with hot-swapping capability"""
@@ -299,6 +341,7 @@ class MLXModelService:
                     raise RuntimeError("MLX not available for non-mock models")
 
                 load_time = time.time() - load_start
+                MODEL_LOAD_SECONDS.observe(load_time, model=model_id)
 
                 # Update model info
                 model_info.loaded = True
@@ -337,17 +380,28 @@ class MLXModelService:
 
                 self._current_model_id = None
 
+    def _ensure_model_loaded(self):
+        """Load the default model if none is loaded (call with the lock held)"""
+        if not self._current_model:
+            if self.default_model_id:
+                if not self.load_model(self.default_model_id):
+                    raise RuntimeError(
+                        "No model loaded and failed to load default model"
+                    )
+            else:
+                raise RuntimeError("No model loaded")
+
+    def _count_tokens(self, text: str) -> int:
+        """Tokens in generated text, counted the same way for both generate paths"""
+        if isinstance(self._current_model, MockMLXModel):
+            # The mock has no tokenizer; its "tokens" are the words it streams
+            return len(text.split())
+        return len(self._tokenizer.encode(text, add_special_tokens=False))
+
     def generate_text(self, request: InferenceRequest) -> InferenceResponse:
         """Generate text using the currently loaded model"""
         with self._lock:
-            if not self._current_model:
-                if self.default_model_id:
-                    if not self.load_model(self.default_model_id):
-                        raise RuntimeError(
-                            "No model loaded and failed to load default model"
-                        )
-                else:
-                    raise RuntimeError("No model loaded")
+            self._ensure_model_loaded()
 
             # Prepare the full prompt
             full_prompt = (
@@ -364,7 +418,7 @@ class MLXModelService:
                         max_tokens=request.max_tokens,
                         temperature=request.temperature,
                     )
-                    tokens_generated = len(response_text.split())
+                    tokens_generated = self._count_tokens(response_text)
 
                 else:
                     # Real MLX model generation using proper MLX sampling
@@ -389,22 +443,93 @@ class MLXModelService:
                         logits_processors=logits_processors,
                         verbose=False,
                     )
-                    tokens_generated = len(response_text.split())
+                    tokens_generated = self._count_tokens(response_text)
 
                 inference_time = time.time() - start_time
 
-                return InferenceResponse(
+                response = InferenceResponse(
                     text=response_text.strip(),
                     tokens_generated=tokens_generated,
                     inference_time=inference_time,
                     model_id=self._current_model_id,
                     timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
                 )
+                _record_generation(response, "batch")
+                return response
 
             except Exception as e:
                 self.logger.error(f"Generation failed: {e}")
                 raise RuntimeError(f"Text generation failed: {e}")
 
+    def generate_text_stream(
+        self,
+        request: InferenceRequest,
+        on_token: Callable[[str], Optional[bool]],
+    ) -> InferenceResponse:
+        """
+        Generate text, passing each piece to on_token as it is produced
+
+        on_token can return True to stop generating early (e.g. once the
+        reading's end marker has been seen). Returns the same response as
+        generate_text, with the text generated up to that point.
+        """
+        with self._lock:
+            self._ensure_model_loaded()
+
+            full_prompt = (
+                f"{request.system_prompt}\n\nUser: {request.user_prompt}\n\nAssistant:"
+            )
+
+            start_time = time.time()
+            pieces = []
+
+            try:
+                if isinstance(self._current_model, MockMLXModel):
+                    stream = self._current_model.stream_generate(
+                        full_prompt,
+                        max_tokens=request.max_tokens,
+                        temperature=request.temperature,
+                    )
+                else:
+                    from mlx_lm.sample_utils import make_sampler, make_logits_processors
+
+                    stream = stream_generate(
+                        model=self._current_model,
+                        tokenizer=self._tokenizer,
+                        prompt=full_prompt,
+                        max_tokens=request.max_tokens,
+                        sampler=make_sampler(
+                            temp=request.temperature, top_p=request.top_p
+                        ),
+                        logits_processors=make_logits_processors(
+                            repetition_penalty=request.repetition_penalty
+                        ),
+                    )
+
+                for chunk in stream:
+                    # mlx_lm yields GenerationResponse objects; the mock yields strings
+                    text = getattr(chunk, "text", chunk)
+                    if not text:
+                        continue
+                    pieces.append(text)
+                    if on_token(text):
+                        break
+
+                response_text = "".join(pieces)
+                response = InferenceResponse(
+                    text=response_text.strip(),
+                    tokens_generated=self._count_tokens(response_text),
+                    inference_time=time.time() - start_time,
+                    model_id=self._current_model_id,
+                    timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+                )
+                _record_generation(response, "stream")
+                return response
+
+            except Exception as e:
+                self.logger.error(f"Streaming generation failed: {e}")
+                raise RuntimeError(f"Text generation failed: {e}")
+
     def add_model(self, model_info: ModelInfo) -> bool:
         """Add a new model to the available models"""
         with self._lock:
@@ -5,8 +5,10 @@ import os
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from models.practice_models import *
-from models.reading import ReadingService
-from models.spreads import *
+from arcanum.reading import ReadingService
+from services.state_store import StateMapping, get_state_store
+from services.card_catalog import get_card_catalog
+from services.spreads_config_service import get_spreads_config_service
 
 class PracticeService:
     def __init__(self):
@@ -14,9 +16,18 @@ class PracticeService:
         self.scenarios = self._load_scenarios()
         self.client_profiles = self._load_client_profiles()
         self.evaluation_rubric = self._load_evaluation_rubric()
-        self.card_data = self._load_card_data()
-        self.active_sessions: Dict[str, PracticeSession] = {}
-        self.user_progress: Dict[str, ProgressTracking] = {}
+        self.card_catalog = get_card_catalog()
+        self.spreads_config = get_spreads_config_service()
+        # Sessions and progress live in the shared state store so any worker
+        # process can continue them; objects read from it are copies, so
+        # changes are assigned back
+        self.state_store = get_state_store()
+        self.active_sessions = StateMapping(
+            self.state_store, "practice_sessions", lambda session: session.json(), PracticeSession.parse_raw
+        )
+        self.user_progress = StateMapping(
+            self.state_store, "practice_progress", lambda progress: progress.json(), ProgressTracking.parse_raw
+        )
         
     def _load_scenarios(self) -> List[PracticeScenario]:
         """Load practice scenarios from JSON file"""
@@ -50,56 +61,9 @@ class PracticeService:
             print(f"Error loading evaluation rubric: {e}")
             return {}
     
-    def _load_card_data(self) -> Dict[str, Any]:
-        """Load card image data from JSON file"""
-        try:
-            with open("static/tarot-images.json", "r") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading card data: {e}")
-            return {"cards": []}
-    
     def _get_card_image_url(self, card_name: str) -> str:
         """Get the image URL for a card by name"""
-        for card_entry in self.card_data.get("cards", []):
-            if card_entry.get("name") == card_name:
-                return f"/static/cards_wikipedia/{card_entry.get('img', 'placeholder.jpg')}"
-        return "/static/cards_wikipedia/placeholder.jpg"
-    
-    def _load_spreads_mapping(self) -> Dict[str, Any]:
-        """Load spreads configuration for card drawing"""
-        try:
-            config_path = os.path.join(os.path.dirname(__file__), "..", "config", "spreads-config.json")
-            with open(config_path, "r") as f:
-                config = json.load(f)
-            
-            # Map card count to spread class
-            card_count_to_class = {
-                1: SingleCardSpread,
-                3: ThreeCardSpread, 
-                4: FourCardDecisionSpread,
-                5: FiveCardCrossSpread,
-                6: SixCardRelationshipSpread,
-                7: SevenCardHorseshoeSpread,
-                10: CelticCrossSpread
-            }
-            
-            spreads_mapping = {}
-            for spread in config["spreads"]:
-                spread_id = spread["id"]
-                layout = config["layouts"][spread["layout"]]
-                card_count = len(layout["positions"])
-                
-                if card_count in card_count_to_class:
-                    spreads_mapping[spread_id] = {
-                        "class": card_count_to_class[card_count],
-                        "positions": [pos["name"] for pos in spread["positions"]]
-                    }
-            
-            return spreads_mapping
-        except Exception as e:
-            print(f"Error loading spreads mapping: {e}")
-            return {}
+        return self.card_catalog.image_url(card_name)
     
     def get_available_scenarios(self, 
                               difficulty: Optional[DifficultyLevel] = None,
@@ -167,6 +131,7 @@ class PracticeService:
         )
         
         self.active_sessions[session_id] = session
+        self.state_store.flush()
         
         return StartPracticeResponse(
             session_id=session_id,
@@ -183,18 +148,13 @@ class PracticeService:
         session = self.active_sessions[session_id]
         session.selected_spread = selected_spread
         
-        # Load spreads mapping and draw cards
-        spreads_mapping = self._load_spreads_mapping()
-        
-        if selected_spread not in spreads_mapping:
+        spreads = self.spreads_config.registry
+        if selected_spread not in spreads:
             raise ValueError(f"Spread {selected_spread} not supported")
         
-        spread_info = spreads_mapping[selected_spread]
-        spread_class = spread_info["class"]
-        position_names = spread_info["positions"]
-        
-        # Create spread instance and perform reading
-        spread = spread_class()
+        # Perform reading with the spread from the shared registry
+        spread = spreads.get(selected_spread)
+        position_names = spread.position_names
         reading = self.reading_service.perform_reading(
             question=session.scenario.primary_question,
             spread=spread,
@@ -216,6 +176,8 @@ class PracticeService:
             cards_drawn.append(card)
         
         session.cards_drawn = cards_drawn
+        self.active_sessions[session_id] = session
+        self.state_store.flush()
         
         return SelectSpreadResponse(
             session_id=session_id,
@@ -237,8 +199,11 @@ class PracticeService:
         # Mark session as completed
         session.session_metadata.completed = True
         
+        self.active_sessions[session_id] = session
+        
         # Update user progress
         self._update_user_progress(session)
+        self.state_store.flush()
         
         return SubmitInterpretationResponse(
             session_id=session_id,
@@ -450,10 +415,7 @@ class PracticeService:
         """Update user progress tracking"""
         user_id = session.user_id
         
-        if user_id not in self.user_progress:
-            self.user_progress[user_id] = ProgressTracking(user_id=user_id)
-        
-        progress = self.user_progress[user_id]
+        progress = self.user_progress.get(user_id) or ProgressTracking(user_id=user_id)
         
         # Update statistics
         progress.statistics.total_sessions += 1
@@ -478,6 +440,8 @@ class PracticeService:
                 current_avg = progress.statistics.average_scores.overall
                 new_score = session.ai_evaluation.overall_score
                 progress.statistics.average_scores.overall = ((current_avg * (total - 1)) + new_score) / total
+        
+        self.user_progress[user_id] = progress
     
     def get_user_sessions(self, user_id: str) -> List[PracticeSession]:
         """Get all completed sessions for a user"""
@@ -0,0 +1,171 @@
+"""
+Prompt Store
+
+Generated reading prompts kept server-side under an id, so the two-step
+reading flow (/api/reading/cards, then /api/reading/ai-interpretation) can
+send the id back instead of uploading both prompts again. Prompts live in
+the shared state store, so with an SQLite store ($ARCANUM_STATE_STORE) an
+id made by one worker is found by the others. They expire, and only the
+newest maxsize are kept: a client whose id is gone resends the prompt text
+(or draws again).
+"""
+
+import heapq
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.state_store import StateMapping, StateStore, get_state_store
+
+PROMPTS_NAMESPACE = "prompts"
+DEFAULT_PROMPT_TTL = 30 * 60.0  # seconds
+# Prompts kept at once; the oldest are dropped beyond this
+DEFAULT_MAX_PROMPTS = 5000
+
+
+@dataclass(frozen=True)
+class StoredPrompt:
+    system_prompt: str
+    user_prompt: str
+
+
+class PromptStore:
+    """
+    Recently generated prompts by id, dropped ttl seconds after they were
+    made or once more than maxsize are kept, oldest first
+
+    Expiry times are indexed in memory (a heap of (expires, id)), so pruning
+    only touches the prompts it drops. Each worker prunes the prompts it
+    made; ones left in a shared store by an earlier run are indexed when the
+    store is opened.
+    """
+
+    def __init__(
+        self,
+        store: Optional[StateStore] = None,
+        ttl: float = DEFAULT_PROMPT_TTL,
+        maxsize: int = DEFAULT_MAX_PROMPTS,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._prompts = StateMapping(store or get_state_store(), PROMPTS_NAMESPACE)
+        self._lock = threading.Lock()
+        # Expiry of each live prompt, and a heap over it; heap entries for
+        # prompts already dropped are skipped when they come up
+        self._expires: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self._index_existing()
+
+    def _index_existing(self) -> None:
+        for prompt_id, value in self._prompts.store.scan(PROMPTS_NAMESPACE).items():
+            self._expires[prompt_id] = self._prompts.decode(value)["expires"]
+        self._heap = [(expires, prompt_id) for prompt_id, expires in self._expires.items()]
+        heapq.heapify(self._heap)
+
+    def put(self, system_prompt: str, user_prompt: str, flush: bool = True) -> str:
+        """
+        Store a prompt and return its id
+
+        flush=False leaves the write buffered (for storing many at once);
+        call flush() before handing the ids out.
+        """
+        prompt_id = uuid.uuid4().hex
+        expires = time.time() + self.ttl
+        self._prompts[prompt_id] = {
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "expires": expires,
+        }
+        with self._lock:
+            self._expires[prompt_id] = expires
+            heapq.heappush(self._heap, (expires, prompt_id))
+        self._prune(flush)
+        if flush:
+            self.flush()
+        return prompt_id
+
+    def get(self, prompt_id: str) -> Optional[StoredPrompt]:
+        """The prompt, or None if the id is unknown or expired"""
+        entry = self._prompts.get(prompt_id)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry["expires"] <= time.time():
+                self.misses += 1
+                self.expirations += 1
+                self._expires.pop(prompt_id, None)
+                expired = True
+            else:
+                self.hits += 1
+                expired = False
+        if expired:
+            self._prompts.pop(prompt_id, None)
+            return None
+        return StoredPrompt(entry["system_prompt"], entry["user_prompt"])
+
+    def flush(self) -> None:
+        """Make stored prompts visible to other workers"""
+        self._prompts.flush()
+
+    def _prune(self, flush: bool = True) -> None:
+        """Drop expired prompts, then the oldest while more than maxsize are kept"""
+        now = time.time()
+        dropped = []
+        with self._lock:
+            while self._heap:
+                expires, prompt_id = self._heap[0]
+                if self._expires.get(prompt_id) != expires:
+                    heapq.heappop(self._heap)  # already dropped
+                elif expires <= now:
+                    heapq.heappop(self._heap)
+                    del self._expires[prompt_id]
+                    dropped.append(prompt_id)
+                    self.expirations += 1
+                elif len(self._expires) > self.maxsize:
+                    heapq.heappop(self._heap)
+                    del self._expires[prompt_id]
+                    dropped.append(prompt_id)
+                    self.evictions += 1
+                else:
+                    break
+        if dropped:
+            self._prompts.store.write(
+                (PROMPTS_NAMESPACE, prompt_id, None) for prompt_id in dropped
+            )
+            if flush:
+                self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "ttl": self.ttl,
+                "size": len(self._expires),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Global store instance
+_prompt_store_instance = None
+
+
+def get_prompt_store() -> PromptStore:
+    """Get the global prompt store instance"""
+    global _prompt_store_instance
+    if _prompt_store_instance is None:
+        _prompt_store_instance = PromptStore()
+    return _prompt_store_instance
@@ -0,0 +1,229 @@
+"""
+Reading Text Cleaner
+
+clean_reading_text extracts the reading from a finished model response.
+ReadingTextStream is an incremental version of it for token streams. Text is
+fed in as it is generated. The "(thinking)" preamble, or anything before a
+"# Reading" heading, is dropped, and the stream stops at the first end
+marker. Only a small window is held back: the preamble until the reading
+starts, and at most one end marker's length of text after that.
+"""
+
+import re
+from typing import Optional
+
+READING_START_MARKER = "# Reading"
+THINKING_PREFIX = "(thinking)"
+END_MARKERS = (
+    "That concludes the reading.###END###",
+    "That concludes the reading.",
+    "[[END OF READING]]",
+)
+
+# Text without a thinking preamble held back while waiting for a "# Reading"
+# heading, before it is sent as is
+DEFAULT_MAX_PREAMBLE = 1000
+
+
+def clean_reading_text(text: str) -> str:
+    """Extract the actual reading from model output, removing thinking/preprocessing"""
+    # Handle new format with "# Reading" start marker and "That concludes the reading.###END###" end marker
+    reading_start_marker = "# Reading"
+    reading_end_marker = "That concludes the reading.###END###"
+    reading_end_marker_alt = "That concludes the reading."
+
+    # Check if text contains the new format markers
+    if reading_start_marker in text:
+        # Split on "# Reading" - everything before is "thinking"
+        parts = text.split(reading_start_marker, 1)
+        if len(parts) > 1:
+            # Take everything from "# Reading" onwards
+            text = reading_start_marker + parts[1]
+
+            # If there's an end marker, trim everything after it (including the marker itself)
+            if reading_end_marker in text:
+                text = text.split(reading_end_marker)[0].strip()
+            elif reading_end_marker_alt in text:
+                text = text.split(reading_end_marker_alt)[0].strip()
+
+            return text.strip()
+
+    # Handle Qwen3 specific thinking pattern: (thinking) ... </think> ... actual response
+    # The thinking section starts with "(thinking)" and ends with line breaks after </think> token
+    if text.startswith("(thinking)"):
+        # Look for the end of thinking section - typically after multiple line breaks
+        # The actual response usually starts after 2+ consecutive newlines
+        lines = text.split("\n")
+
+        # Find where the actual reading starts (after thinking section)
+        reading_start = 0
+        found_thinking_end = False
+
+        for i, line in enumerate(lines):
+            # Skip the thinking section
+            if not found_thinking_end:
+                # Look for transition from thinking to response
+                # Usually indicated by empty lines followed by content
+                if line.strip() == "" and i > 0:
+                    # Check if next few lines have actual content (not just empty)
+                    next_content_lines = 0
+                    for j in range(i + 1, min(i + 4, len(lines))):
+                        if j < len(lines) and lines[j].strip():
+                            next_content_lines += 1
+
+                    # If we have substantial content after empty lines, this is likely the start
+                    if next_content_lines >= 1:
+                        reading_start = i + 1
+                        found_thinking_end = True
+                        break
+
+        # Extract everything from the reading start
+        if found_thinking_end and reading_start < len(lines):
+            text = "\n".join(lines[reading_start:]).strip()
+        else:
+            # Fallback: remove everything before first substantial paragraph
+            # Look for first line that doesn't start with "(thinking)" or seem like thinking
+            for i, line in enumerate(lines):
+                if (
+                    line.strip()
+                    and not line.startswith("(thinking)")
+                    and not line.strip().startswith("I need to")
+                    and not line.strip().startswith("Let me")
+                    and len(line.strip()) > 20
+                ):  # Substantial content
+                    text = "\n".join(lines[i:]).strip()
+                    break
+
+    # Remove everything after [[END OF READING]] marker if present
+    end_marker = "[[END OF READING]]"
+    if end_marker in text:
+        text = text.split(end_marker)[0].strip()
+
+    # Clean up any remaining thinking artifacts
+    thinking_patterns = [
+        r"<thinking>.*?</thinking>",
+        r"\*\*Thinking:\*\*.*?(?=\*\*(?:Response|Reading|Answer):\*\*)",
+        r"Let me think.*?(?=\n\n[A-Z])",
+    ]
+
+    for pattern in thinking_patterns:
+        text = re.sub(pattern, "", text, flags=re.DOTALL | re.IGNORECASE)
+
+    # Look for common response markers and extract everything after them
+    response_markers = [
+        r"\*\*Response:\*\*\s*",
+        r"\*\*Reading:\*\*\s*",
+        r"\*\*Answer:\*\*\s*",
+        r"Here is your tarot reading:\s*",
+        r"Your reading:\s*",
+    ]
+
+    for marker in response_markers:
+        match = re.search(marker, text, re.IGNORECASE)
+        if match:
+            text = text[match.end() :].strip()
+            break
+
+    return text.strip()
+
+
+class ReadingTextStream:
+    """
+    Clean a reading as it streams
+
+    Each feed() returns the text that is safe to send so far (possibly "");
+    finish() returns whatever was held back. Once an end marker is seen,
+    finished is True and later input is ignored.
+    """
+
+    def __init__(self, max_preamble: int = DEFAULT_MAX_PREAMBLE):
+        self.max_preamble = max_preamble
+        self.finished = False
+        self._started = False
+        self._pending = ""
+        self._sent = []
+        self._hold = max(len(marker) for marker in END_MARKERS) - 1
+
+    @property
+    def text(self) -> str:
+        """Everything sent so far"""
+        return "".join(self._sent)
+
+    def feed(self, chunk: str) -> str:
+        if self.finished or not chunk:
+            return ""
+        self._pending += chunk
+        if not self._started and not self._find_start():
+            return ""
+        return self._release(final=False)
+
+    def finish(self) -> str:
+        """Send what was held back once generation is over"""
+        if self.finished:
+            return ""
+        if not self._started:
+            # No start marker ever came: like clean_reading_text, send it all
+            self._started = True
+            self._pending = self._pending.lstrip()
+        out = self._release(final=True)
+        self.finished = True
+        return out
+
+    def _find_start(self) -> bool:
+        """Drop the preamble once the reading's start is known"""
+        text = self._pending
+        start = text.find(READING_START_MARKER)
+        if start >= 0:
+            self._begin(start)
+            return True
+
+        if text.startswith(THINKING_PREFIX):
+            # Thinking ends at a blank line followed by content
+            blank = text.find("\n\n", 1)
+            while blank >= 0:
+                rest = text[blank:].lstrip("\n")
+                if rest.strip():
+                    self._begin(len(text) - len(rest))
+                    return True
+                blank = text.find("\n\n", blank + 1)
+            return False
+
+        if THINKING_PREFIX.startswith(text):
+            # Too short to tell yet
+            return False
+
+        # Not thinking: wait a little in case a "# Reading" heading follows
+        if len(text) > self.max_preamble:
+            self._begin(0)
+            return True
+        return False
+
+    def _begin(self, start: int) -> None:
+        self._started = True
+        self._pending = self._pending[start:].lstrip()
+
+    def _release(self, final: bool) -> str:
+        """Send pending text, holding back a possible partial end marker"""
+        pending = self._pending
+        cut = _first_end_marker(pending)
+        if cut is not None:
+            out = pending[:cut].rstrip()
+            self._pending = ""
+            self.finished = True
+        elif final:
+            out = pending.rstrip()
+            self._pending = ""
+        else:
+            safe = max(len(pending) - self._hold, 0)
+            # Trailing whitespace waits too, so the reading never ends in it
+            out = pending[:safe].rstrip()
+            self._pending = pending[len(out):]
+        if out:
+            self._sent.append(out)
+        return out
+
+
+def _first_end_marker(text: str) -> Optional[int]:
+    positions = [text.find(marker) for marker in END_MARKERS]
+    found = [pos for pos in positions if pos >= 0]
+    return min(found) if found else None
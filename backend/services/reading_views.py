@@ -0,0 +1,76 @@
+"""
+Reading Response Views
+
+Shapes of the prompt block in reading responses. The full view is what the
+prompt inspector in the frontend shows: both prompts, the two joined again
+as combined_prompt, and token and question-type metadata. The slim view is
+for clients that only need the cards: it leaves out combined_prompt and the
+metadata, and has prompt text only when asked for (include_prompt).
+"""
+
+from typing import Any, Dict, Optional
+
+FULL_VIEW = "full"
+SLIM_VIEW = "slim"
+RESPONSE_VIEWS = (FULL_VIEW, SLIM_VIEW)
+
+
+def response_view(view: Optional[str] = None, prefer: Optional[str] = None) -> str:
+    """
+    The view asked for by a ?view= parameter or a Prefer header
+
+    The parameter wins; "Prefer: return=minimal" asks for the slim view.
+    Raises ValueError for an unknown view.
+    """
+    if view:
+        view = view.strip().lower()
+        if view not in RESPONSE_VIEWS:
+            raise ValueError(f"Unknown view: {view} (expected one of {', '.join(RESPONSE_VIEWS)})")
+        return view
+    if prefer:
+        preferences = {part.strip().lower() for part in prefer.split(",")}
+        if "return=minimal" in preferences:
+            return SLIM_VIEW
+    return FULL_VIEW
+
+
+def combined_prompt(generated_reading) -> str:
+    return f"{generated_reading.system_prompt}\n\nUser: {generated_reading.user_prompt}\n\nAssistant:"
+
+
+def full_prompt_dict(generated_reading) -> Dict[str, Any]:
+    """The full_prompt block of a full reading response"""
+    return {
+        "system_prompt": generated_reading.system_prompt,
+        "user_prompt": generated_reading.user_prompt,
+        "combined_prompt": combined_prompt(generated_reading),
+        "metadata": {
+            "question_type": generated_reading.question_type.value,
+            "question_confidence": generated_reading.question_confidence,
+            "style": generated_reading.style.value,
+            "tone": generated_reading.tone.value,
+            "context_tokens": generated_reading.context_tokens,
+            "prompt_tokens": generated_reading.prompt_tokens,
+            "total_tokens": generated_reading.total_tokens,
+            "completeness": generated_reading.completeness,
+        },
+    }
+
+
+def slim_prompt_dict(generated_reading) -> Dict[str, Any]:
+    """The full_prompt block of a slim reading response: just the prompts"""
+    return {
+        "system_prompt": generated_reading.system_prompt,
+        "user_prompt": generated_reading.user_prompt,
+    }
+
+
+def prompt_dict(generated_reading, view: str) -> Dict[str, Any]:
+    if view == SLIM_VIEW:
+        return slim_prompt_dict(generated_reading)
+    return full_prompt_dict(generated_reading)
+
+
+def wants_prompt(view: str, include_prompt: bool) -> bool:
+    """Whether a response in this view carries prompt text"""
+    return view == FULL_VIEW or include_prompt
@@ -4,11 +4,16 @@ Spread Configuration Loader - Piece 2 of Context Retrieval Architecture
 Handles loading and parsing spread configurations to extract position meanings and layouts.
 """
 
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
+# Import through the services package when it's available, so this shares
+# one config cache with main.py however this module itself was imported
+try:
+    from services.spreads_config_service import get_spreads_config_service
+except ImportError:
+    from spreads_config_service import get_spreads_config_service
+
 
 @dataclass
 class SpreadPosition:
@@ -39,45 +44,48 @@ class SpreadInfo:
     positions: List[SpreadPosition]
 
 
+# Parsed SpreadInfo objects per config file, tagged with the snapshot version
+# they were built from, so every loader for a file shares one parse
+_parsed_spreads: Dict[str, Tuple[int, Dict[str, SpreadInfo]]] = {}
+
+
 class SpreadConfigLoader:
     """Loads and parses spread configuration data"""
     
     def __init__(self, config_path: str):
         self.config_path = config_path
-        self.spreads_data: Dict[str, Any] = {}
-        self.spreads_info: Dict[str, SpreadInfo] = {}
-        self._load_data()
+        self.config_service = get_spreads_config_service(config_path)
+        print(f"✅ Loaded {len(self.spreads_info)} spreads from {config_path}")
     
-    def _load_data(self) -> None:
-        """Load spread configuration from JSON file"""
-        try:
-            config_path = Path(self.config_path)
-            if not config_path.exists():
-                raise FileNotFoundError(f"Spreads config file not found: {config_path}")
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.spreads_data = json.load(f)
-            
-            # Parse spread information
-            self._parse_spreads()
-            
-            print(f"✅ Loaded {len(self.spreads_info)} spreads from {config_path}")
-            
-        except Exception as e:
-            print(f"❌ Error loading spread config: {e}")
-            raise
+    @property
+    def spreads_data(self) -> Dict[str, Any]:
+        """Raw spreads config, shared with the rest of the backend"""
+        return self.config_service.data
+    
+    @property
+    def spreads_info(self) -> Dict[str, SpreadInfo]:
+        """Parsed spreads, rebuilt only when the config file changes"""
+        snapshot = self.config_service.snapshot()
+        key = self.config_service.config_path
+        parsed = _parsed_spreads.get(key)
+        if parsed is None or parsed[0] != snapshot.version:
+            parsed = (snapshot.version, self._parse_spreads(snapshot.data))
+            _parsed_spreads[key] = parsed
+        return parsed[1]
     
-    def _parse_spreads(self) -> None:
+    def _parse_spreads(self, spreads_data: Dict[str, Any]) -> Dict[str, SpreadInfo]:
         """Parse spreads data into structured SpreadInfo objects"""
-        spreads = self.spreads_data.get('spreads', [])
-        layouts = self.spreads_data.get('layouts', {})
+        spreads = spreads_data.get('spreads', [])
+        layouts = spreads_data.get('layouts', {})
+        spreads_info = {}
         
         for spread_data in spreads:
             try:
                 spread_info = self._parse_single_spread(spread_data, layouts)
-                self.spreads_info[spread_info.id] = spread_info
+                spreads_info[spread_info.id] = spread_info
             except Exception as e:
                 print(f"⚠️ Error parsing spread {spread_data.get('id', 'unknown')}: {e}")
+        return spreads_info
     
     def _parse_single_spread(self, spread_data: Dict, layouts: Dict) -> SpreadInfo:
         """Parse a single spread configuration"""
@@ -0,0 +1,117 @@
+"""
+Spreads Config Service
+
+Parses config/spreads-config.json once and shares the result with every
+endpoint and with SpreadConfigLoader. The file's mtime and size are checked
+(at most once per check_interval) and a changed file is re-parsed into a new
+snapshot, which then replaces the old one in a single assignment. Readers
+always see one complete snapshot: either the old config or the new one.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from arcanum.spreads import SpreadRegistry
+
+SERVICES_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SPREADS_CONFIG_PATH = os.path.join(SERVICES_DIR, "..", "config", "spreads-config.json")
+
+
+@dataclass(frozen=True)
+class SpreadsConfigSnapshot:
+    """One parsed version of the spreads config. Treat it as read-only."""
+    data: Dict[str, Any]
+    spreads_by_id: Mapping[str, Dict[str, Any]]
+    registry: SpreadRegistry
+    mtime_ns: int
+    size: int
+    # Bumped on every reload, so caches built from a snapshot can tell it changed
+    version: int = field(default=1)
+
+    @classmethod
+    def parse(cls, data: Dict[str, Any], mtime_ns: int, size: int, version: int) -> "SpreadsConfigSnapshot":
+        spreads_by_id = {spread["id"]: spread for spread in data.get("spreads", [])}
+        return cls(
+            data=data,
+            spreads_by_id=MappingProxyType(spreads_by_id),
+            registry=SpreadRegistry.from_config(data),
+            mtime_ns=mtime_ns,
+            size=size,
+            version=version,
+        )
+
+
+class SpreadsConfigService:
+    """Cached spreads config that reloads itself when the file changes"""
+
+    def __init__(self, config_path: str = DEFAULT_SPREADS_CONFIG_PATH, check_interval: float = 1.0):
+        self.config_path = config_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot: Optional[SpreadsConfigSnapshot] = None
+        self._next_check = 0.0
+        self._reload()
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = os.stat(self.config_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload(self) -> None:
+        """Parse the file into a new snapshot and swap it in"""
+        mtime_ns, size = self._stat()
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        version = self._snapshot.version + 1 if self._snapshot else 1
+        self._snapshot = SpreadsConfigSnapshot.parse(data, mtime_ns, size, version)
+        print(f"✅ Loaded {len(self._snapshot.spreads_by_id)} spreads from {self.config_path}")
+
+    def snapshot(self) -> SpreadsConfigSnapshot:
+        """The current config, reloaded first if the file has changed"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return self._snapshot
+
+        with self._lock:
+            if now >= self._next_check:
+                self._next_check = now + self.check_interval
+                current = self._snapshot
+                try:
+                    if self._stat() != (current.mtime_ns, current.size):
+                        self._reload()
+                except (OSError, ValueError) as e:
+                    # Keep serving the last good config (e.g. mid-save or bad JSON)
+                    print(f"❌ Spreads config not reloaded, keeping version {current.version}: {e}")
+        return self._snapshot
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The whole parsed config (spreads, layouts, ...)"""
+        return self.snapshot().data
+
+    @property
+    def registry(self) -> SpreadRegistry:
+        """Spread layouts for drawing readings, keyed by spread id"""
+        return self.snapshot().registry
+
+    def get_spread_config(self, spread_id: str) -> Optional[Dict[str, Any]]:
+        """The raw config entry for one spread"""
+        return self.snapshot().spreads_by_id.get(spread_id)
+
+
+# One service per config file
+_services: Dict[str, SpreadsConfigService] = {}
+_services_lock = threading.Lock()
+
+
+def get_spreads_config_service(config_path: Optional[str] = None) -> SpreadsConfigService:
+    """Get the shared config service for a spreads config file"""
+    key = os.path.realpath(config_path or DEFAULT_SPREADS_CONFIG_PATH)
+    with _services_lock:
+        if key not in _services:
+            _services[key] = SpreadsConfigService(key)
+        return _services[key]
@@ -0,0 +1,208 @@
+"""
+Service Startup
+
+Builds the backend's components in the background instead of serially at
+import time. Each component is a factory plus the names of the components
+it needs, and independent components are built concurrently on a thread
+pool. Callers either wait for a component with get() or use a LazyService
+stand-in, which waits on first use. The time spent on each component is
+kept for the readiness endpoint.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence
+
+DEFAULT_STARTUP_WORKERS = 4
+
+
+@dataclass
+class Component:
+    name: str
+    factory: Callable[[], Any]
+    depends_on: Sequence[str] = ()
+    # Readiness waits for required components; optional ones (warmups) can fail
+    required: bool = True
+    status: str = "pending"  # pending, building, ready, failed
+    value: Any = None
+    error: Optional[str] = None
+    exception: Optional[BaseException] = field(default=None, repr=False)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _future: Future = field(default_factory=Future, repr=False)
+
+    @property
+    def seconds(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+
+class ServiceInitializer:
+    """Registry of components, built concurrently once start() is called"""
+
+    def __init__(self, max_workers: int = DEFAULT_STARTUP_WORKERS):
+        self.max_workers = max_workers
+        self._components: Dict[str, Component] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._started_at: Optional[float] = None
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        depends_on: Sequence[str] = (),
+        required: bool = True,
+    ) -> None:
+        """
+        Add a component; factory runs once its dependencies are ready
+
+        Dependencies must be registered first. Builds start in registration
+        order, so a build only ever waits on ones already running.
+        """
+        if self._executor is not None:
+            raise RuntimeError(f"Cannot register {name} after startup has begun")
+        for dependency in depends_on:
+            if dependency not in self._components:
+                raise ValueError(f"{name} depends on unregistered {dependency}")
+        self._components[name] = Component(name, factory, tuple(depends_on), required)
+
+    def start(self) -> None:
+        """Begin building every component in the background (only once)"""
+        with self._lock:
+            if self._executor is not None:
+                return
+            self._started_at = time.perf_counter()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="startup"
+            )
+            for component in self._components.values():
+                self._executor.submit(self._build, component)
+
+    def _build(self, component: Component) -> None:
+        value = None
+        error = None
+        try:
+            # Dependencies are built by other tasks; wait for them here
+            for dependency in component.depends_on:
+                self._components[dependency]._future.result()
+                if self._components[dependency].status == "failed":
+                    error = f"dependency {dependency} failed"
+                    component.exception = self._components[dependency].exception
+                    return
+
+            component.status = "building"
+            component.started_at = time.perf_counter()
+            value = component.factory()
+        except BaseException as e:
+            # Not just Exception: a factory that exits or is interrupted
+            # must still fail the component, or get() would block forever
+            value = None
+            error = str(e) or type(e).__name__
+            component.exception = e
+        finally:
+            self._finish(component, value, error)
+
+    def _finish(self, component: Component, value: Any, error: Optional[str]) -> None:
+        try:
+            if component.started_at is None:
+                component.started_at = time.perf_counter()
+            component.finished_at = time.perf_counter()
+            component.value = value
+            component.error = error
+            component.status = "failed" if error else "ready"
+            if error:
+                print(f"❌ {component.name} failed after {component.seconds:.2f}s: {error}")
+            else:
+                print(f"✅ {component.name} ready in {component.seconds:.2f}s")
+        finally:
+            component._future.set_result(value)
+
+    def get(self, name: str, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a component and return it
+
+        Returns None if it failed to build. Starts startup if nothing has.
+        """
+        self.start()
+        return self._components[name]._future.result(timeout)
+
+    def exception(self, name: str) -> Optional[BaseException]:
+        """What the component's factory raised, if it failed"""
+        return self._components[name].exception
+
+    def is_ready(self, name: str) -> bool:
+        return self._components[name].status == "ready"
+
+    @property
+    def ready(self) -> bool:
+        """Every required component built successfully"""
+        return all(
+            component.status == "ready"
+            for component in self._components.values()
+            if component.required
+        )
+
+    def report(self) -> Dict[str, Any]:
+        """Status and build time of each component"""
+        components: Dict[str, Any] = {}
+        for component in self._components.values():
+            components[component.name] = {
+                "status": component.status,
+                "required": component.required,
+                "seconds": component.seconds,
+                "error": component.error,
+            }
+        finished = [c.finished_at for c in self._components.values() if c.finished_at]
+        done = all(c.finished_at for c in self._components.values())
+        return {
+            "ready": self.ready,
+            "startup_seconds": (max(finished) - self._started_at)
+            if done and finished and self._started_at
+            else None,
+            "components": components,
+        }
+
+
+class ServiceUnavailableError(RuntimeError):
+    """A component failed to build; the factory's exception is the __cause__"""
+
+
+class LazyService:
+    """
+    Stand-in for a component that waits for it on first use
+
+    Attribute access, len(), iteration and `in` go to the built component.
+    It is truthy only if the component built successfully, so
+    `if not service:` checks still work.
+    """
+
+    def __init__(self, initializer: ServiceInitializer, name: str):
+        object.__setattr__(self, "_initializer", initializer)
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, attr: str) -> Any:
+        value = self._initializer.get(self._name)
+        if value is None:
+            raise ServiceUnavailableError(
+                f"{self._name} is not available"
+            ) from self._initializer.exception(self._name)
+        return getattr(value, attr)
+
+    def __bool__(self) -> bool:
+        return self._initializer.get(self._name) is not None
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._initializer.get(self._name)
+
+    def __iter__(self):
+        return iter(self._initializer.get(self._name))
+
+    def __len__(self) -> int:
+        return len(self._initializer.get(self._name))
+
+    def __repr__(self) -> str:
+        return f"LazyService({self._name!r})"
@@ -0,0 +1,349 @@
+"""
+State Store
+
+Key-value storage for state that has to outlive a request (practice sessions,
+progress, client story state), grouped by namespace. Values are JSON text.
+The in-memory backend keeps the old single-process behaviour; the SQLite
+backend (WAL mode) lets several worker processes share the same state.
+WriteBehindCache sits in front of a backend so repeated reads come from
+memory and writes go to disk in batches.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import Any, Callable, Optional
+
+from arcanum.cache import LRUCache
+
+STATE_STORE_ENV_VAR = "ARCANUM_STATE_STORE"
+
+# (namespace, key, value); a value of None deletes the key
+Change = tuple[str, str, Optional[str]]
+
+
+class StateStore(ABC):
+    """Namespaced key-value storage of JSON text"""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """The stored value, or None"""
+
+    @abstractmethod
+    def scan(self, namespace: str) -> dict[str, str]:
+        """Every key and value in a namespace"""
+
+    @abstractmethod
+    def write(self, changes: Iterable[Change]) -> None:
+        """Apply several sets and deletes at once"""
+
+    def changed(self) -> bool:
+        """
+        Whether another process may have written since the last call
+
+        Used by caches to know when to drop what they hold.
+        """
+        return False
+
+    def flush(self) -> None:
+        """Make buffered writes visible to other processes"""
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryStateStore(StateStore):
+    """State in a dict; only this process sees it"""
+
+    def __init__(self):
+        self._data: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        return self._data.get(namespace, {}).get(key)
+
+    def scan(self, namespace: str) -> dict[str, str]:
+        with self._lock:
+            return dict(self._data.get(namespace, {}))
+
+    def write(self, changes: Iterable[Change]) -> None:
+        with self._lock:
+            for namespace, key, value in changes:
+                if value is None:
+                    self._data.get(namespace, {}).pop(key, None)
+                else:
+                    self._data.setdefault(namespace, {})[key] = value
+
+
+class SQLiteStateStore(StateStore):
+    """State in a SQLite file in WAL mode, shared by every process using it"""
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Args:
+            path: Database file, created if missing
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL makes NORMAL safe against corruption; a power cut can lose
+        # only the last transactions
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def scan(self, namespace: str) -> dict[str, str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM state WHERE namespace = ?", (namespace,)
+            ).fetchall()
+        return dict(rows)
+
+    def write(self, changes: Iterable[Change]) -> None:
+        changes = list(changes)
+        if not changes:
+            return
+        upserts = [change for change in changes if change[2] is not None]
+        deletes = [(namespace, key) for namespace, key, value in changes if value is None]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO state (namespace, key, value) VALUES (?, ?, ?)"
+                    " ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value",
+                    upserts,
+                )
+                self._conn.executemany(
+                    "DELETE FROM state WHERE namespace = ? AND key = ?", deletes
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def changed(self) -> bool:
+        # data_version only moves when another connection commits, and is
+        # read from the shared WAL index rather than the database pages
+        with self._lock:
+            version = self._read_data_version()
+            changed = version != self._data_version
+            self._data_version = version
+        return changed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class WriteBehindCache(StateStore):
+    """
+    Caches reads from another store and buffers its writes
+
+    Reads are answered from memory until another process writes to the
+    store. Writes are kept in memory and written together by flush(), which
+    also runs every flush_interval seconds and at exit.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        maxsize: int = 10000,
+        flush_interval: Optional[float] = 1.0,
+        max_pending: int = 1000,
+    ):
+        """
+        Args:
+            store: Backing store
+            maxsize: Values kept in memory for reads
+            flush_interval: Seconds between background flushes (None = only
+                explicit flushes, max_pending and exit)
+            max_pending: Buffered writes that trigger a flush
+        """
+        self.store = store
+        self.max_pending = max_pending
+        self.cache = LRUCache(maxsize=maxsize)
+        self._pending: dict[tuple[str, str], Optional[str]] = {}
+        self._lock = threading.RLock()
+        self._closed = threading.Event()
+
+        if flush_interval is not None:
+            threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name="state-flush",
+                daemon=True,
+            ).start()
+        atexit.register(self.close)
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Failed to flush state: {e}")
+
+    def _drop_stale(self) -> None:
+        if self.store.changed():
+            self.cache.clear()
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        with self._lock:
+            if (namespace, key) in self._pending:
+                return self._pending[(namespace, key)]
+            self._drop_stale()
+            value = self.cache.get((namespace, key))
+            if value is None:
+                value = self.store.get(namespace, key)
+                if value is not None:
+                    self.cache.put((namespace, key), value)
+            return value
+
+    def scan(self, namespace: str) -> dict[str, str]:
+        self.flush()
+        return self.store.scan(namespace)
+
+    def write(self, changes: Iterable[Change]) -> None:
+        with self._lock:
+            for namespace, key, value in changes:
+                self._pending[(namespace, key)] = value
+            if len(self._pending) >= self.max_pending:
+                self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            pending = self._pending
+            self.store.write(
+                (namespace, key, value) for (namespace, key), value in pending.items()
+            )
+            self._pending = {}
+            # Our own commit doesn't count as a change by someone else
+            self._drop_stale()
+            for (namespace, key), value in pending.items():
+                if value is None:
+                    self.cache.discard((namespace, key))
+                else:
+                    self.cache.put((namespace, key), value)
+
+    def changed(self) -> bool:
+        return self.store.changed()
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self.flush()
+        self._closed.set()
+        self.store.close()
+
+
+class StateMapping(MutableMapping):
+    """
+    One namespace of a store as a dict of objects
+
+    Values are encoded to JSON text on the way in and decoded on the way out,
+    so each read returns a fresh object: change it, then assign it back.
+    """
+
+    def __init__(
+        self,
+        store: StateStore,
+        namespace: str,
+        encode: Callable[[Any], str] = json.dumps,
+        decode: Callable[[str], Any] = json.loads,
+    ):
+        self.store = store
+        self.namespace = namespace
+        self.encode = encode
+        self.decode = decode
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.store.get(self.namespace, key)
+        if value is None:
+            raise KeyError(key)
+        return self.decode(value)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.store.write([(self.namespace, key, self.encode(value))])
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.store.write([(self.namespace, key, None)])
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.store.get(self.namespace, key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.scan(self.namespace))
+
+    def __len__(self) -> int:
+        return len(self.store.scan(self.namespace))
+
+    def values(self) -> list[Any]:
+        # One scan instead of a lookup per key
+        return [self.decode(value) for value in self.store.scan(self.namespace).values()]
+
+    def flush(self) -> None:
+        self.store.flush()
+
+
+def open_state_store(url: Optional[str] = None) -> StateStore:
+    """
+    Open the store described by url
+
+    Args:
+        url: "memory", or "sqlite:///path/to/state.db" (a bare path ending
+            in .db or .sqlite also works). Defaults to $ARCANUM_STATE_STORE,
+            then memory.
+    """
+    url = url or os.environ.get(STATE_STORE_ENV_VAR) or "memory"
+    if url == "memory":
+        return MemoryStateStore()
+    if url.startswith("sqlite:///"):
+        return WriteBehindCache(SQLiteStateStore(url[len("sqlite:///") :]))
+    if url.endswith((".db", ".sqlite")):
+        return WriteBehindCache(SQLiteStateStore(url))
+    raise ValueError(f"Unknown state store: {url}")
+
+
+_state_store: Optional[StateStore] = None
+_state_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """The process's shared state store, opened from $ARCANUM_STATE_STORE"""
+    global _state_store
+    with _state_store_lock:
+        if _state_store is None:
+            _state_store = open_state_store()
+        return _state_store
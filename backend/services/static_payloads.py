@@ -0,0 +1,186 @@
+"""
+Static Payload Cache
+
+Large JSON documents that rarely change (the enhanced cards, the spreads
+config, the legacy interpretations) are serialized once into response bytes,
+along with gzip and, if the brotli package is installed (the "brotli" extra),
+brotli variants and an ETag. A payload is rebuilt only when its source
+changes: for files that means a new mtime or size.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 9
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding codings and their q-values, e.g. {"gzip": 1.0, "br": 0.5}"""
+    codings = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[coding.strip().lower()] = q
+    return codings
+
+
+@dataclass(frozen=True)
+class StaticPayload:
+    """One document, ready to send"""
+    body: bytes
+    gzip_body: bytes
+    brotli_body: Optional[bytes]
+    etag: str
+    version: Hashable
+
+    @classmethod
+    def build(cls, document: Any, version: Hashable) -> "StaticPayload":
+        # Same bytes FastAPI's JSONResponse would produce
+        body = json.dumps(
+            document, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        return cls(
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+            brotli_body=brotli.compress(body, quality=BROTLI_QUALITY) if brotli else None,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            version=version,
+        )
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header names this payload"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison: a W/ prefix doesn't matter for If-None-Match
+        return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+
+    def encode_for(self, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """
+        The variant the client prefers, and its Content-Encoding
+
+        Codings are ranked by q-value; q=0 rules one out, and a coding that
+        isn't listed gets the q of "*", if given. On a tie the smaller
+        variant (br, then gzip) wins. With nothing acceptable the body is
+        sent unencoded.
+        """
+        codings = parse_accept_encoding(accept_encoding or "")
+        default = codings.get("*", 0.0)
+        variants = [(self.gzip_body, "gzip")]
+        if self.brotli_body is not None:
+            variants.insert(0, (self.brotli_body, "br"))
+
+        best: Tuple[bytes, Optional[str]] = (self.body, None)
+        best_q = 0.0
+        for body, coding in variants:
+            q = codings.get(coding, default)
+            if q > best_q:
+                best, best_q = (body, coding), q
+        return best
+
+
+@dataclass(frozen=True)
+class PayloadSource:
+    """Where a payload comes from. version() should be cheap; load() runs only
+    when the version has changed."""
+    load: Callable[[], Any]
+    version: Callable[[], Hashable]
+
+
+def file_version(path: str) -> Tuple[int, int]:
+    """A file's mtime and size, which change whenever it is rewritten"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_source(path: str) -> PayloadSource:
+    """A JSON file, versioned by its mtime and size"""
+    def load() -> Any:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    return PayloadSource(load=load, version=lambda: file_version(path))
+
+
+class StaticPayloadCache:
+    """Named payloads, each rebuilt when its source changes"""
+
+    def __init__(self, check_interval: float = 1.0):
+        self.check_interval = check_interval
+        self._sources: Dict[str, PayloadSource] = {}
+        self._payloads: Dict[str, StaticPayload] = {}
+        self._next_check: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Requests served from an existing payload vs. ones that built it
+        self.hits = 0
+        self.misses = 0
+
+    def add(self, name: str, source: PayloadSource) -> None:
+        """Serve the document from source under name"""
+        self._sources[name] = source
+
+    def add_file(self, name: str, path: str) -> None:
+        """Serve a JSON file under name"""
+        self.add(name, file_source(path))
+
+    def get(self, name: str) -> StaticPayload:
+        """
+        The current payload for name
+
+        If the source can't be read or parsed, the last good payload is
+        kept; with no earlier payload the error is raised.
+        """
+        now = time.monotonic()
+        with self._lock:
+            payload = self._payloads.get(name)
+            if payload is not None and now < self._next_check[name]:
+                self.hits += 1
+                return payload
+
+            self._next_check[name] = now + self.check_interval
+            source = self._sources[name]
+            try:
+                version = source.version()
+                if payload is None or version != payload.version:
+                    payload = StaticPayload.build(source.load(), version)
+                    self._payloads[name] = payload
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            except (OSError, ValueError) as e:
+                if payload is None:
+                    raise
+                print(f"❌ Keeping cached {name} payload: {e}")
+            return payload
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+            payloads = len(self._payloads)
+        lookups = hits + misses
+        return {
+            "payloads": payloads,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
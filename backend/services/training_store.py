@@ -0,0 +1,717 @@
+"""
+Training Data Store
+
+The training readings (readings/all_readings.json), their interpretations
+(readings/reading_NNN.md) and interpretation metadata
+(interpretations/RNNN.json) indexed in SQLite. The DevMode endpoints query
+the index instead of listing directories and parsing every file per
+request. Lists are paginated with a cursor on the dataset order and can be
+filtered by status, source and category. Counts per status, source and
+category are kept in a small summary table by triggers, so totals and
+progress don't scan the readings.
+
+The files stay the source of truth: writes go to the files and the index
+together, and the index is rebuilt from the files when they change outside
+the store (new files, or an edited all_readings.json). export_files()
+writes the same layout elsewhere; exports requested over the API go under
+data_dir/exports (see export_path()).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_TUNING_DATA_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "llm", "tuning_data")
+)
+STATUSES = ("not_started", "draft", "completed")
+SOURCES = ("common", "special")
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+# Directory under data_dir that API exports are written to
+EXPORTS_DIRNAME = "exports"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    reading_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    category TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'not_started',
+    has_interpretation INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS readings_position ON readings (position);
+CREATE INDEX IF NOT EXISTS readings_status ON readings (status, position);
+CREATE INDEX IF NOT EXISTS readings_source ON readings (source, position);
+CREATE INDEX IF NOT EXISTS readings_category ON readings (category, position);
+
+CREATE TABLE IF NOT EXISTS interpretations (
+    reading_id TEXT PRIMARY KEY,
+    interpretation TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    created_at TEXT,
+    updated_at TEXT,
+    markdown_mtime_ns INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS reading_counts (
+    source TEXT NOT NULL,
+    category TEXT NOT NULL,
+    status TEXT NOT NULL,
+    has_interpretation INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (source, category, status, has_interpretation)
+);
+
+CREATE TRIGGER IF NOT EXISTS readings_counted_insert AFTER INSERT ON readings BEGIN
+    INSERT INTO reading_counts VALUES
+        (NEW.source, NEW.category, NEW.status, NEW.has_interpretation, 1)
+    ON CONFLICT DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS readings_counted_delete AFTER DELETE ON readings BEGIN
+    UPDATE reading_counts SET n = n - 1
+    WHERE source = OLD.source AND category = OLD.category
+        AND status = OLD.status AND has_interpretation = OLD.has_interpretation;
+END;
+CREATE TRIGGER IF NOT EXISTS readings_counted_update
+AFTER UPDATE OF source, category, status, has_interpretation ON readings BEGIN
+    UPDATE reading_counts SET n = n - 1
+    WHERE source = OLD.source AND category = OLD.category
+        AND status = OLD.status AND has_interpretation = OLD.has_interpretation;
+    INSERT INTO reading_counts VALUES
+        (NEW.source, NEW.category, NEW.status, NEW.has_interpretation, 1)
+    ON CONFLICT DO UPDATE SET n = n + 1;
+END;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def markdown_filename(reading_id: str) -> str:
+    """R001 -> reading_001.md"""
+    reading_num = reading_id.replace("R", "").lstrip("0")
+    return f"reading_{reading_num.zfill(3)}.md"
+
+
+def reading_id_for_markdown(filename: str) -> Optional[str]:
+    """reading_001.md -> R001"""
+    if not (filename.startswith("reading_") and filename.endswith(".md")):
+        return None
+    reading_num = filename[len("reading_") : -len(".md")]
+    return f"R{reading_num.zfill(3)}"
+
+
+def reading_source(reading: Dict[str, Any]) -> str:
+    return reading.get("source") or ("special" if reading.get("spread_config") else "common")
+
+
+@dataclass
+class ReadingPage:
+    readings: List[Dict[str, Any]]
+    total: int  # readings matching the filters, on every page
+    next_cursor: Optional[int]  # pass as cursor for the next page; None on the last
+
+
+class TrainingStore:
+    """SQLite index over the training data files in data_dir"""
+
+    def __init__(
+        self,
+        data_dir: str = DEFAULT_TUNING_DATA_DIR,
+        db_path: Optional[str] = None,
+        check_interval: float = 1.0,
+    ):
+        self.data_dir = data_dir
+        self.readings_dir = os.path.join(data_dir, "readings")
+        self.interpretations_dir = os.path.join(data_dir, "interpretations")
+        self.readings_path = os.path.join(self.readings_dir, "all_readings.json")
+        self.exports_dir = os.path.join(data_dir, EXPORTS_DIRNAME)
+        self.db_path = db_path or os.path.join(data_dir, "training_index.db")
+        self.check_interval = check_interval
+
+        self._lock = threading.RLock()
+        self._next_check = 0.0
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    # Syncing with the files
+
+    def _fingerprint(self) -> str:
+        """Changes when readings are edited or files are added or removed"""
+        parts = []
+        for path in (self.readings_path, self.readings_dir, self.interpretations_dir):
+            try:
+                stat = os.stat(path)
+                parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+            except FileNotFoundError:
+                parts.append("-")
+        return "|".join(parts)
+
+    def _stored_fingerprint(self) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        return row[0] if row else None
+
+    def _save_fingerprint(self) -> None:
+        self._conn.execute(
+            "INSERT INTO meta VALUES ('fingerprint', ?)"
+            " ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (self._fingerprint(),),
+        )
+
+    def refresh(self) -> None:
+        """Re-import if the files changed since the last import (checked at most every check_interval)"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            self._next_check = now + self.check_interval
+            if self._fingerprint() != self._stored_fingerprint():
+                self.import_files()
+
+    def _read_interpretation_files(self) -> Dict[str, Dict[str, Any]]:
+        interpretations: Dict[str, Dict[str, Any]] = {}
+        if os.path.isdir(self.interpretations_dir):
+            for filename in os.listdir(self.interpretations_dir):
+                if not (filename.endswith(".json") and filename.startswith("R")):
+                    continue
+                reading_id = filename[: -len(".json")]
+                try:
+                    with open(os.path.join(self.interpretations_dir, filename), "r") as f:
+                        interpretations[reading_id] = json.load(f)
+                except (OSError, ValueError):
+                    interpretations[reading_id] = {"status": "not_started"}
+
+        if os.path.isdir(self.readings_dir):
+            for filename in os.listdir(self.readings_dir):
+                reading_id = reading_id_for_markdown(filename)
+                if reading_id is None:
+                    continue
+                md_file = os.path.join(self.readings_dir, filename)
+                entry = interpretations.setdefault(reading_id, {"status": "not_started"})
+                with open(md_file, "r") as f:
+                    entry["interpretation"] = f.read()
+                entry["markdown_mtime_ns"] = os.stat(md_file).st_mtime_ns
+        return interpretations
+
+    def import_files(self) -> int:
+        """Rebuild the index from the files; returns the number of readings"""
+        with self._lock:
+            # Read the files under the write lock: a writer sharing the index
+            # changes files and index in one transaction, so a snapshot read
+            # before this could miss its changes and then hide them behind a
+            # fingerprint that matches the files
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                reading_rows, interpretation_rows = self._read_files()
+                self._conn.execute("DELETE FROM readings")
+                self._conn.execute("DELETE FROM reading_counts")
+                self._conn.execute("DELETE FROM interpretations")
+                self._conn.executemany(
+                    "INSERT INTO readings VALUES (?, ?, ?, ?, ?, ?, ?)", reading_rows
+                )
+                self._conn.executemany(
+                    "INSERT INTO interpretations VALUES (?, ?, ?, ?, ?, ?)", interpretation_rows
+                )
+                self._save_fingerprint()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        print(f"✅ Indexed {len(reading_rows)} training readings")
+        return len(reading_rows)
+
+    def _read_files(self) -> Tuple[List[tuple], List[tuple]]:
+        """Index rows for the readings and interpretations in the files"""
+        try:
+            with open(self.readings_path, "r") as f:
+                readings = json.load(f)["tarot_reading_dataset"]["readings"]
+        except FileNotFoundError:
+            print(f"Unified readings file not found: {self.readings_path}")
+            readings = []
+        interpretations = self._read_interpretation_files()
+
+        reading_rows = []
+        for position, reading in enumerate(readings):
+            reading_id = reading["reading_id"]
+            entry = interpretations.get(reading_id, {})
+            reading_rows.append(
+                (
+                    reading_id,
+                    position,
+                    reading_source(reading),
+                    reading.get("question_category", ""),
+                    entry.get("status", "not_started"),
+                    1 if "markdown_mtime_ns" in entry else 0,
+                    json.dumps(reading, ensure_ascii=False),
+                )
+            )
+        interpretation_rows = [
+            (
+                reading_id,
+                entry.get("interpretation", ""),
+                entry.get("notes", ""),
+                entry.get("created_at"),
+                entry.get("updated_at"),
+                entry.get("markdown_mtime_ns"),
+            )
+            for reading_id, entry in interpretations.items()
+        ]
+        return reading_rows, interpretation_rows
+
+    # Queries
+
+    def _reading(self, row: sqlite3.Row) -> Dict[str, Any]:
+        reading = json.loads(row["data"])
+        reading["source"] = row["source"]
+        reading["status"] = row["status"]
+        reading["has_interpretation"] = bool(row["has_interpretation"])
+        return reading
+
+    @staticmethod
+    def _filters(
+        status: Optional[str], source: Optional[str], category: Optional[str]
+    ) -> Tuple[List[str], List[Any]]:
+        if status is not None and status not in STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(STATUSES)}")
+        if source is not None and source not in SOURCES:
+            raise ValueError(f"Invalid source. Must be one of: {', '.join(SOURCES)}")
+        clauses, params = [], []
+        for column, value in (("status", status), ("source", source), ("category", category)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return clauses, params
+
+    def count(
+        self,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> int:
+        """Readings matching the filters, from the summary table"""
+        self.refresh()
+        clauses, params = self._filters(status, source, category)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COALESCE(SUM(n), 0) FROM reading_counts {where}", params
+            ).fetchone()
+        return row[0]
+
+    def list(
+        self,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[int] = None,
+    ) -> ReadingPage:
+        """
+        Readings in dataset order, filtered and paginated
+
+        Args:
+            status, source, category: Only readings with these values
+            limit: Page size, at most MAX_PAGE_SIZE
+            cursor: next_cursor from the previous page
+
+        Raises ValueError for an unknown status or source, or a bad limit.
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        clauses, params = self._filters(status, source, category)
+        self.refresh()
+        if cursor is not None:
+            clauses.append("position > ?")
+            params.append(cursor)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        # One extra row tells whether there is another page
+        query = f"SELECT * FROM readings {where} ORDER BY position LIMIT ?"
+        params.append(limit + 1)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1]["position"]
+        return ReadingPage(
+            readings=[self._reading(row) for row in rows],
+            total=self.count(status, source, category),
+            next_cursor=next_cursor,
+        )
+
+    def get(self, reading_id: str) -> Optional[Dict[str, Any]]:
+        self.refresh()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM readings WHERE reading_id = ?", (reading_id,)
+            ).fetchone()
+        return self._reading(row) if row else None
+
+    def counts_by(self, column: str) -> Dict[str, int]:
+        """Reading counts per status, source or category"""
+        if column not in ("status", "source", "category"):
+            raise ValueError(f"Cannot count by {column}")
+        self.refresh()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, SUM(n) FROM reading_counts GROUP BY {column}"
+            ).fetchall()
+        return {value: n for value, n in rows if n}
+
+    def progress(self) -> Dict[str, Any]:
+        by_status = self.counts_by("status")
+        total = sum(by_status.values())
+        completed = by_status.get("completed", 0)
+        return {
+            "total_readings": total,
+            "completed": completed,
+            "draft": by_status.get("draft", 0),
+            "not_started": by_status.get("not_started", 0),
+            "completion_percentage": (completed / total * 100) if total > 0 else 0,
+        }
+
+    def get_interpretation(self, reading_id: str) -> Optional[Dict[str, Any]]:
+        """
+        The interpretation of a reading, or None if it has none
+
+        The markdown file is re-read if it was edited by hand since indexing.
+        """
+        self.refresh()
+        md_file = os.path.join(self.readings_dir, markdown_filename(reading_id))
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT i.*, COALESCE(r.status, 'not_started') AS status"
+                " FROM interpretations i LEFT JOIN readings r USING (reading_id)"
+                " WHERE i.reading_id = ?",
+                (reading_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            entry = {
+                "reading_id": reading_id,
+                "interpretation": row["interpretation"],
+                "notes": row["notes"],
+                "status": row["status"],
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+            }
+            try:
+                mtime_ns = os.stat(md_file).st_mtime_ns
+            except FileNotFoundError:
+                return entry
+            if mtime_ns != row["markdown_mtime_ns"]:
+                with open(md_file, "r") as f:
+                    entry["interpretation"] = f.read()
+                self._conn.execute(
+                    "UPDATE interpretations SET interpretation = ?, markdown_mtime_ns = ?"
+                    " WHERE reading_id = ?",
+                    (entry["interpretation"], mtime_ns, reading_id),
+                )
+            entry["source_file"] = md_file
+            return entry
+
+    # Writes (files first, then the index)
+
+    def _write_metadata(self, entry: Dict[str, Any]) -> None:
+        os.makedirs(self.interpretations_dir, exist_ok=True)
+        json_file = os.path.join(self.interpretations_dir, f"{entry['reading_id']}.json")
+        with open(json_file, "w") as f:
+            json.dump(entry, f, indent=2)
+
+    def _write_markdown(self, reading_id: str, text: str) -> Tuple[str, int]:
+        os.makedirs(self.readings_dir, exist_ok=True)
+        md_file = os.path.join(self.readings_dir, markdown_filename(reading_id))
+        with open(md_file, "w") as f:
+            f.write(text)
+        return md_file, os.stat(md_file).st_mtime_ns
+
+    def _index_interpretation(
+        self,
+        reading_id: str,
+        status: str,
+        interpretation: Optional[str] = None,
+        notes: Optional[str] = None,
+        markdown_mtime_ns: Optional[int] = None,
+    ) -> None:
+        now = datetime.now().isoformat()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "INSERT INTO interpretations (reading_id, interpretation, notes, created_at,"
+                " updated_at, markdown_mtime_ns) VALUES (?, COALESCE(?, ''), COALESCE(?, ''), ?, ?, ?)"
+                " ON CONFLICT (reading_id) DO UPDATE SET"
+                " interpretation = COALESCE(?, interpretation), notes = COALESCE(?, notes),"
+                " updated_at = excluded.updated_at,"
+                " markdown_mtime_ns = COALESCE(?, markdown_mtime_ns)",
+                (
+                    reading_id, interpretation, notes, now, now, markdown_mtime_ns,
+                    interpretation, notes, markdown_mtime_ns,
+                ),
+            )
+            self._conn.execute(
+                "UPDATE readings SET status = ?,"
+                " has_interpretation = has_interpretation OR ? WHERE reading_id = ?",
+                (status, markdown_mtime_ns is not None, reading_id),
+            )
+            self._save_fingerprint()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def save_interpretation(
+        self, reading_id: str, interpretation: str, notes: str = "", status: str = "draft"
+    ) -> str:
+        """Write a reading's interpretation; returns the markdown file"""
+        with self._lock:
+            md_file, mtime_ns = self._write_markdown(reading_id, interpretation)
+            now = datetime.now().isoformat()
+            entry = {
+                "reading_id": reading_id,
+                "interpretation": interpretation,
+                "notes": notes,
+                "status": status,
+                "created_at": now,
+                "updated_at": now,
+                "markdown_file": md_file,
+            }
+            self._write_metadata(entry)
+            # Append-only history, kept as a backup
+            with open(os.path.join(self.interpretations_dir, "all_interpretations.jsonl"), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._index_interpretation(reading_id, status, interpretation, notes, mtime_ns)
+        return md_file
+
+    def set_status(self, reading_id: str, status: str) -> bool:
+        """Set a reading's status; returns False if it had no metadata yet"""
+        if status not in STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(STATUSES)}")
+        json_file = os.path.join(self.interpretations_dir, f"{reading_id}.json")
+        with self._lock:
+            existed = os.path.exists(json_file)
+            if existed:
+                with open(json_file, "r") as f:
+                    entry = json.load(f)
+                entry["status"] = status
+                entry["updated_at"] = datetime.now().isoformat()
+            else:
+                now = datetime.now().isoformat()
+                entry = {
+                    "reading_id": reading_id,
+                    "interpretation": "",
+                    "notes": "",
+                    "status": status,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            self._write_metadata(entry)
+            self._index_interpretation(reading_id, status)
+        return existed
+
+    def add_reading(
+        self,
+        reading: Dict[str, Any],
+        placeholder: Optional[Callable[[str], str]] = None,
+    ) -> str:
+        """
+        Append a reading to all_readings.json under the next free id
+
+        The id is allocated, and the files and index written, under one
+        lock and one write transaction, so concurrent creates (also from
+        other workers sharing the index) never get the same id.
+
+        Args:
+            reading: The reading, without reading_id
+            placeholder: Called with the new id for a placeholder interpretation
+
+        Returns:
+            The new reading_id
+        """
+        self.refresh()
+        with self._lock:
+            # Taking the write lock first serialises creates across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                reading_id = self._create_reading(reading, placeholder)
+                self._save_fingerprint()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return reading_id
+
+    def _create_reading(
+        self, reading: Dict[str, Any], placeholder: Optional[Callable[[str], str]]
+    ) -> str:
+        with open(self.readings_path, "r") as f:
+            data = json.load(f)
+        dataset = data["tarot_reading_dataset"]
+        # The file is the source of truth; the index may not have seen an
+        # edit to it yet
+        taken = [
+            int(existing["reading_id"][1:])
+            for existing in dataset["readings"]
+            if existing.get("reading_id", "")[1:].isdigit()
+        ]
+        indexed = self._conn.execute(
+            "SELECT MAX(CAST(SUBSTR(reading_id, 2) AS INTEGER)) FROM readings"
+        ).fetchone()[0]
+        number = max(taken + [indexed or 0]) + 1
+        # Never write a placeholder over a stray interpretation file
+        while os.path.exists(
+            os.path.join(self.readings_dir, markdown_filename(f"R{number:03d}"))
+        ):
+            number += 1
+        reading_id = f"R{number:03d}"
+        reading = {"reading_id": reading_id, **reading}
+
+        dataset["readings"].append(reading)
+        metadata = dataset["metadata"]
+        metadata["total_readings"] = len(dataset["readings"])
+        if reading_source(reading) == "common":
+            metadata["common_readings"] += 1
+        else:
+            metadata["special_readings"] += 1
+        with open(self.readings_path, "w") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+        mtime_ns = None
+        text = None
+        if placeholder is not None:
+            text = placeholder(reading_id)
+            _, mtime_ns = self._write_markdown(reading_id, text)
+
+        position = self._conn.execute(
+            "SELECT COALESCE(MAX(position), -1) + 1 FROM readings"
+        ).fetchone()[0]
+        self._conn.execute(
+            "INSERT INTO readings VALUES (?, ?, ?, ?, 'not_started', ?, ?)",
+            (
+                reading_id,
+                position,
+                reading_source(reading),
+                reading.get("question_category", ""),
+                1 if mtime_ns is not None else 0,
+                json.dumps(reading, ensure_ascii=False),
+            ),
+        )
+        if text is not None:
+            self._conn.execute(
+                "INSERT INTO interpretations (reading_id, interpretation, markdown_mtime_ns)"
+                " VALUES (?, ?, ?) ON CONFLICT (reading_id) DO UPDATE SET"
+                " interpretation = excluded.interpretation,"
+                " markdown_mtime_ns = excluded.markdown_mtime_ns",
+                (reading_id, text, mtime_ns),
+            )
+        return reading_id
+
+    def export_path(self, name: str) -> str:
+        """
+        The directory under exports_dir that an export called name goes to
+
+        Raises ValueError if name is empty or resolves outside exports_dir
+        (an absolute path, "..", or a symlink out of it).
+        """
+        if not name or not name.strip():
+            raise ValueError("Export name must not be empty")
+        root = os.path.realpath(self.exports_dir)
+        path = os.path.realpath(os.path.join(root, name))
+        if path == root or os.path.commonpath([root, path]) != root:
+            raise ValueError(f"Export name must be a directory inside {EXPORTS_DIRNAME}/")
+        return path
+
+    def export_files(self, data_dir: str) -> int:
+        """
+        Write the indexed data to data_dir in the same layout
+
+        readings/all_readings.json, readings/reading_NNN.md for readings with
+        interpretation text and interpretations/RNNN.json for their metadata.
+        Returns the number of readings written.
+        """
+        self.refresh()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT r.data, r.source, r.status, i.reading_id AS has_entry,"
+                " i.interpretation, i.notes, i.created_at, i.updated_at"
+                " FROM readings r LEFT JOIN interpretations i USING (reading_id)"
+                " ORDER BY r.position"
+            ).fetchall()
+
+        readings_dir = os.path.join(data_dir, "readings")
+        interpretations_dir = os.path.join(data_dir, "interpretations")
+        os.makedirs(readings_dir, exist_ok=True)
+        os.makedirs(interpretations_dir, exist_ok=True)
+
+        readings = []
+        for row in rows:
+            reading = json.loads(row["data"])
+            readings.append(reading)
+            if row["has_entry"] is None:
+                continue
+            reading_id = reading["reading_id"]
+            md_file = os.path.join(readings_dir, markdown_filename(reading_id))
+            if row["interpretation"]:
+                with open(md_file, "w") as f:
+                    f.write(row["interpretation"])
+            with open(os.path.join(interpretations_dir, f"{reading_id}.json"), "w") as f:
+                json.dump(
+                    {
+                        "reading_id": reading_id,
+                        "interpretation": row["interpretation"],
+                        "notes": row["notes"],
+                        "status": row["status"],
+                        "created_at": row["created_at"],
+                        "updated_at": row["updated_at"],
+                        "markdown_file": md_file if row["interpretation"] else None,
+                    },
+                    f,
+                    indent=2,
+                )
+
+        try:
+            with open(self.readings_path, "r") as f:
+                metadata = json.load(f)["tarot_reading_dataset"]["metadata"]
+        except (OSError, ValueError, KeyError):
+            metadata = {}
+        metadata.update(
+            total_readings=len(readings),
+            common_readings=sum(1 for r in rows if r["source"] == "common"),
+            special_readings=sum(1 for r in rows if r["source"] == "special"),
+        )
+        with open(os.path.join(readings_dir, "all_readings.json"), "w") as f:
+            json.dump(
+                {"tarot_reading_dataset": {"metadata": metadata, "readings": readings}},
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        return len(readings)
+
+
+# Global store instance
+_training_store_instance = None
+_training_store_lock = threading.Lock()
+
+
+def get_training_store() -> TrainingStore:
+    """Get the global training data store instance"""
+    global _training_store_instance
+    with _training_store_lock:
+        if _training_store_instance is None:
+            _training_store_instance = TrainingStore()
+        return _training_store_instance
@@ -0,0 +1,88 @@
+"""
+Contention benchmark for concurrent readings.
+
+Runs the same set of readings serially and from a thread pool, checks that
+every threaded reading matches its serial reference, and reports throughput
+per thread count. The legacy mode replays the old module-level
+``random.seed``/``random.shuffle`` pipeline to show the corruption that a
+shared generator causes under contention.
+
+Readings are pure Python, so on a GIL build the threads share one core and
+scaling stays near 1x. Per-reading generators share no state, so on a
+free-threaded build (python3.13t) throughput scales with the thread count.
+
+Usage:
+    python benchmarks/bench_concurrency.py --readings 20000 --threads 1 2 4 8
+"""
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from arcanum.reading import ReadingService  # noqa: E402
+from arcanum.shuffle import ShuffleService  # noqa: E402
+from arcanum.spreads import CelticCrossSpread  # noqa: E402
+
+
+def _legacy_reading(cards: list, seed: int, count: int) -> tuple:
+    """The pre-fix pipeline: global seed, global shuffle, global reversals."""
+    shuffled = cards.copy()
+    random.seed(seed)
+    random.shuffle(shuffled)
+    return tuple((card.name, random.random() < 0.5) for card in shuffled[:count])
+
+
+def _run(fn, questions: list[str], threads: int) -> tuple[list, float]:
+    start = time.perf_counter()
+    if threads == 1:
+        results = [fn(q) for q in questions]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(fn, questions, chunksize=64))
+    return results, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--readings", type=int, default=20000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    reader = ReadingService(cache_size=0)
+    spread = CelticCrossSpread()
+    cards = reader.deck.get_cards()
+    questions = [f"Question {i}" for i in range(args.readings)]
+
+    def per_reading_rng(question: str) -> tuple:
+        reading = reader.perform_reading(question, spread)
+        return tuple((c.card.name, c.reversed) for c in reading.cards)
+
+    def shared_global_rng(question: str) -> tuple:
+        seed = ShuffleService.generate_seed(question, 7)
+        return _legacy_reading(cards, seed, spread.card_count)
+
+    # Switch often so the legacy race shows up quickly
+    sys.setswitchinterval(1e-6)
+
+    for label, fn in (
+        ("per-reading rng", per_reading_rng),
+        ("legacy global rng", shared_global_rng),
+    ):
+        reference, serial_time = _run(fn, questions, 1)
+        print(f"\n{label}")
+        print(f"{'threads':>8} {'readings/s':>12} {'scaling':>8} {'mismatches':>11}")
+        for threads in args.threads:
+            results, elapsed = _run(fn, questions, threads)
+            mismatches = sum(a != b for a, b in zip(results, reference))
+            rate = len(questions) / elapsed
+            scaling = serial_time / elapsed
+            print(f"{threads:>8} {rate:>12,.0f} {scaling:>7.2f}x {mismatches:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Core benchmark suite for the arcanum package.
+
+Measures ops/sec and allocations per call for deck construction, seeding,
+shuffling, drawing, a full reading for every spread and reading formatting.
+
+Usage:
+    python benchmarks/bench_core.py
+    python benchmarks/bench_core.py --output results/0.1.0.json
+    python benchmarks/bench_core.py --compare results/0.1.0.json
+    python benchmarks/bench_core.py --filter perform_reading
+"""
+
+import argparse
+from typing import Any, Callable
+
+from harness import compare_results, measure, print_results, save_results
+
+from arcanum import batch
+from arcanum.deck import Deck
+from arcanum.drawing import DrawingService
+from arcanum.reading import ReadingService
+from arcanum.shuffle import ShuffleService
+from arcanum.spreads import SpreadLayout, get_spread_registry
+
+QUESTION = "What should I focus on in my career this month?"
+
+
+def _spreads() -> list[SpreadLayout]:
+    return list(get_spread_registry())
+
+
+def build_cases() -> list[tuple[str, Callable[[], Any]]]:
+    deck = Deck()
+    cards = deck.get_cards()
+    seed = ShuffleService.generate_seed(QUESTION, 7)
+    shuffled = ShuffleService.shuffle_cards(cards, seed)
+    drawer = DrawingService()
+    uncached = ReadingService(cache_size=0)
+    cached = ReadingService()
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("Deck()", Deck),
+        ("Deck.get_cards", deck.get_cards),
+        (
+            "ShuffleService.generate_seed",
+            lambda: ShuffleService.generate_seed(QUESTION, 7),
+        ),
+        (
+            "ShuffleService.shuffle_cards",
+            lambda: ShuffleService.shuffle_cards(cards, seed),
+        ),
+        (
+            "ShuffleService.riffle_shuffle[7]",
+            lambda: ShuffleService.riffle_shuffle(cards, 7, seed),
+        ),
+        (
+            "ShuffleService.riffle_shuffle[21]",
+            lambda: ShuffleService.riffle_shuffle(cards, 21, seed),
+        ),
+        (
+            "DrawingService.draw_cards[10]",
+            lambda: drawer.draw_cards(
+                shuffled, 10, rng=ShuffleService.create_rng(seed)
+            ),
+        ),
+    ]
+
+    if batch.NUMPY_AVAILABLE:
+        import numpy as np
+
+        seeds = np.arange(1000, dtype=np.uint32) * 2654435761
+        cases.append(
+            (
+                "ShuffleService.riffle_indices[21] x1000",
+                lambda: ShuffleService.riffle_indices(seeds, len(cards), 10, 21, 0.5),
+            )
+        )
+
+    for spread in _spreads():
+        cases.append(
+            (
+                f"perform_reading[{spread.name}]",
+                lambda spread=spread: uncached.perform_reading(QUESTION, spread),
+            )
+        )
+        cases.append(
+            (
+                f"perform_reading[{spread.name}] cached",
+                lambda spread=spread: cached.perform_reading(QUESTION, spread),
+            )
+        )
+
+    for spread in _spreads():
+        reading = uncached.perform_reading(QUESTION, spread)
+        cases.append((f"Reading.__str__[{spread.name}]", reading.__str__))
+
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Compare with a previous JSON results file")
+    parser.add_argument("--filter", default="", help="Only run matching benchmarks")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = [
+        measure(name, fn, min_time=args.min_time)
+        for name, fn in build_cases()
+        if args.filter in name
+    ]
+    print_results(results)
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare_results(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Draw benchmark: full legacy shuffle versus partial Fisher-Yates.
+
+Times shuffle + draw for k = 1, 3, 10 and 12 cards with both engines. The
+legacy engine shuffles all 78 cards and takes the top k; the partial engine
+runs k Fisher-Yates steps over an index array.
+
+Usage:
+    python benchmarks/bench_draw.py --number 20000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from arcanum.deck import Deck  # noqa: E402
+from arcanum.drawing import DrawingService  # noqa: E402
+from arcanum.shuffle import ShuffleService  # noqa: E402
+
+COUNTS = [1, 3, 10, 12]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    deck = Deck()
+    drawer = DrawingService()
+
+    def legacy(count: int, seed: int) -> None:
+        rng = ShuffleService.create_rng(seed)
+        shuffled = ShuffleService.shuffle_cards(deck.get_cards(), seed, rng)
+        drawer.draw_cards(shuffled, count, rng=rng)
+
+    def partial(count: int, seed: int) -> None:
+        rng = ShuffleService.create_rng(seed)
+        drawn = ShuffleService.partial_shuffle(deck.cards, count, seed, rng)
+        drawer.draw_cards(drawn, count, rng=rng)
+
+    print(f"{'k':>3} {'legacy us':>10} {'partial us':>11} {'speedup':>8}")
+    for count in COUNTS:
+        timings = {}
+        for label, fn in (("legacy", legacy), ("partial", partial)):
+            best = min(
+                timeit.repeat(
+                    lambda: fn(count, 123456789),
+                    number=args.number,
+                    repeat=args.repeat,
+                )
+            )
+            timings[label] = best / args.number * 1e6
+        speedup = timings["legacy"] / timings["partial"]
+        print(
+            f"{count:>3} {timings['legacy']:>10.2f} {timings['partial']:>11.2f}"
+            f" {speedup:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
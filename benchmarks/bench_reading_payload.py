@@ -0,0 +1,117 @@
+"""
+Reading response size benchmark: full versus slim views.
+
+For one reading of every spread, builds the /api/reading/cards response body
+in the full view, the slim view with prompts (include_prompt=true) and the
+slim view without them, then reports serialized bytes, gzipped bytes and
+serialization time. Also times the prompt generation that a slim response
+without prompts skips.
+
+Needs the backend's dependencies (tiktoken) for the reading generator.
+
+Usage:
+    python benchmarks/bench_reading_payload.py --number 200
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT / "backend" / "services"))
+
+from arcanum.reading import ReadingService  # noqa: E402
+from prompt_engineer import ReadingStyle, ReadingTone  # noqa: E402
+from reading_generator import ReadingRequest, TarotReadingGenerator  # noqa: E402
+from reading_views import FULL_VIEW, SLIM_VIEW, prompt_dict  # noqa: E402
+from services.card_catalog import DEFAULT_ENHANCED_CARDS_PATH, get_card_catalog  # noqa: E402
+from services.spreads_config_service import get_spreads_config_service  # noqa: E402
+
+
+def _serialize(body: dict) -> bytes:
+    # What JSONResponse does
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _body(reading, cards: list, full_prompt, slim: bool) -> dict:
+    body = {
+        "question": reading.question,
+        "spread_name": reading.spread.name,
+        "cards": cards,
+        "timestamp": reading.timestamp.isoformat(),
+        "shuffle_count": reading.shuffle_count,
+        "seed": reading.seed,
+        "interpretation": None,
+        "full_prompt": full_prompt,
+        "ai_response": None,
+    }
+    if slim:
+        body = {key: value for key, value in body.items() if value is not None}
+    return body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spreads_config = get_spreads_config_service()
+    catalog = get_card_catalog()
+    generator = TarotReadingGenerator(
+        cards_json_path=DEFAULT_ENHANCED_CARDS_PATH,
+        spreads_config_path=spreads_config.config_path,
+    )
+    reader = ReadingService(cache_size=0)
+
+    def best_us(fn, number: int) -> float:
+        return min(timeit.repeat(fn, number=number, repeat=args.repeat)) / number * 1e6
+
+    print(
+        f"{'spread':<26} {'view':<12} {'bytes':>8} {'gzip':>7}"
+        f" {'dumps us':>9} {'prompt us':>10}"
+    )
+    for spread in spreads_config.registry:
+        reading = reader.perform_reading(f"What does {spread.name} show?", spread)
+        cards = [
+            {
+                "name": drawn.card.name,
+                "position": spread.position_names[index],
+                "reversed": drawn.reversed,
+                "image_url": catalog.image_url(drawn.card.name),
+            }
+            for index, drawn in enumerate(reading.cards)
+        ]
+        request = ReadingRequest(
+            question=reading.question,
+            spread_id=spread.id,
+            cards_with_positions=[(c["name"], c["reversed"], c["position"]) for c in cards],
+            style=ReadingStyle.DEFAULT,
+            tone=ReadingTone.DEFAULT,
+        )
+        generated = generator.generate_reading_prompt(request)
+        prompt_us = best_us(
+            lambda: generator.generate_reading_prompt(request), max(args.number // 20, 1)
+        )
+
+        views = [
+            ("full", _body(reading, cards, prompt_dict(generated, FULL_VIEW), False), prompt_us),
+            ("slim+prompt", _body(reading, cards, prompt_dict(generated, SLIM_VIEW), True), prompt_us),
+            ("slim", _body(reading, cards, None, True), 0.0),
+        ]
+        for label, body, prompt_cost in views:
+            data = _serialize(body)
+            dumps_us = best_us(lambda: _serialize(body), args.number)
+            print(
+                f"{spread.id:<26} {label:<12} {len(data):>8,} {len(gzip.compress(data)):>7,}"
+                f" {dumps_us:>9.1f} {prompt_cost:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Small benchmark harness shared by the benchmark scripts.
+
+Each case is timed with timeit (best of several repeats) and then run once
+under tracemalloc to record peak and retained allocations per call.
+Results can be written to JSON and compared with an earlier run.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    us_per_op: float
+    peak_bytes: int
+    alloc_blocks: int
+    alloc_bytes: int
+
+
+def measure(
+    name: str, fn: Callable[[], Any], min_time: float = 0.2, repeat: int = 5
+) -> BenchmarkResult:
+    """
+    Time a zero-argument callable and record its allocations
+
+    Args:
+        name: Case name used in reports
+        fn: The operation to measure
+        min_time: Minimum seconds per timing repeat
+        repeat: Number of timing repeats (the best one is kept)
+    """
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    number = max(number, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    # One warm call first so lazy caches don't count as allocations
+    fn()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+
+    stats = after.compare_to(before, "lineno")
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=1.0 / best,
+        us_per_op=best * 1e6,
+        peak_bytes=peak,
+        alloc_blocks=sum(s.count_diff for s in stats if s.count_diff > 0),
+        alloc_bytes=sum(s.size_diff for s in stats if s.size_diff > 0),
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    width = max(len(r.name) for r in results)
+    print(
+        f"{'benchmark':<{width}} {'ops/sec':>12} {'us/op':>10}"
+        f" {'peak B':>9} {'blocks':>7} {'bytes':>8}"
+    )
+    for r in results:
+        print(
+            f"{r.name:<{width}} {r.ops_per_sec:>12,.0f} {r.us_per_op:>10.2f}"
+            f" {r.peak_bytes:>9,} {r.alloc_blocks:>7,} {r.alloc_bytes:>8,}"
+        )
+
+
+def save_results(results: list[BenchmarkResult], path: str) -> None:
+    data = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": [asdict(r) for r in results],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def compare_results(results: list[BenchmarkResult], baseline_path: str) -> None:
+    """Print speed and allocation changes against a saved run"""
+    with open(baseline_path) as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+
+    print(f"\nCompared with {baseline_path}:")
+    width = max(len(r.name) for r in results)
+    print(f"{'benchmark':<{width}} {'speed':>8} {'peak B':>10}")
+    for r in results:
+        old = baseline.get(r.name)
+        if old is None:
+            print(f"{r.name:<{width}} {'new':>8}")
+            continue
+        speed = r.ops_per_sec / old["ops_per_sec"]
+        peak = r.peak_bytes - old["peak_bytes"]
+        print(f"{r.name:<{width}} {speed:>7.2f}x {peak:>+10,}")
@@ -48,9 +48,18 @@ export function DevMode() {
 
   const loadReadings = async () => {
     try {
-      const response = await fetch('/api/dev/training-readings')
-      const data = await response.json()
-      setReadings(data.readings)
+      // The list comes in pages: follow next_cursor to the last one
+      const allReadings: TrainingReading[] = []
+      let cursor: number | null = null
+      do {
+        const params = new URLSearchParams({ limit: '500' })
+        if (cursor !== null) params.set('cursor', String(cursor))
+        const response = await fetch(`/api/dev/training-readings?${params}`)
+        const data = await response.json()
+        allReadings.push(...data.readings)
+        cursor = data.next_cursor
+      } while (cursor !== null)
+      setReadings(allReadings)
     } catch (error) {
       console.error('Failed to load readings:', error)
     } finally {
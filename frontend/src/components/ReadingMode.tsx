@@ -29,6 +29,24 @@ interface ReadingModeProps {
 // MLX Tabbed Section Component
 function MLXTabbedSection({ reading }: { reading: any }) {
   const [activeTab, setActiveTab] = useState('interpretation')
+  const [prompts, setPrompts] = useState<{ system_prompt: string, user_prompt: string } | null>(null)
+  const promptId = reading.full_prompt?.prompt_id
+
+  // Readings come with a prompt id only; fetch the text when a prompt tab is opened
+  useEffect(() => {
+    setPrompts(null)
+  }, [promptId])
+
+  useEffect(() => {
+    if (activeTab !== 'user-prompt' && activeTab !== 'system-prompt') return
+    if (prompts || !promptId || reading.full_prompt?.user_prompt) return
+    axios.get(`http://127.0.0.1:8000/api/prompts/${promptId}`)
+      .then(response => setPrompts(response.data))
+      .catch(error => console.error('Failed to load prompts:', error))
+  }, [activeTab, promptId, prompts, reading.full_prompt])
+
+  const userPrompt = reading.full_prompt?.user_prompt ?? prompts?.user_prompt ?? 'Loading prompt...'
+  const systemPrompt = reading.full_prompt?.system_prompt ?? prompts?.system_prompt ?? 'Loading prompt...'
   
   const tabs = [
     { id: 'interpretation', label: 'AI Reading', icon: '🔮' },
@@ -117,7 +135,7 @@ function MLXTabbedSection({ reading }: { reading: any }) {
           <div>
             <h4 className="text-lg font-semibold text-slate-100 mb-4">User Prompt</h4>
             <pre className="text-sm text-slate-300 whitespace-pre-wrap bg-slate-800/50 rounded-lg p-4 overflow-x-auto">
-              {reading.full_prompt.user_prompt}
+              {userPrompt}
             </pre>
           </div>
         )}
@@ -126,7 +144,7 @@ function MLXTabbedSection({ reading }: { reading: any }) {
           <div>
             <h4 className="text-lg font-semibold text-slate-100 mb-4">System Prompt</h4>
             <pre className="text-sm text-slate-300 whitespace-pre-wrap bg-slate-800/50 rounded-lg p-4 overflow-x-auto">
-              {reading.full_prompt.system_prompt}
+              {systemPrompt}
             </pre>
           </div>
         )}
@@ -160,6 +178,7 @@ export function ReadingMode({
   }, [selectedSpread, onSpreadChange])
 
   const callCardsAPI = async (question: string, spreadType: string, includeDateInSeed: boolean = false, rhythmData: number[] = []) => {
+    // The server keeps the prompts it generates; ask for their id only
     const response = await axios.post(
       'http://127.0.0.1:8000/api/reading/cards',
       {
@@ -168,17 +187,17 @@ export function ReadingMode({
         shuffle_count: 7,
         include_date: includeDateInSeed,
         rhythm: rhythmData.length > 0 ? rhythmData : null
-      }
+      },
+      { params: { view: 'slim', prompt_handle: true } }
     )
     return response.data
   }
 
-  const callAIInterpretationAPI = async (systemPrompt: string, userPrompt: string) => {
+  const callAIInterpretationAPI = async (promptId: string) => {
     const response = await axios.post(
       'http://127.0.0.1:8000/api/reading/ai-interpretation',
       {
-        system_prompt: systemPrompt,
-        user_prompt: userPrompt,
+        prompt_id: promptId,
         max_tokens: 2000,
         temperature: 0.7,
         top_p: 0.9
@@ -202,15 +221,23 @@ export function ReadingMode({
       console.log('Cards drawn successfully')
       
       // Phase 2: Generate AI interpretation (slow) - only if we have prompts
-      if (cardsResult.full_prompt?.system_prompt && cardsResult.full_prompt?.user_prompt) {
+      if (cardsResult.full_prompt?.prompt_id) {
         setAiLoading(true)
         console.log('Generating AI interpretation...')
         
         try {
-          const aiResult = await callAIInterpretationAPI(
-            cardsResult.full_prompt.system_prompt,
-            cardsResult.full_prompt.user_prompt
-          )
+          let aiResult
+          try {
+            aiResult = await callAIInterpretationAPI(cardsResult.full_prompt.prompt_id)
+          } catch (error) {
+            if (!axios.isAxiosError(error) || error.response?.status !== 404) throw error
+            // The stored prompt has expired: the same question draws the same
+            // cards, so draw again for a fresh prompt id
+            console.log('Prompt expired, drawing again...')
+            const redrawn = await callCardsAPI(question, selectedSpread.id, includeDate, rhythm)
+            setReading(redrawn)
+            aiResult = await callAIInterpretationAPI(redrawn.full_prompt.prompt_id)
+          }
           
           // Update reading with AI response
           setReading(prev => ({
@@ -271,7 +271,12 @@ export class StoryTarotService {
         // rhythm field omitted when not needed (undefined is acceptable for Optional fields)
       };
 
-      const response = await axios.post<ReadingResponse>(`${this.baseURL}/api/reading/cards`, request);
+      // Stories only use the cards: the slim view skips building prompts
+      const response = await axios.post<ReadingResponse>(
+        `${this.baseURL}/api/reading/cards`,
+        request,
+        { params: { view: 'slim' } }
+      );
 
       let cards = response.data.cards;
 
@@ -513,7 +518,8 @@ export class StoryTarotService {
           // Draw new cards to get alternatives
           const redrawResponse = await axios.post<ReadingResponse>(
             `${this.baseURL}/api/reading/cards`,
-            originalRequest
+            originalRequest,
+            { params: { view: 'slim' } }
           );
 
           const newCards = redrawResponse.data.cards;
@@ -0,0 +1,225 @@
+"""
+Vectorized replay of the shuffle/draw pipeline for many seeds at once.
+
+ShuffleService and DrawingService use Python's Mersenne Twister, so a batch
+can only match the single-reading path card for card if it reproduces that
+exact random stream. This module runs N independent MT19937 generators side
+by side in NumPy and replays ``random.shuffle`` and ``random.random`` on top
+of them.
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# MT19937 parameters (match CPython's _randommodule.c)
+_N = 624
+_M = 397
+_MATRIX_A = 0x9908B0DF
+_UPPER_MASK = 0x80000000
+_LOWER_MASK = 0x7FFFFFFF
+
+# Streams are processed in chunks so the (624 x N) state stays small
+DEFAULT_CHUNK_SIZE = 16384
+
+
+def require_numpy() -> None:
+    """Raise a helpful error when NumPy is not installed."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "Batch readings require NumPy. Install it with: pip install arcanum[fast]"
+        )
+
+
+def _init_genrand_base() -> list[int]:
+    """State produced by init_genrand(19650218), shared by every seed."""
+    mt = [19650218]
+    for i in range(1, _N):
+        prev = mt[i - 1]
+        mt.append((1812433253 * (prev ^ (prev >> 30)) + i) & 0xFFFFFFFF)
+    return mt
+
+
+_BASE_STATE = _init_genrand_base()
+
+
+def _seed_states(seeds: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorized init_by_array for 32-bit seeds, as done by ``random.seed(int)``.
+
+    Returns a (624, N) uint32 state array, one column per seed. uint32
+    arithmetic wraps, which stands in for the ``& 0xffffffff`` of the C code.
+    """
+    key = np.asarray(seeds, dtype=np.uint32)
+    mt = np.empty((_N, len(key)), dtype=np.uint32)
+    mt[:] = np.array(_BASE_STATE, dtype=np.uint32)[:, None]
+    scratch = np.empty(len(key), dtype=np.uint32)
+
+    def mix_row(i: int, multiplier: int) -> None:
+        np.right_shift(mt[i - 1], 30, out=scratch)
+        np.bitwise_xor(scratch, mt[i - 1], out=scratch)
+        np.multiply(scratch, multiplier, out=scratch)
+        np.bitwise_xor(mt[i], scratch, out=mt[i])
+
+    i = 1
+    for _ in range(_N):
+        mix_row(i, 1664525)
+        np.add(mt[i], key, out=mt[i])
+        i += 1
+        if i >= _N:
+            mt[0] = mt[_N - 1]
+            i = 1
+
+    for _ in range(_N - 1):
+        mix_row(i, 1566083941)
+        np.subtract(mt[i], i, out=mt[i])
+        i += 1
+        if i >= _N:
+            mt[0] = mt[_N - 1]
+            i = 1
+
+    mt[0] = _UPPER_MASK
+    return mt
+
+
+# The twist is split into row ranges that only read rows already final at
+# that point, as (first row, end row, first source row). Draws rarely get
+# past the first range, so the remaining ones are computed on demand.
+_TWIST_STEPS = (
+    (0, _N - _M, _M),
+    (_N - _M, 2 * (_N - _M), 0),
+    (2 * (_N - _M), _N - 1, _N - _M),
+    (_N - 1, _N, _M - 1),
+)
+
+
+def _twist_rows(mt: "np.ndarray", start: int, end: int, source: int) -> None:
+    """Regenerate rows [start, end) of a (624, N) state block in place."""
+    if end == _N:
+        # The last row wraps around to the freshly twisted first row
+        following = np.concatenate((mt[start + 1 : end], mt[:1]))
+    else:
+        following = mt[start + 1 : end + 1]
+    y = (mt[start:end] & _UPPER_MASK) | (following & _LOWER_MASK)
+    mag = (y & 1) * np.uint32(_MATRIX_A)
+    mt[start:end] = mt[source : source + (end - start)] ^ (y >> 1) ^ mag
+
+
+def _temper(y: "np.ndarray") -> "np.ndarray":
+    y = y ^ (y >> 11)
+    y ^= (y << 7) & np.uint32(0x9D2C5680)
+    y ^= (y << 15) & np.uint32(0xEFC60000)
+    y ^= y >> 18
+    return y
+
+
+class _StreamBuffer:
+    """Tempered MT19937 outputs for N streams, each read at its own offset."""
+
+    def __init__(self, seeds: "np.ndarray"):
+        self._state = _seed_states(seeds)
+        self._step = 0
+        self._blocks: list["np.ndarray"] = []
+        self.outputs = np.empty((0, len(seeds)), dtype=np.uint32)
+        self.columns = np.arange(len(seeds))
+        self.offsets = np.zeros(len(seeds), dtype=np.int64)
+
+    def _extend(self) -> None:
+        start, end, source = _TWIST_STEPS[self._step]
+        _twist_rows(self._state, start, end, source)
+        self._blocks.append(_temper(self._state[start:end]))
+        self.outputs = np.concatenate(self._blocks)
+        self._step = (self._step + 1) % len(_TWIST_STEPS)
+
+    def _ensure(self, needed: int) -> None:
+        while int(self.offsets.max()) + needed > len(self.outputs):
+            self._extend()
+
+    def next_uint32(self, rows: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """Take one output per stream (or per selected stream)."""
+        self._ensure(1)
+        if rows is None:
+            values = self.outputs[self.offsets, self.columns]
+            self.offsets += 1
+        else:
+            values = self.outputs[self.offsets[rows], rows]
+            self.offsets[rows] += 1
+        return values
+
+    def randbelow(self, n: int) -> "np.ndarray":
+        """Replay ``Random._randbelow(n)`` across all streams."""
+        shift = 32 - n.bit_length()
+        values = self.next_uint32() >> shift
+        rejected = np.flatnonzero(values >= n)
+        while len(rejected):
+            values[rejected] = self.next_uint32(rejected) >> shift
+            rejected = rejected[values[rejected] >= n]
+        return values
+
+    def random(self) -> "np.ndarray":
+        """Replay ``Random.random()`` across all streams."""
+        a = (self.next_uint32() >> 5).astype(np.float64)
+        b = (self.next_uint32() >> 6).astype(np.float64)
+        return (a * 67108864.0 + b) * (1.0 / 9007199254740992.0)
+
+
+def draw_indices(
+    seeds: "np.ndarray",
+    deck_size: int,
+    count: int,
+    reversal_chance: float,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    full_shuffle: bool = True,
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Shuffle and draw for every seed at once.
+
+    Args:
+        seeds: 32-bit seeds, one per reading
+        deck_size: Number of cards in the deck being shuffled
+        count: Number of cards drawn per reading
+        reversal_chance: Probability a card will be drawn reversed
+        chunk_size: Maximum number of generators held in memory at a time
+        full_shuffle: Replay ShuffleService.shuffle_cards. When False, replay
+            ShuffleService.partial_shuffle instead.
+
+    Returns:
+        (N x count) uint8 array of deck indices and (N x count) bool reversal mask
+    """
+    require_numpy()
+    if count > deck_size:
+        raise ValueError(f"Cannot draw {count} cards from {deck_size} available")
+
+    seeds = np.asarray(seeds, dtype=np.uint32)
+    indices = np.empty((len(seeds), count), dtype=np.uint8)
+    reversals = np.empty((len(seeds), count), dtype=bool)
+
+    for start in range(0, len(seeds), chunk_size):
+        stop = min(start + chunk_size, len(seeds))
+        stream = _StreamBuffer(seeds[start:stop])
+        rows = stream.columns
+
+        deck = np.tile(np.arange(deck_size, dtype=np.uint8), (stop - start, 1))
+        if full_shuffle:
+            # Same swaps as random.shuffle, applied to an index array
+            steps = [(i, stream.randbelow(i + 1)) for i in range(deck_size - 1, 0, -1)]
+        else:
+            # Same swaps as the forward partial Fisher-Yates
+            steps = [(i, i + stream.randbelow(deck_size - i)) for i in range(count)]
+
+        for i, j in steps:
+            swapped = deck[rows, j]
+            deck[rows, j] = deck[:, i]
+            deck[:, i] = swapped
+
+        indices[start:stop] = deck[:, :count]
+        for position in range(count):
+            reversals[start:stop, position] = stream.random() < reversal_chance
+
+    return indices, reversals
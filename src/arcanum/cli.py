@@ -1,21 +1,33 @@
+import argparse
+import json
 from arcanum.reading import ReadingService
-from arcanum.spreads import (
-    SpreadLayout,
-    SingleCardSpread,
-    ThreeCardSpread,
-    CelticCrossSpread,
-)
-from typing import Type
+from arcanum.spreads import SpreadLayout, get_spread_registry
+import os
+import sys
+from typing import Optional
+
+# Short keys for the common spreads; any registry id is accepted as well
+SPREAD_SHORTCUTS: dict[str, str] = {
+    "1": "single-focus",
+    "3": "past-present-future",
+    "celtic": "celtic-cross",
+}
+
+
+def spread_choices() -> dict[str, SpreadLayout]:
+    """Spreads selectable by shortcut or id, shared by the reader and subcommands"""
+    registry = get_spread_registry()
+    choices = {
+        key: registry.get(spread_id) for key, spread_id in SPREAD_SHORTCUTS.items()
+    }
+    choices.update((spread.id, spread) for spread in registry)
+    return choices
 
 
 class TarotCLI:
     def __init__(self) -> None:
         self.reader = ReadingService()
-        self.spreads: dict[str, Type[SpreadLayout]] = {
-            "1": SingleCardSpread,
-            "3": ThreeCardSpread,
-            "celtic": CelticCrossSpread,
-        }
+        self.spreads: dict[str, SpreadLayout] = spread_choices()
 
     def run(self) -> None:
         """Main CLI loop."""
@@ -77,14 +89,14 @@ class TarotCLI:
     def _choose_spread(self) -> SpreadLayout:
         """Let user choose spread type."""
         print("\nChoose your spread:")
-        for key, spread_class in self.spreads.items():
-            spread_instance = spread_class()
-            print(f"{key} - {str(spread_instance.name)}")
+        shortcuts = {spread_id: key for key, spread_id in SPREAD_SHORTCUTS.items()}
+        for spread in self.reader.spreads:
+            print(f"{shortcuts.get(spread.id, spread.id)} - {spread.name}")
 
         choice = input("Choice: ").strip().lower()
 
         if choice in self.spreads:
-            return self.spreads[choice]()
+            return self.spreads[choice]
         else:
             print("Invalid choice. Please try again.\n")
             return self._choose_spread()
@@ -125,8 +137,114 @@ class TarotCLI:
         return choice in ["y", "yes"]
 
 
-def main():
+def run_stats(args: argparse.Namespace) -> None:
+    """Run the Monte Carlo distribution audit and print its report"""
+    from arcanum.stats import analyze
+
+    spread = spread_choices()[args.spread]
+    report = analyze(
+        samples=args.samples,
+        spread_size=spread.card_count,
+        shuffle_count=args.shuffle_count,
+        reversal_chance=args.reversal_chance,
+        full_shuffle=not args.partial_shuffle,
+        workers=args.workers,
+    )
+
+    print(f"Spread: {spread.name}")
+    print(report.summary())
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    """Stream JSONL readings for JSONL questions"""
+    from arcanum.streaming import stream_readings
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    try:
+        for output in stream_readings(
+            source,
+            spreads=spread_choices(),
+            default_spread=args.spread,
+            shuffle_count=args.shuffle_count,
+            include_date=args.include_date,
+            reversal_chance=args.reversal_chance,
+            workers=args.workers or os.cpu_count() or 1,
+            chunk_size=args.chunk_size,
+        ):
+            sys.stdout.write(output)
+            sys.stdout.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="arcanum",
+        description="Arcanum tarot reader. Run without a command for interactive readings.",
+    )
+    commands = parser.add_subparsers(dest="command")
+    spreads = spread_choices()
+
+    stats = commands.add_parser(
+        "stats", help="Audit card, position and reversal frequencies"
+    )
+    stats.add_argument("--samples", type=int, default=1_000_000)
+    stats.add_argument("--spread", choices=list(spreads), default="celtic")
+    stats.add_argument("--shuffle-count", type=int, default=7)
+    stats.add_argument("--reversal-chance", type=float, default=0.5)
+    stats.add_argument(
+        "--partial-shuffle",
+        action="store_true",
+        help="Audit the partial shuffle instead of the legacy full shuffle",
+    )
+    stats.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores)",
+    )
+    stats.add_argument("--json", help="Also write the report to this JSON file")
+    stats.set_defaults(handler=run_stats)
+
+    batch = commands.add_parser(
+        "batch", help="Read JSONL questions and write JSONL readings"
+    )
+    batch.add_argument(
+        "input", nargs="?", default="-", help="JSONL file of questions (default: stdin)"
+    )
+    batch.add_argument(
+        "--spread", choices=list(spreads), default="3", help="Default spread"
+    )
+    batch.add_argument("--shuffle-count", type=int, default=7)
+    batch.add_argument("--include-date", action="store_true")
+    batch.add_argument("--reversal-chance", type=float, default=0.5)
+    batch.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores)",
+    )
+    batch.add_argument(
+        "--chunk-size", type=int, default=4096, help="Lines per unit of work"
+    )
+    batch.set_defaults(handler=run_batch)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None):
     """Entry point for the CLI"""
+    args = build_parser().parse_args(argv)
+    if args.command:
+        args.handler(args)
+        return
+
     cli = TarotCLI()
     cli.run()
 
@@ -3,7 +3,7 @@ from arcanum.card import Card, ArcanaType
 
 class Deck:
     def __init__(self) -> None:
-        self.cards = self._create_standard_deck()
+        self.cards = list(STANDARD_CARDS)
 
     def get_cards(self) -> list[Card]:
         """Return a copy of all cards. Keeps deck immutable."""
@@ -72,3 +72,24 @@ class Deck:
                 cards.append(Card(name, ArcanaType.MINOR, raw_number + 11, suit))
 
         return cards
+
+
+# Canonical card ids: position in the standard deck order, 0-77.
+# Majors are 0-21, then Wands, Cups, Swords and Pentacles (Ace to King).
+STANDARD_CARDS: tuple[Card, ...] = tuple(Deck._create_standard_deck())
+_CARD_IDS: dict[Card, int] = {card: i for i, card in enumerate(STANDARD_CARDS)}
+
+
+def get_card_id(card: Card) -> int:
+    """Canonical 0-77 id for a card."""
+    try:
+        return _CARD_IDS[card]
+    except KeyError:
+        raise ValueError(f"Not a standard deck card: {card}") from None
+
+
+def get_card_by_id(card_id: int) -> Card:
+    """Card for a canonical 0-77 id."""
+    if not 0 <= card_id < len(STANDARD_CARDS):
+        raise ValueError(f"Card id out of range: {card_id}")
+    return STANDARD_CARDS[card_id]
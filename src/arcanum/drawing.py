@@ -1,5 +1,5 @@
 import random
-from typing import Optional
+from typing import Optional, Sequence
 from arcanum.card import Card
 from arcanum.drawn_card import DrawnCard
 
@@ -16,7 +16,9 @@ class DrawingService:
         self,
         shuffled_cards: list[Card],
         count: int,
-        positions: Optional[list[str]] = None,
+        positions: Optional[Sequence[str]] = None,
+        *,
+        rng: random.Random,
     ) -> list[DrawnCard]:
         """
         Draw cards from shuffled deck, applying reversal logic
@@ -25,6 +27,9 @@ class DrawingService:
             shuffled_cards: Pre-shuffled list of cards
             count: Number of cards to draw
             positions: Optional position names (e.g., ["Past", "Present", "Future"])
+            rng: The generator used for the shuffle, from
+                ShuffleService.create_rng(seed). Reversals continue its
+                stream, so the same seed gives the same reversals.
         """
         if count > len(shuffled_cards):
             raise ValueError(
@@ -35,8 +40,8 @@ class DrawingService:
         for i in range(count):
             card = shuffled_cards[i]
 
-            # Determine if reversed (uses existing random state from shuffle)
-            is_reversed = random.random() < self.reversal_chance
+            # Determine if reversed (continues the shuffle's random stream)
+            is_reversed = rng.random() < self.reversal_chance
 
             # Get position name if provided
             position = positions[i] if positions and i < len(positions) else None
@@ -1,9 +1,16 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 from arcanum.card import Card
+from arcanum.deck import get_card_by_id, get_card_id
 
+# Packed layout (16 bits): position index << 8 | reversed << 7 | card id
+_CARD_ID_MASK = 0x7F
+_REVERSED_BIT = 0x80
+_POSITION_SHIFT = 8
+NO_POSITION = 0xFF
 
-@dataclass
+
+@dataclass(slots=True)
 class DrawnCard:
     card: Card
     reversed: bool = False
@@ -17,6 +24,48 @@ class DrawnCard:
             name += " (Reversed)"
         return name
 
+    def pack(self, position_index: Optional[int] = None) -> int:
+        """
+        Encode as one 16-bit integer: card id, reversed bit and position index
+
+        Args:
+            position_index: Index of this card's position in the spread, or
+                None if the card has no position
+        """
+        if position_index is None:
+            position_index = NO_POSITION
+        elif not 0 <= position_index < NO_POSITION:
+            raise ValueError(f"Position index out of range: {position_index}")
+
+        value = get_card_id(self.card) | (position_index << _POSITION_SHIFT)
+        if self.reversed:
+            value |= _REVERSED_BIT
+        return value
+
+    @classmethod
+    def unpack(
+        cls, value: int, position_names: Optional[Sequence[str]] = None
+    ) -> "DrawnCard":
+        """
+        Decode a value made by pack()
+
+        Args:
+            value: The packed card
+            position_names: Position names of the spread the card was drawn for
+        """
+        position_index = value >> _POSITION_SHIFT
+        position = None
+        if position_index != NO_POSITION:
+            if not position_names or position_index >= len(position_names):
+                raise ValueError(f"No position name for index {position_index}")
+            position = position_names[position_index]
+
+        return cls(
+            card=get_card_by_id(value & _CARD_ID_MASK),
+            reversed=bool(value & _REVERSED_BIT),
+            position=position,
+        )
+
     def __str__(self) -> str:
         """Pretty string representation"""
         result = self.display_name
@@ -1,10 +1,77 @@
+import struct
+import sys
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
-from arcanum.deck import Deck
-from arcanum.shuffle import ShuffleService
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence, Union
+from arcanum import batch
+from arcanum.rhythm import combine_seeds, rhythm_seed
+from arcanum.cache import LRUCache
+from arcanum.card import Card
+from arcanum.deck import Deck, STANDARD_CARDS
+from arcanum.shuffle import ShuffleAlgorithm, ShuffleService
 from arcanum.drawing import DrawingService
 from arcanum.drawn_card import DrawnCard
-from arcanum.spreads import SpreadLayout
+from arcanum.spreads import (
+    SpreadLayout,
+    SpreadRegistry,
+    get_spread_registry,
+    spread_key,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Packed reading: header, one uint16 per card, then the UTF-8 question.
+# Timestamps are stored as microseconds of naive wall-clock time.
+PACKED_FORMAT_VERSION = 1
+_PACKED_HEADER = struct.Struct("<BIHqB")
+_EPOCH = datetime(1970, 1, 1)
+
+# Seed record: everything needed to draw the cards again, in 16 bytes.
+# version, algorithm, shuffle_count, seed, spread key, reversal chance in
+# units of 1/10000, and the day of the reading (days since 1970-01-01).
+SEED_RECORD_VERSION = 1
+SEED_RECORD_SIZE = 16
+_SEED_RECORD = struct.Struct("<BBHIIHH")
+_REVERSAL_SCALE = 10000
+
+_STANDARD_DECK = list(STANDARD_CARDS)
+
+
+def draw_spread(
+    seed: int,
+    spread: SpreadLayout,
+    algorithm: ShuffleAlgorithm = ShuffleAlgorithm.FULL_SHUFFLE,
+    reversal_chance: float = 0.5,
+    cards: Optional[list[Card]] = None,
+    shuffle_count: int = 7,
+) -> list[DrawnCard]:
+    """
+    Shuffle and draw the cards of a spread for a seed. Deterministic.
+
+    Args:
+        seed: Reading seed from ShuffleService.generate_seed
+        spread: The spread layout being drawn
+        algorithm: Shuffle/draw version to replay
+        reversal_chance: Probability a card is drawn reversed
+        cards: Deck to draw from (default: the standard deck)
+        shuffle_count: Shuffle count of the reading (the number of riffles
+            for ShuffleAlgorithm.RIFFLE)
+    """
+    if cards is None:
+        cards = _STANDARD_DECK
+
+    # One generator per reading, shared by the shuffle and the draw
+    rng = ShuffleService.create_rng(seed, algorithm)
+    shuffled_cards = ShuffleService.shuffle_for(
+        algorithm, cards, spread.card_count, seed, rng, shuffle_count
+    )
+    return DrawingService(reversal_chance).draw_cards(
+        shuffled_cards, spread.card_count, spread.position_names, rng=rng
+    )
 
 
 @dataclass
@@ -15,6 +82,8 @@ class Reading:
     timestamp: datetime
     shuffle_count: int
     seed: int
+    algorithm: ShuffleAlgorithm = ShuffleAlgorithm.FULL_SHUFFLE
+    reversal_chance: float = 0.5
 
     def __str__(self) -> str:
         """Pretty formatted reading"""
@@ -29,39 +98,330 @@ class Reading:
 
         return "\n".join(lines)
 
+    def pack_cards(self) -> array:
+        """Drawn cards as an array('H') of DrawnCard.pack() values"""
+        position_indices = self.spread.position_indices
+        return array(
+            "H",
+            (
+                card.pack(position_indices[card.position] if card.position else None)
+                for card in self.cards
+            ),
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact binary form of the reading
+
+        The spread is not stored; pass the same spread to from_bytes().
+        """
+        cards = self.pack_cards()
+        if sys.byteorder == "big":
+            cards.byteswap()
+
+        timestamp = (self.timestamp - _EPOCH) // timedelta(microseconds=1)
+        header = _PACKED_HEADER.pack(
+            PACKED_FORMAT_VERSION,
+            self.seed,
+            self.shuffle_count,
+            timestamp,
+            len(cards),
+        )
+        return header + cards.tobytes() + self.question.encode("utf-8")
+
+    @classmethod
+    def from_bytes(cls, data: bytes, spread: SpreadLayout) -> "Reading":
+        """Rebuild a reading made by to_bytes()"""
+        version, seed, shuffle_count, timestamp, count = _PACKED_HEADER.unpack_from(
+            data
+        )
+        if version != PACKED_FORMAT_VERSION:
+            raise ValueError(f"Unsupported packed reading version: {version}")
+
+        cards_end = _PACKED_HEADER.size + 2 * count
+        cards = array("H", data[_PACKED_HEADER.size : cards_end])
+        if sys.byteorder == "big":
+            cards.byteswap()
+
+        position_names = spread.position_names
+        return cls(
+            question=data[cards_end:].decode("utf-8"),
+            spread=spread,
+            cards=[DrawnCard.unpack(value, position_names) for value in cards],
+            timestamp=_EPOCH + timedelta(microseconds=timestamp),
+            shuffle_count=shuffle_count,
+            seed=seed,
+        )
+
+    def to_seed_bytes(self) -> bytes:
+        """
+        16-byte record the cards can be drawn again from
+
+        Stores the seed, spread id, reversal chance, algorithm version, shuffle
+        count and date, but not the question or the cards themselves. The
+        seed is the little-endian uint32 at offset 4, for indexing.
+        """
+        if self.spread.id is None:
+            raise ValueError(f"Spread {self.spread.name!r} has no registry id")
+
+        reversal = round(self.reversal_chance * _REVERSAL_SCALE)
+        if reversal / _REVERSAL_SCALE != self.reversal_chance:
+            raise ValueError(
+                f"Reversal chance {self.reversal_chance} needs more than 4 decimals"
+            )
+
+        return _SEED_RECORD.pack(
+            SEED_RECORD_VERSION,
+            self.algorithm,
+            self.shuffle_count,
+            self.seed,
+            spread_key(self.spread.id),
+            reversal,
+            (self.timestamp.date() - _EPOCH.date()).days,
+        )
+
+
+class LazyReading(Reading):
+    """
+    A reading rebuilt from a seed record.
+
+    The cards are drawn again from the seed the first time they are accessed.
+    The question is not part of the record, and the timestamp is midnight on
+    the day of the reading.
+    """
+
+    def __init__(
+        self,
+        question: str,
+        spread: SpreadLayout,
+        timestamp: datetime,
+        shuffle_count: int,
+        seed: int,
+        algorithm: ShuffleAlgorithm = ShuffleAlgorithm.FULL_SHUFFLE,
+        reversal_chance: float = 0.5,
+    ):
+        self.question = question
+        self.spread = spread
+        self.timestamp = timestamp
+        self.shuffle_count = shuffle_count
+        self.seed = seed
+        self.algorithm = algorithm
+        self.reversal_chance = reversal_chance
+
+    @cached_property
+    def cards(self) -> list[DrawnCard]:
+        return draw_spread(
+            self.seed,
+            self.spread,
+            self.algorithm,
+            self.reversal_chance,
+            shuffle_count=self.shuffle_count,
+        )
+
+    @classmethod
+    def from_seed_bytes(
+        cls,
+        data: bytes,
+        spreads: Optional[SpreadRegistry] = None,
+        question: str = "",
+    ) -> "LazyReading":
+        """
+        Rebuild a reading from Reading.to_seed_bytes()
+
+        Args:
+            data: The 16-byte record
+            spreads: Registry the spread id is looked up in (default: shared)
+            question: Question to attach, if it is known from elsewhere
+        """
+        version, algorithm, shuffle_count, seed, key, reversal, day = (
+            _SEED_RECORD.unpack_from(data)
+        )
+        if version != SEED_RECORD_VERSION:
+            raise ValueError(f"Unsupported seed record version: {version}")
+
+        if spreads is None:
+            spreads = get_spread_registry()
+
+        return cls(
+            question=question,
+            spread=spreads.get_by_key(key),
+            timestamp=_EPOCH + timedelta(days=day),
+            shuffle_count=shuffle_count,
+            seed=seed,
+            algorithm=ShuffleAlgorithm(algorithm),
+            reversal_chance=reversal / _REVERSAL_SCALE,
+        )
+
+
+@dataclass
+class ReadingBatch:
+    """
+    Many readings of one spread, stored as arrays instead of objects.
+
+    Row i holds reading i: ``card_indices[i]`` are positions in the deck's
+    card list and ``reversals[i]`` flags which of those cards are reversed.
+    Individual readings are only built as ``Reading`` objects on access.
+    """
+
+    questions: list[str]
+    spread: SpreadLayout
+    seeds: "np.ndarray"
+    card_indices: "np.ndarray"
+    reversals: "np.ndarray"
+    timestamp: datetime
+    shuffle_count: int
+    deck_cards: list[Card]
+    algorithm: ShuffleAlgorithm = ShuffleAlgorithm.FULL_SHUFFLE
+    reversal_chance: float = 0.5
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __getitem__(self, index: int) -> Reading:
+        """Materialize a single reading"""
+        cards = [
+            DrawnCard(self.deck_cards[card_index], bool(is_reversed), position)
+            for card_index, is_reversed, position in zip(
+                self.card_indices[index],
+                self.reversals[index],
+                self.spread.position_names,
+            )
+        ]
+
+        return Reading(
+            question=self.questions[index],
+            spread=self.spread,
+            cards=cards,
+            timestamp=self.timestamp,
+            shuffle_count=self.shuffle_count,
+            seed=int(self.seeds[index]),
+            algorithm=self.algorithm,
+            reversal_chance=self.reversal_chance,
+        )
+
+    def __iter__(self) -> Iterator[Reading]:
+        for index in range(len(self)):
+            yield self[index]
+
 
 class ReadingService:
-    def __init__(self, reversal_chance: float = 0.5):
+    def __init__(
+        self,
+        reversal_chance: float = 0.5,
+        legacy_shuffle: bool = True,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        spreads: Optional[SpreadRegistry] = None,
+        algorithm: Optional[ShuffleAlgorithm] = None,
+    ):
+        """
+        Args:
+            reversal_chance: Probability a card will be drawn reversed (0.0 to 1.0)
+            legacy_shuffle: Shuffle the whole deck before drawing, which keeps
+                the cards existing seeds have always produced. When False only
+                the cards the spread needs are shuffled (faster, but a given
+                seed draws different cards).
+            cache_size: Number of recent readings remembered (0 disables caching)
+            cache_ttl: Lifetime of cached readings in seconds (None = no limit).
+                Daily readings always expire at local midnight.
+            spreads: Registry used to look up spreads given by id (default:
+                the shared registry from get_spread_registry())
+            algorithm: Shuffle/draw version to use. Overrides legacy_shuffle;
+                by default FULL_SHUFFLE when legacy_shuffle is set, otherwise
+                PARTIAL_SHUFFLE.
+        """
         self.deck = Deck()
         self.drawing_service = DrawingService(reversal_chance)
+        if algorithm is None:
+            algorithm = (
+                ShuffleAlgorithm.FULL_SHUFFLE
+                if legacy_shuffle
+                else ShuffleAlgorithm.PARTIAL_SHUFFLE
+            )
+        self.algorithm = ShuffleAlgorithm(algorithm)
+        self.cache = LRUCache(maxsize=cache_size, ttl=cache_ttl)
+        self._spreads = spreads
+
+    @property
+    def spreads(self) -> SpreadRegistry:
+        if self._spreads is None:
+            self._spreads = get_spread_registry()
+        return self._spreads
+
+    def get_spread(self, spread: Union[SpreadLayout, str]) -> SpreadLayout:
+        """Resolve a spread id through the registry; layouts pass through"""
+        if isinstance(spread, str):
+            return self.spreads.get(spread)
+        return spread
 
     def perform_reading(
         self,
         question: str,
-        spread: SpreadLayout,
+        spread: Union[SpreadLayout, str],
         shuffle_count: int = 7,
         include_date: bool = False,
+        algorithm: Optional[ShuffleAlgorithm] = None,
+        rhythm: Optional[Sequence[float]] = None,
     ) -> Reading:
         """
         Perform a complete tarot reading
 
         Args:
             question: The question being asked
-            spread: The spread layout to use
+            spread: The spread layout to use, or its registry id
             shuffle_count: Number of shuffles (affects randomness)
             include_date: Whether to include today's date in the seed
+            algorithm: Shuffle/draw version for this reading (default: the
+                service's algorithm)
+            rhythm: Tapped intervals in milliseconds, mixed into the seed
         """
-        # Generate seed from question and shuffle count
-        seed = ShuffleService.generate_seed(question, shuffle_count, include_date)
+        spread = self.get_spread(spread)
+        algorithm = self.algorithm if algorithm is None else algorithm
+        tapped = rhythm_seed(rhythm) if rhythm is not None and len(rhythm) else None
+        position_names = spread.position_names
+
+        # A reading is fully determined by these, so repeats come from the cache
+        today = date.today()
+        cache_key = (
+            question.lower().strip(),
+            shuffle_count,
+            today.isoformat() if include_date else None,
+            spread.name,
+            position_names,
+            self.drawing_service.reversal_chance,
+            algorithm,
+            tapped,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            seed, packed_cards = cached
+            return Reading(
+                question=question,
+                spread=spread,
+                cards=[DrawnCard.unpack(v, position_names) for v in packed_cards],
+                timestamp=datetime.now(),
+                shuffle_count=shuffle_count,
+                seed=seed,
+                algorithm=algorithm,
+                reversal_chance=self.drawing_service.reversal_chance,
+            )
 
-        # Get and shuffle the cards
-        cards = self.deck.get_cards()
-        shuffled_cards = ShuffleService.shuffle_cards(cards, seed)
+        # Generate seed from question and shuffle count
+        # Same date as the cache key, even if midnight has passed since
+        seed = ShuffleService.generate_seed(
+            question, shuffle_count, include_date, today=today
+        )
+        if tapped is not None:
+            seed = combine_seeds(seed, tapped)
 
-        # Draw cards for the spread
-        position_names = [pos.name for pos in spread.positions]
-        drawn_cards = self.drawing_service.draw_cards(
-            shuffled_cards, spread.card_count, position_names
+        # Shuffle and draw the cards for the spread
+        drawn_cards = draw_spread(
+            seed,
+            spread,
+            algorithm,
+            self.drawing_service.reversal_chance,
+            self.deck.cards,
+            shuffle_count,
         )
 
         # Create the reading
@@ -72,6 +432,83 @@ class ReadingService:
             timestamp=datetime.now(),
             shuffle_count=shuffle_count,
             seed=seed,
+            algorithm=algorithm,
+            reversal_chance=self.drawing_service.reversal_chance,
         )
 
+        # Daily readings change at midnight, so drop them then
+        expires_at = None
+        if include_date:
+            midnight = datetime.combine(today + timedelta(days=1), dt_time.min)
+            expires_at = midnight.timestamp()
+        self.cache.put(cache_key, (seed, reading.pack_cards()), expires_at)
+
         return reading
+
+    def perform_readings_batch(
+        self,
+        questions: list[str],
+        spread: Union[SpreadLayout, str],
+        shuffle_count: int = 7,
+        include_date: bool = False,
+        algorithm: Optional[ShuffleAlgorithm] = None,
+        rhythms: Optional[Sequence[Optional[Sequence[float]]]] = None,
+    ) -> ReadingBatch:
+        """
+        Perform one reading per question in a single vectorized pass
+
+        Produces exactly the cards and reversals perform_reading would give
+        for each question. Requires NumPy.
+
+        Args:
+            questions: The questions being asked
+            spread: The spread layout used for every reading, or its registry id
+            shuffle_count: Number of shuffles (affects randomness)
+            include_date: Whether to include today's date in the seeds
+            algorithm: Shuffle/draw version for these readings (default: the
+                service's algorithm)
+            rhythms: One tapped rhythm (or None) per question
+        """
+        batch.require_numpy()
+        spread = self.get_spread(spread)
+        algorithm = self.algorithm if algorithm is None else algorithm
+        import numpy as np
+
+        seeds = np.array(
+            ShuffleService.generate_seeds(
+                questions, shuffle_count, include_date, rhythms
+            ),
+            dtype=np.uint32,
+        )
+
+        deck_cards = self.deck.get_cards()
+        reversal_chance = self.drawing_service.reversal_chance
+        if algorithm == ShuffleAlgorithm.RIFFLE:
+            card_indices, reversals = ShuffleService.riffle_indices(
+                seeds,
+                len(deck_cards),
+                spread.card_count,
+                shuffle_count,
+                reversal_chance,
+            )
+        else:
+            card_indices, reversals = batch.draw_indices(
+                seeds,
+                len(deck_cards),
+                spread.card_count,
+                reversal_chance,
+                full_shuffle=algorithm == ShuffleAlgorithm.FULL_SHUFFLE,
+            )
+
+        return ReadingBatch(
+            questions=list(questions),
+            spread=spread,
+            seeds=seeds,
+            card_indices=card_indices,
+            reversals=reversals,
+            timestamp=datetime.now(),
+            shuffle_count=shuffle_count,
+            deck_cards=deck_cards,
+            algorithm=algorithm,
+            reversal_chance=reversal_chance,
+        )
@@ -0,0 +1,195 @@
+"""
+Seeds from tapped rhythms.
+
+The TappingRhythm component sends the intervals between taps in
+milliseconds. Each interval is quantized to QUANTUM_MS, with long pauses
+capped at MAX_INTERVAL_MS, so the same rhythm always gives the same seed.
+The quantized intervals are hashed position by position with SplitMix64 and
+folded together with three summary features:
+
+- tap count
+- tempo: beats per minute from the mean interval
+- jitter: standard deviation of the intervals relative to their mean,
+  in thousandths
+
+Everything is computed from running integer totals, so a rhythm can be fed
+in chunks of any size with constant memory and the result doesn't depend
+on how it was split. NumPy handles the chunks when it is installed; the
+pure-Python path gives the same seeds.
+"""
+
+import math
+from itertools import islice
+from typing import Iterable, Optional, Sequence
+
+from arcanum import batch
+from arcanum.shuffle import _GOLDEN_GAMMA, _MASK_64, _MIX_1, _MIX_2, _mix64
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+QUANTUM_MS = 10
+MAX_INTERVAL_MS = 10_000
+DEFAULT_CHUNK_SIZE = 65536
+
+_MAX_STEP = MAX_INTERVAL_MS // QUANTUM_MS
+_MASK_32 = 0xFFFFFFFF
+
+
+def _mix64_array(z: "np.ndarray") -> "np.ndarray":
+    """SplitMix64 finalizer on a uint64 array (arithmetic wraps)"""
+    z = z ^ (z >> np.uint64(30))
+    z *= np.uint64(_MIX_1)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(_MIX_2)
+    return z ^ (z >> np.uint64(31))
+
+
+def _quantize(intervals: "np.ndarray") -> "np.ndarray":
+    steps = np.rint(np.asarray(intervals, dtype=np.float64) / QUANTUM_MS)
+    return np.clip(steps, 0, _MAX_STEP).astype(np.uint64)
+
+
+def _quantize_one(interval: float) -> int:
+    # round-half-even, like np.rint
+    return min(max(round(interval / QUANTUM_MS), 0), _MAX_STEP)
+
+
+def _features(count: int, total: int, total_sq: int) -> tuple[int, int]:
+    """Tempo (bpm) and jitter (permille) from integer totals of steps"""
+    if count == 0 or total == 0:
+        return 0, 0
+    mean = total / count
+    variance = max(total_sq / count - mean * mean, 0.0)
+    tempo = round(60_000 / (mean * QUANTUM_MS))
+    jitter = round(1000 * math.sqrt(variance) / mean)
+    return tempo, jitter
+
+
+def _finish(count: int, total: int, total_sq: int, digest: int) -> int:
+    tempo, jitter = _features(count, total, total_sq)
+    features = (count & 0xFFFFFF) << 40 | (tempo & 0xFFFFF) << 20 | (jitter & 0xFFFFF)
+    return _mix64(digest ^ _mix64(features)) & _MASK_32
+
+
+class RhythmHasher:
+    """
+    Incremental rhythm seed. Feed intervals with update(), read seed().
+
+    Memory use doesn't grow with the number of taps.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.total_sq = 0
+        self.digest = 0
+
+    def update(self, intervals: Sequence[float]) -> None:
+        """Add the next intervals, in milliseconds"""
+        if batch.NUMPY_AVAILABLE:
+            self._update_numpy(intervals)
+        else:
+            self._update_python(intervals)
+
+    def _update_numpy(self, intervals: Sequence[float]) -> None:
+        steps = _quantize(intervals)
+        if steps.size == 0:
+            return
+        positions = np.arange(
+            self.count + 1, self.count + steps.size + 1, dtype=np.uint64
+        )
+        hashes = _mix64_array(positions * np.uint64(_GOLDEN_GAMMA) ^ steps)
+
+        self.digest ^= int(np.bitwise_xor.reduce(hashes))
+        self.count += int(steps.size)
+        self.total += int(steps.sum())
+        self.total_sq += int((steps * steps).sum())
+
+    def _update_python(self, intervals: Sequence[float]) -> None:
+        for interval in intervals:
+            step = _quantize_one(interval)
+            self.count += 1
+            self.digest ^= _mix64(((self.count * _GOLDEN_GAMMA) & _MASK_64) ^ step)
+            self.total += step
+            self.total_sq += step * step
+
+    @property
+    def tempo(self) -> int:
+        """Beats per minute, from the mean interval"""
+        return _features(self.count, self.total, self.total_sq)[0]
+
+    @property
+    def jitter(self) -> int:
+        """Interval standard deviation relative to the mean, in permille"""
+        return _features(self.count, self.total, self.total_sq)[1]
+
+    def seed(self) -> int:
+        """32-bit seed for everything added so far"""
+        return _finish(self.count, self.total, self.total_sq, self.digest)
+
+
+def rhythm_seed(
+    intervals: Iterable[float], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    32-bit seed for one rhythm
+
+    Args:
+        intervals: Milliseconds between taps. Arrays and lists are read in
+            slices; other iterables are consumed chunk by chunk.
+        chunk_size: Intervals hashed at a time
+    """
+    hasher = RhythmHasher()
+    if hasattr(intervals, "__getitem__") and hasattr(intervals, "__len__"):
+        for start in range(0, len(intervals), chunk_size):
+            hasher.update(intervals[start : start + chunk_size])
+    else:
+        iterator = iter(intervals)
+        while chunk := list(islice(iterator, chunk_size)):
+            hasher.update(chunk)
+    return hasher.seed()
+
+
+def rhythm_seeds(rhythms: Sequence[Optional[Sequence[float]]]) -> list[Optional[int]]:
+    """
+    Seeds for many rhythms in one vectorized pass
+
+    Same values as rhythm_seed for each rhythm. Empty or missing rhythms
+    give None. Requires NumPy.
+    """
+    batch.require_numpy()
+
+    lengths = np.array([len(r) if r is not None else 0 for r in rhythms], dtype=np.intp)
+    present = np.flatnonzero(lengths)
+    seeds: list[Optional[int]] = [None] * len(rhythms)
+    if present.size == 0:
+        return seeds
+
+    steps = _quantize(np.concatenate([np.asarray(rhythms[i]) for i in present]))
+    used = lengths[present]
+    starts = np.concatenate(([0], np.cumsum(used)[:-1]))
+
+    # 1-based position of each interval within its own rhythm
+    positions = np.arange(steps.size, dtype=np.uint64) - np.repeat(starts, used).astype(
+        np.uint64
+    )
+    positions += np.uint64(1)
+    hashes = _mix64_array(positions * np.uint64(_GOLDEN_GAMMA) ^ steps)
+
+    digests = np.bitwise_xor.reduceat(hashes, starts)
+    totals = np.add.reduceat(steps, starts)
+    totals_sq = np.add.reduceat(steps * steps, starts)
+
+    for index, count, total, total_sq, digest in zip(
+        present, used, totals, totals_sq, digests
+    ):
+        seeds[index] = _finish(int(count), int(total), int(total_sq), int(digest))
+    return seeds
+
+
+def combine_seeds(seed: int, rhythm: int) -> int:
+    """Mix a rhythm seed into a question seed"""
+    return _mix64((seed & _MASK_32) << 32 | (rhythm & _MASK_32)) & _MASK_32
@@ -1,16 +1,92 @@
 import hashlib
 import random
 
+from arcanum import batch
 from arcanum.card import Card
 from datetime import date
+from enum import IntEnum
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# SplitMix64 constants
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_MIX_1 = 0xBF58476D1CE4E5B9
+_MIX_2 = 0x94D049BB133111EB
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+# Decks riffled together; small enough that the working arrays stay in cache
+RIFFLE_CHUNK_SIZE = 256
+
+
+class ShuffleAlgorithm(IntEnum):
+    """
+    Versions of the shuffle/draw procedure.
+
+    The value is stored with persisted readings, so once released a version
+    must keep drawing the same cards for the same seed. Changes to how cards
+    are drawn get a new version instead.
+    """
+
+    # Shuffle the whole deck, then draw from the top (the original behaviour)
+    FULL_SHUFFLE = 1
+    # Forward Fisher-Yates over only the cards the spread needs
+    PARTIAL_SHUFFLE = 2
+    # shuffle_count Gilbert-Shannon-Reeds riffles of a deck in standard order
+    RIFFLE = 3
+
+
+def _mix64(z: int) -> int:
+    z = ((z ^ (z >> 30)) * _MIX_1) & _MASK_64
+    z = ((z ^ (z >> 27)) * _MIX_2) & _MASK_64
+    return z ^ (z >> 31)
+
+
+class SplitMix64:
+    """
+    SplitMix64 generator for the riffle shuffle.
+
+    Output i is a pure function of (seed, i), so the vectorized engine can
+    compute any output directly instead of stepping through the stream.
+    Only what DrawingService needs (random()) is provided besides raw words.
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed & _MASK_64
+        self.index = 0
+
+    def next_uint64(self) -> int:
+        self.index += 1
+        return _mix64((self.seed + self.index * _GOLDEN_GAMMA) & _MASK_64)
+
+    def random(self) -> float:
+        """Float in [0, 1) from the top 53 bits of the next word"""
+        return (self.next_uint64() >> 11) * 2.0**-53
+
+
+def _riffle_words(deck_size: int) -> int:
+    """64-bit words of randomness used by one riffle"""
+    return (deck_size + 63) // 64
 
 
 class ShuffleService:
     @staticmethod
     def generate_seed(
-        question: str, shuffle_count: int, include_date: bool = False
+        question: str,
+        shuffle_count: int,
+        include_date: bool = False,
+        rhythm: Optional[Sequence[float]] = None,
+        today: Optional[date] = None,
     ) -> int:
-        """Generate deterministic seed from question and shuffle count."""
+        """
+        Generate deterministic seed from question and shuffle count.
+
+        A tapped rhythm (intervals in milliseconds, see arcanum.rhythm) is
+        mixed in when given; an empty rhythm changes nothing. `today` is the
+        date used with include_date (default: the current date), for
+        callers that read the date once for other uses too.
+        """
         # Clean the question for consistency
         clean_question = question.lower().strip()
 
@@ -18,7 +94,7 @@ class ShuffleService:
         combined = f"{clean_question}|{shuffle_count}"
 
         if include_date:
-            today = date.today().isoformat()
+            today = (today or date.today()).isoformat()
             combined = f"{combined}|{today}"
 
         # Create hash and convert to integer seed
@@ -26,16 +102,285 @@ class ShuffleService:
         # Use first 8 hex characters and convert to int
         seed = int(hash_object.hexdigest()[:8], 16)
 
+        if rhythm is not None and len(rhythm):
+            from arcanum.rhythm import combine_seeds, rhythm_seed
+
+            seed = combine_seeds(seed, rhythm_seed(rhythm))
+
         return seed
 
     @staticmethod
-    def shuffle_cards(cards: list[Card], seed: int) -> list[Card]:
-        """Shuffle cards using the given seed. Deterministic."""
+    def generate_seeds(
+        questions: list[str],
+        shuffle_count: int,
+        include_date: bool = False,
+        rhythms: Optional[Sequence[Optional[Sequence[float]]]] = None,
+        today: Optional[date] = None,
+    ) -> list[int]:
+        """
+        Generate seeds for many questions at once. Same values as generate_seed.
+
+        `rhythms`, when given, holds one rhythm (or None) per question.
+        """
+        suffix = f"|{shuffle_count}"
+        if include_date:
+            suffix = f"{suffix}|{(today or date.today()).isoformat()}"
+
+        # First 4 digest bytes == first 8 hex characters
+        seeds = [
+            int.from_bytes(
+                hashlib.sha256(
+                    f"{question.lower().strip()}{suffix}".encode("utf-8")
+                ).digest()[:4],
+                "big",
+            )
+            for question in questions
+        ]
+
+        if rhythms is not None:
+            from arcanum.rhythm import combine_seeds, rhythm_seed, rhythm_seeds
+
+            if batch.NUMPY_AVAILABLE:
+                rhythm_values = rhythm_seeds(rhythms)
+            else:
+                rhythm_values = [
+                    rhythm_seed(r) if r is not None and len(r) else None for r in rhythms
+                ]
+            seeds = [
+                seed if value is None else combine_seeds(seed, value)
+                for seed, value in zip(seeds, rhythm_values)
+            ]
+
+        return seeds
+
+    @staticmethod
+    def create_rng(
+        seed: int, algorithm: ShuffleAlgorithm = ShuffleAlgorithm.FULL_SHUFFLE
+    ) -> Union[random.Random, SplitMix64]:
+        """Create the per-reading generator for a seed."""
+        if algorithm == ShuffleAlgorithm.RIFFLE:
+            return SplitMix64(seed)
+        return random.Random(seed)
+
+    @staticmethod
+    def shuffle_cards(
+        cards: list[Card], seed: int, rng: Optional[random.Random] = None
+    ) -> list[Card]:
+        """
+        Shuffle cards using the given seed. Deterministic.
+
+        Args:
+            cards: Cards to shuffle (not modified)
+            seed: Seed for the shuffle, used when no generator is given
+            rng: Per-reading generator created with create_rng(seed). Pass it
+                on to DrawingService.draw_cards so reversals continue the
+                same stream.
+        """
         # Copy so we don't modify the original
         shuffled = cards.copy()
 
-        # Set the seed for reproducable shuffling
-        random.seed(seed)
-        random.shuffle(shuffled)
+        # Private generator so concurrent readings can't disturb each other
+        if rng is None:
+            rng = ShuffleService.create_rng(seed)
+        rng.shuffle(shuffled)
 
         return shuffled
+
+    @staticmethod
+    def partial_shuffle(
+        cards: list[Card], count: int, seed: int, rng: Optional[random.Random] = None
+    ) -> list[Card]:
+        """
+        Draw only the top `count` cards of a shuffle. Deterministic.
+
+        Runs `count` steps of a forward Fisher-Yates shuffle over deck indices
+        instead of shuffling every card. The result is a uniformly random
+        draw, but not the same cards shuffle_cards gives for the same seed.
+
+        Args:
+            cards: Cards to draw from (not modified)
+            count: Number of cards needed
+            seed: Seed for the shuffle, used when no generator is given
+            rng: Per-reading generator created with create_rng(seed)
+        """
+        if count > len(cards):
+            raise ValueError(f"Cannot draw {count} cards from {len(cards)} available")
+
+        if rng is None:
+            rng = ShuffleService.create_rng(seed)
+
+        size = len(cards)
+        indices = list(range(size))
+        for i in range(count):
+            j = rng.randrange(i, size)
+            indices[i], indices[j] = indices[j], indices[i]
+
+        return [cards[index] for index in indices[:count]]
+
+    @staticmethod
+    def riffle_shuffle(
+        cards: list[Card],
+        riffles: int,
+        seed: int,
+        rng: Optional[SplitMix64] = None,
+    ) -> list[Card]:
+        """
+        Riffle shuffle `riffles` times. Deterministic.
+
+        Each riffle follows the Gilbert-Shannon-Reeds model: every position of
+        the new deck independently takes its card from the left or right
+        half with probability 1/2, which cuts the deck binomially and drops
+        cards from each half in proportion to its size. A few riffles leave
+        the deck visibly ordered; around seven mix a 78 card deck well.
+
+        Args:
+            cards: Cards in their starting order (not modified)
+            riffles: Number of riffles
+            seed: Seed for the shuffle, used when no generator is given
+            rng: Generator created with create_rng(seed, ShuffleAlgorithm.RIFFLE)
+        """
+        if rng is None:
+            rng = SplitMix64(seed)
+
+        size = len(cards)
+        words = _riffle_words(size)
+        deck = list(cards)
+        for _ in range(riffles):
+            # Bit p says whether position p takes the next card of the right half
+            bits = 0
+            for word in range(words):
+                bits |= rng.next_uint64() << (64 * word)
+            bits &= (1 << size) - 1
+
+            cut = size - bits.bit_count()
+            left = iter(deck[:cut])
+            right = iter(deck[cut:])
+            deck = [
+                next(right) if bits >> position & 1 else next(left)
+                for position in range(size)
+            ]
+
+        return deck
+
+    @staticmethod
+    def shuffle_for(
+        algorithm: ShuffleAlgorithm,
+        cards: list[Card],
+        count: int,
+        seed: int,
+        rng: Union[random.Random, SplitMix64, None] = None,
+        shuffle_count: int = 7,
+    ) -> list[Card]:
+        """
+        Shuffle with a specific algorithm version. Deterministic.
+
+        Returns at least the top `count` cards, in drawing order.
+
+        Args:
+            algorithm: Which version of the shuffle to run
+            cards: Cards to shuffle (not modified)
+            count: Number of cards that will be drawn
+            seed: Seed for the shuffle, used when no generator is given
+            rng: Per-reading generator created with create_rng(seed, algorithm)
+            shuffle_count: Number of riffles for ShuffleAlgorithm.RIFFLE
+        """
+        if algorithm == ShuffleAlgorithm.FULL_SHUFFLE:
+            return ShuffleService.shuffle_cards(cards, seed, rng)
+        if algorithm == ShuffleAlgorithm.PARTIAL_SHUFFLE:
+            return ShuffleService.partial_shuffle(cards, count, seed, rng)
+        if algorithm == ShuffleAlgorithm.RIFFLE:
+            return ShuffleService.riffle_shuffle(cards, shuffle_count, seed, rng)
+        raise ValueError(f"Unknown shuffle algorithm: {algorithm}")
+
+    @staticmethod
+    def riffle_indices(
+        seeds: "np.ndarray",
+        deck_size: int,
+        count: int,
+        riffles: int,
+        reversal_chance: float,
+        chunk_size: int = RIFFLE_CHUNK_SIZE,
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Riffle shuffle and draw for many seeds at once. Requires NumPy.
+
+        Gives the same cards and reversals as riffle_shuffle followed by
+        DrawingService.draw_cards, one reading per seed.
+
+        Args:
+            seeds: Reading seeds
+            deck_size: Cards in the deck
+            count: Cards drawn per reading
+            riffles: Number of riffles
+            reversal_chance: Probability a card is drawn reversed
+            chunk_size: Seeds processed together
+
+        Returns:
+            (N, count) uint8 indices into the deck's starting order and an
+            (N, count) bool array of reversals
+        """
+        batch.require_numpy()
+        import numpy as np
+
+        seeds = np.asarray(seeds, dtype=np.uint64)
+        words = _riffle_words(deck_size)
+        counters = np.arange(1, riffles * words + count + 1, dtype=np.uint64)
+        positions = np.arange(deck_size, dtype=np.uint8)[:, None]
+        start = np.arange(deck_size, dtype=np.uint8)[:, None]
+
+        indices = np.empty((len(seeds), count), dtype=np.uint8)
+        reversals = np.empty((len(seeds), count), dtype=bool)
+        for first in range(0, len(seeds), chunk_size):
+            chunk = seeds[first : first + chunk_size]
+            n = len(chunk)
+
+            # Every SplitMix64 word the chunk needs, (counter, seed); uint64
+            # arithmetic wraps like the & _MASK_64 of the Python version
+            z = counters[:, None] * np.uint64(_GOLDEN_GAMMA) + chunk[None, :]
+            z ^= z >> np.uint64(30)
+            z *= np.uint64(_MIX_1)
+            z ^= z >> np.uint64(27)
+            z *= np.uint64(_MIX_2)
+            z ^= z >> np.uint64(31)
+
+            # bits[r, p, j]: does position p of riffle r take the right half
+            # in deck j. Arrays are (riffle, position, deck) so the loops
+            # below run over positions with whole rows of decks at a time.
+            riffle_words = z[: riffles * words].reshape(riffles, words, n)
+            bits = np.unpackbits(
+                riffle_words.transpose(0, 2, 1).copy().view(np.uint8),
+                axis=2,
+                bitorder="little",
+            )
+            bits = np.ascontiguousarray(bits[:, :, :deck_size].transpose(0, 2, 1))
+
+            # Cards taken from the left half before each position
+            lefts = 1 - bits
+            lefts_before = np.empty_like(bits)
+            lefts_before[:, 0] = 0
+            for position in range(1, deck_size):
+                np.add(
+                    lefts_before[:, position - 1],
+                    lefts[:, position - 1],
+                    out=lefts_before[:, position],
+                )
+            cut = lefts_before[:, -1:] + lefts[:, -1:]
+
+            # Source position of every card: lefts_before from the left half,
+            # cut + rights_before from the right half. uint8 wraps harmlessly.
+            source = lefts_before + bits * (
+                cut + positions - lefts_before - lefts_before
+            )
+            source = source.astype(np.int32) * n + np.arange(n, dtype=np.int32)
+
+            deck = np.broadcast_to(start, (deck_size, n)).ravel()
+            for riffle in range(riffles):
+                deck = deck.take(source[riffle].ravel())
+            deck = deck.reshape(deck_size, n)
+
+            # Reversals continue the stream, one word per drawn card
+            uniforms = (z[riffles * words :] >> np.uint64(11)) * 2.0**-53
+            indices[first : first + chunk_size] = deck[:count].T
+            reversals[first : first + chunk_size] = (uniforms < reversal_chance).T
+
+        return indices, reversals
@@ -1,8 +1,23 @@
+import json
+import os
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
 
+# Environment variable pointing at a spreads-config.json to use by default
+CONFIG_ENV_VAR = "ARCANUM_SPREADS_CONFIG"
 
-@dataclass
+# Where the backend keeps its spreads config, relative to a source checkout
+_CHECKOUT_CONFIG = (
+    Path(__file__).resolve().parents[2] / "backend" / "config" / "spreads-config.json"
+)
+
+
+@dataclass(frozen=True)
 class SpreadPosition:
     name: str
     description: str
@@ -11,6 +26,9 @@ class SpreadPosition:
 class SpreadLayout(ABC):
     """Abstract base for different spread types"""
 
+    # Key of the spread in the registry (spreads-config.json "id")
+    id: Optional[str] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -18,56 +36,236 @@ class SpreadLayout(ABC):
 
     @property
     @abstractmethod
-    def positions(self) -> list[SpreadPosition]:
+    def positions(self) -> tuple[SpreadPosition, ...]:
         pass
 
     @property
     def card_count(self) -> int:
         return len(self.positions)
 
+    @cached_property
+    def position_names(self) -> tuple[str, ...]:
+        return tuple(pos.name for pos in self.positions)
+
+    @cached_property
+    def position_indices(self) -> Mapping[str, int]:
+        """Index of each position name (the first one, if names repeat)"""
+        indices: dict[str, int] = {}
+        for index, name in enumerate(self.position_names):
+            indices.setdefault(name, index)
+        return MappingProxyType(indices)
+
 
 class SingleCardSpread(SpreadLayout):
+    id = "single-focus"
+    _positions = (SpreadPosition("Focus", "The main energy or message for you"),)
+
     @property
     def name(self) -> str:
         return "Single Card"
 
     @property
-    def positions(self) -> list[SpreadPosition]:
-        return [SpreadPosition("Focus", "The main energy or message for you")]
+    def positions(self) -> tuple[SpreadPosition, ...]:
+        return self._positions
 
 
 class ThreeCardSpread(SpreadLayout):
+    id = "past-present-future"
+    _positions = (
+        SpreadPosition("Past", "Influences from your past affecting the situation"),
+        SpreadPosition("Present", "Current energies and circumstances"),
+        SpreadPosition("Future", "Likely outcome or direction"),
+    )
+
     @property
     def name(self) -> str:
         return "3 Cards (Past, Present, Future)"
 
     @property
-    def positions(self) -> list[SpreadPosition]:
-        return [
-            SpreadPosition("Past", "Influences from your past affecting the situation"),
-            SpreadPosition("Present", "Current energies and circumstances"),
-            SpreadPosition("Future", "Likely outcome or direction"),
-        ]
+    def positions(self) -> tuple[SpreadPosition, ...]:
+        return self._positions
 
 
 class CelticCrossSpread(SpreadLayout):
+    id = "celtic-cross"
+    _positions = (
+        SpreadPosition("Present Situation", "The heart of the matter"),
+        SpreadPosition("Challenge", "What crosses you or challenges you"),
+        SpreadPosition("Distant Past", "Foundation of the situation"),
+        SpreadPosition("Recent Past", "Recent events affecting the situation"),
+        SpreadPosition("Possible Outcome", "What may come to pass"),
+        SpreadPosition("Near Future", "What will happen in the immediate future"),
+        SpreadPosition("Your Approach", "How you see yourself in this situation"),
+        SpreadPosition("External Influences", "How others see you or external factors"),
+        SpreadPosition("Hopes and Fears", "Your inner emotions about the outcome"),
+        SpreadPosition("Final Outcome", "The ultimate result of the situation"),
+    )
+
     @property
     def name(self) -> str:
         return "Celtic Cross"
 
     @property
-    def positions(self) -> list[SpreadPosition]:
-        return [
-            SpreadPosition("Present Situation", "The heart of the matter"),
-            SpreadPosition("Challenge", "What crosses you or challenges you"),
-            SpreadPosition("Distant Past", "Foundation of the situation"),
-            SpreadPosition("Recent Past", "Recent events affecting the situation"),
-            SpreadPosition("Possible Outcome", "What may come to pass"),
-            SpreadPosition("Near Future", "What will happen in the immediate future"),
-            SpreadPosition("Your Approach", "How you see yourself in this situation"),
-            SpreadPosition(
-                "External Influences", "How others see you or external factors"
-            ),
-            SpreadPosition("Hopes and Fears", "Your inner emotions about the outcome"),
-            SpreadPosition("Final Outcome", "The ultimate result of the situation"),
-        ]
+    def positions(self) -> tuple[SpreadPosition, ...]:
+        return self._positions
+
+
+class ConfiguredSpread(SpreadLayout):
+    """A spread defined by data (a spreads-config.json entry) rather than a class"""
+
+    def __init__(
+        self,
+        spread_id: str,
+        name: str,
+        positions: Iterable[SpreadPosition],
+        description: str = "",
+    ):
+        self._id = spread_id
+        self._name = name
+        self._positions = tuple(positions)
+        self._description = description
+
+    @classmethod
+    def from_config(cls, entry: dict[str, Any]) -> "ConfiguredSpread":
+        """Build a spread from one item of the config's "spreads" list"""
+        positions = []
+        for pos in entry["positions"]:
+            if "name" not in pos:
+                raise ValueError(f"Position missing a name in spread {entry['id']}")
+            description = pos.get("short_description", pos.get("description", ""))
+            positions.append(SpreadPosition(pos["name"], description))
+
+        return cls(
+            spread_id=entry["id"],
+            name=entry["name"],
+            positions=positions,
+            description=entry.get("description", ""),
+        )
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def positions(self) -> tuple[SpreadPosition, ...]:
+        return self._positions
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    def __repr__(self) -> str:
+        return f"ConfiguredSpread({self._id!r}, {len(self._positions)} cards)"
+
+
+def spread_key(spread_id: str) -> int:
+    """Stable 32-bit key for a spread id, for compact reading records"""
+    return zlib.crc32(spread_id.encode("utf-8"))
+
+
+class SpreadRegistry:
+    """Spreads keyed by id. Built once; the spreads it holds are read-only."""
+
+    def __init__(self, spreads: Iterable[SpreadLayout]):
+        self._spreads: MappingProxyType[str, SpreadLayout] = MappingProxyType(
+            {spread.id: spread for spread in spreads}
+        )
+        self._keys: dict[int, SpreadLayout] = {}
+        for spread_id, spread in self._spreads.items():
+            key = spread_key(spread_id)
+            if key in self._keys:
+                raise ValueError(
+                    f"Spread ids {self._keys[key].id} and {spread_id} share a key"
+                )
+            self._keys[key] = spread
+
+    @classmethod
+    def builtin(cls) -> "SpreadRegistry":
+        """The spreads that ship as classes in this module"""
+        return cls([SingleCardSpread(), ThreeCardSpread(), CelticCrossSpread()])
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "SpreadRegistry":
+        """
+        Build a registry from parsed spreads-config.json data
+
+        Every config entry becomes a ConfiguredSpread. Built-in spreads whose
+        id the config doesn't define are kept, so the registry always covers
+        them.
+        """
+        spreads: dict[str, SpreadLayout] = dict(cls.builtin()._spreads)
+        for entry in config.get("spreads", []):
+            spread = ConfiguredSpread.from_config(entry)
+            spreads[spread.id] = spread
+        return cls(spreads.values())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SpreadRegistry":
+        """Build a registry from a spreads-config.json file"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_config(json.load(f))
+
+    def get(self, spread_id: str) -> SpreadLayout:
+        """Look up a spread by id"""
+        try:
+            return self._spreads[spread_id]
+        except KeyError:
+            raise ValueError(f"Unknown spread: {spread_id}") from None
+
+    def get_by_key(self, key: int) -> SpreadLayout:
+        """Look up a spread by its spread_key()"""
+        try:
+            return self._keys[key]
+        except KeyError:
+            raise ValueError(f"Unknown spread key: {key:#010x}") from None
+
+    def ids(self) -> list[str]:
+        return list(self._spreads)
+
+    def __contains__(self, spread_id: object) -> bool:
+        return spread_id in self._spreads
+
+    def __iter__(self) -> Iterator[SpreadLayout]:
+        return iter(self._spreads.values())
+
+    def __len__(self) -> int:
+        return len(self._spreads)
+
+
+def default_config_path() -> Optional[Path]:
+    """The spreads config used when none is given, if one can be found"""
+    configured = os.environ.get(CONFIG_ENV_VAR)
+    if configured:
+        return Path(configured)
+    if _CHECKOUT_CONFIG.exists():
+        return _CHECKOUT_CONFIG
+    return None
+
+
+@lru_cache(maxsize=None)
+def _load_registry(path: Optional[Path]) -> SpreadRegistry:
+    if path is None:
+        return SpreadRegistry.builtin()
+    return SpreadRegistry.load(path)
+
+
+def get_spread_registry(path: Union[str, Path, None] = None) -> SpreadRegistry:
+    """
+    Shared spread registry, loaded once per config file
+
+    Args:
+        path: spreads-config.json to load. Defaults to $ARCANUM_SPREADS_CONFIG,
+            then the backend config in a source checkout, then the built-in
+            spreads alone.
+    """
+    path = Path(path) if path is not None else default_config_path()
+    return _load_registry(path.resolve() if path is not None else None)
+
+
+def get_spread(spread_id: str) -> SpreadLayout:
+    """Look up a spread by id in the shared registry"""
+    return get_spread_registry().get(spread_id)
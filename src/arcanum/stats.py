@@ -0,0 +1,328 @@
+"""
+Monte Carlo audit of the seed/shuffle/draw pipeline.
+
+Hashes synthetic questions into seeds exactly like ShuffleService, draws a
+spread for each seed with the vectorized engine in arcanum.batch, and counts
+which card lands in which position, which cards appear together and how
+often positions come up reversed. Work is split across a process pool and
+the counts are summed in NumPy. Chi-square tests check the counts against a
+fair deck, and a collision report compares repeated 32-bit seeds with the
+birthday-bound expectation.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from arcanum import batch
+from arcanum.deck import STANDARD_CARDS
+from arcanum.shuffle import ShuffleService
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+DECK_SIZE = len(STANDARD_CARDS)
+SEED_SPACE = 2**32
+SEED_BUCKETS = 256
+DEFAULT_CHUNK = 65536
+
+
+@dataclass
+class ChiSquareResult:
+    statistic: float
+    dof: int
+    p_value: float
+
+    def __str__(self) -> str:
+        return f"chi2={self.statistic:,.1f} dof={self.dof} p={self.p_value:.4f}"
+
+
+def chi_square_sf(statistic: float, dof: int) -> float:
+    """P(X >= statistic) for a chi-square distribution with `dof` degrees"""
+    a = dof / 2.0
+    x = statistic / 2.0
+    if x <= 0:
+        return 1.0
+
+    log_prefix = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        # Series for the lower regularized gamma function
+        term = total = 1.0 / a
+        n = a
+        for _ in range(10000):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    # Continued fraction for the upper regularized gamma function
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = d if abs(d) > tiny else tiny
+        c = b + an / c
+        c = c if abs(c) > tiny else tiny
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+
+def _chi_square(observed: "np.ndarray", expected: "np.ndarray") -> ChiSquareResult:
+    observed = np.asarray(observed, dtype=np.float64).ravel()
+    expected = np.broadcast_to(expected, observed.shape).astype(np.float64)
+    statistic = float(((observed - expected) ** 2 / expected).sum())
+    dof = observed.size - 1
+    return ChiSquareResult(statistic, dof, chi_square_sf(statistic, dof))
+
+
+@dataclass
+class DistributionReport:
+    """Accumulated counts from a Monte Carlo run, plus the tests run on them"""
+
+    samples: int
+    spread_size: int
+    shuffle_count: int
+    reversal_chance: float
+    position_counts: "np.ndarray"  # (78, k): card id x position
+    cooccurrence: "np.ndarray"  # (78, 78): readings holding both cards
+    reversal_counts: "np.ndarray"  # (k,): reversed draws per position
+    seed_buckets: "np.ndarray"  # (256,): seeds by their top 8 bits
+    unique_seeds: int
+
+    @property
+    def seed_collisions(self) -> int:
+        """Samples whose seed was already produced by an earlier sample"""
+        return self.samples - self.unique_seeds
+
+    @property
+    def expected_collisions(self) -> float:
+        """Birthday-bound collisions for this many uniform 32-bit seeds"""
+        expected_unique = -SEED_SPACE * math.expm1(
+            self.samples * math.log1p(-1.0 / SEED_SPACE)
+        )
+        return self.samples - expected_unique
+
+    def position_tests(self) -> list[ChiSquareResult]:
+        """Card frequency per position against a uniform deck"""
+        expected = self.samples / DECK_SIZE
+        return [
+            _chi_square(self.position_counts[:, p], expected)
+            for p in range(self.spread_size)
+        ]
+
+    def position_test(self) -> ChiSquareResult:
+        """All positions at once (dof = 77 per position)"""
+        tests = self.position_tests()
+        statistic = sum(t.statistic for t in tests)
+        dof = sum(t.dof for t in tests)
+        return ChiSquareResult(statistic, dof, chi_square_sf(statistic, dof))
+
+    def cooccurrence_test(self) -> Optional[ChiSquareResult]:
+        """Pair frequency against every pair being equally likely"""
+        if self.spread_size < 2:
+            return None
+        upper = np.triu_indices(DECK_SIZE, k=1)
+        pairs_per_reading = self.spread_size * (self.spread_size - 1) / 2
+        total_pairs = DECK_SIZE * (DECK_SIZE - 1) / 2
+        expected = self.samples * pairs_per_reading / total_pairs
+        return _chi_square(self.cooccurrence[upper], expected)
+
+    def reversal_test(self) -> ChiSquareResult:
+        """Reversed/upright split per position against reversal_chance"""
+        p = self.reversal_chance
+        reversed_counts = self.reversal_counts.astype(np.float64)
+        upright_counts = self.samples - reversed_counts
+        statistic = 0.0
+        if 0 < p < 1:
+            statistic = float(
+                ((reversed_counts - self.samples * p) ** 2 / (self.samples * p)).sum()
+                + (
+                    (upright_counts - self.samples * (1 - p)) ** 2
+                    / (self.samples * (1 - p))
+                ).sum()
+            )
+        dof = self.spread_size
+        return ChiSquareResult(statistic, dof, chi_square_sf(statistic, dof))
+
+    def seed_test(self) -> ChiSquareResult:
+        """Seeds bucketed by their top byte against a uniform 32-bit hash"""
+        return _chi_square(self.seed_buckets, self.samples / SEED_BUCKETS)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Machine-readable summary (test results, not raw matrices)"""
+
+        def result(test: Optional[ChiSquareResult]) -> Optional[dict[str, Any]]:
+            if test is None:
+                return None
+            return {
+                "statistic": test.statistic,
+                "dof": test.dof,
+                "p_value": test.p_value,
+            }
+
+        return {
+            "samples": self.samples,
+            "spread_size": self.spread_size,
+            "shuffle_count": self.shuffle_count,
+            "reversal_chance": self.reversal_chance,
+            "positions": [result(t) for t in self.position_tests()],
+            "all_positions": result(self.position_test()),
+            "cooccurrence": result(self.cooccurrence_test()),
+            "reversals": result(self.reversal_test()),
+            "seeds": result(self.seed_test()),
+            "unique_seeds": self.unique_seeds,
+            "seed_collisions": self.seed_collisions,
+            "expected_collisions": self.expected_collisions,
+        }
+
+    def summary(self) -> str:
+        """Human-readable report"""
+        lines = [
+            f"Samples: {self.samples:,} readings of {self.spread_size} cards "
+            f"(shuffle_count={self.shuffle_count})",
+            "",
+            "Card frequency by position:",
+        ]
+        for position, test in enumerate(self.position_tests()):
+            lines.append(f"  Position {position + 1:>2}: {test}")
+        lines.append(f"  All positions: {self.position_test()}")
+
+        cooccurrence = self.cooccurrence_test()
+        if cooccurrence:
+            lines.append(f"Card pairs: {cooccurrence}")
+        lines.append(f"Reversals: {self.reversal_test()}")
+        lines.append(f"Seed distribution: {self.seed_test()}")
+        lines.append(
+            f"Seed collisions: {self.seed_collisions:,} observed, "
+            f"{self.expected_collisions:,.2f} expected for uniform 32-bit seeds"
+        )
+        return "\n".join(lines)
+
+
+def _sample_chunk(
+    start: int,
+    stop: int,
+    spread_size: int,
+    shuffle_count: int,
+    reversal_chance: float,
+    full_shuffle: bool,
+    prefix: str,
+) -> dict[str, "np.ndarray"]:
+    """Count one range of synthetic questions (runs in a worker process)"""
+    questions = [f"{prefix}{i}" for i in range(start, stop)]
+    seeds = np.array(
+        ShuffleService.generate_seeds(questions, shuffle_count), dtype=np.uint32
+    )
+    indices, reversals = batch.draw_indices(
+        seeds, DECK_SIZE, spread_size, reversal_chance, full_shuffle=full_shuffle
+    )
+    indices = indices.astype(np.intp)
+
+    position_counts = np.empty((DECK_SIZE, spread_size), dtype=np.int64)
+    for position in range(spread_size):
+        position_counts[:, position] = np.bincount(
+            indices[:, position], minlength=DECK_SIZE
+        )
+
+    cooccurrence = np.zeros(DECK_SIZE * DECK_SIZE, dtype=np.int64)
+    for a in range(spread_size):
+        for b in range(a + 1, spread_size):
+            cooccurrence += np.bincount(
+                indices[:, a] * DECK_SIZE + indices[:, b],
+                minlength=DECK_SIZE * DECK_SIZE,
+            )
+    cooccurrence = cooccurrence.reshape(DECK_SIZE, DECK_SIZE)
+
+    return {
+        "position_counts": position_counts,
+        "cooccurrence": cooccurrence + cooccurrence.T,
+        "reversal_counts": reversals.sum(axis=0, dtype=np.int64),
+        "seed_buckets": np.bincount(seeds >> 24, minlength=SEED_BUCKETS),
+        "seeds": seeds,
+    }
+
+
+def analyze(
+    samples: int,
+    spread_size: int,
+    shuffle_count: int = 7,
+    reversal_chance: float = 0.5,
+    full_shuffle: bool = True,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK,
+    prefix: str = "arcanum audit question ",
+) -> DistributionReport:
+    """
+    Draw `samples` readings and accumulate their distribution
+
+    Args:
+        samples: Number of readings to simulate
+        spread_size: Cards per reading
+        shuffle_count: Shuffle count hashed into every seed
+        reversal_chance: Probability a card is drawn reversed
+        full_shuffle: Use the legacy full shuffle (False = partial shuffle)
+        workers: Worker processes (None = all cores, 1 = run in this process)
+        chunk_size: Questions per unit of work
+        prefix: Synthetic questions are this prefix followed by a counter
+    """
+    batch.require_numpy()
+    workers = workers or os.cpu_count() or 1
+
+    ranges = [
+        (start, min(start + chunk_size, samples))
+        for start in range(0, samples, chunk_size)
+    ]
+    args = [
+        (start, stop, spread_size, shuffle_count, reversal_chance, full_shuffle, prefix)
+        for start, stop in ranges
+    ]
+
+    position_counts = np.zeros((DECK_SIZE, spread_size), dtype=np.int64)
+    cooccurrence = np.zeros((DECK_SIZE, DECK_SIZE), dtype=np.int64)
+    reversal_counts = np.zeros(spread_size, dtype=np.int64)
+    seed_buckets = np.zeros(SEED_BUCKETS, dtype=np.int64)
+    seeds = np.empty(samples, dtype=np.uint32)
+
+    def accumulate(start: int, counts: dict[str, "np.ndarray"]) -> None:
+        nonlocal position_counts, cooccurrence, reversal_counts, seed_buckets
+        position_counts += counts["position_counts"]
+        cooccurrence += counts["cooccurrence"]
+        reversal_counts += counts["reversal_counts"]
+        seed_buckets += counts["seed_buckets"]
+        seeds[start : start + len(counts["seeds"])] = counts["seeds"]
+
+    if workers == 1:
+        for arg in args:
+            accumulate(arg[0], _sample_chunk(*arg))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_sample_chunk, *arg) for arg in args]
+            for (start, _), future in zip(ranges, futures):
+                accumulate(start, future.result())
+
+    return DistributionReport(
+        samples=samples,
+        spread_size=spread_size,
+        shuffle_count=shuffle_count,
+        reversal_chance=reversal_chance,
+        position_counts=position_counts,
+        cooccurrence=cooccurrence,
+        reversal_counts=reversal_counts,
+        seed_buckets=seed_buckets,
+        unique_seeds=int(len(np.unique(seeds))),
+    )
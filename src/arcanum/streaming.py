@@ -0,0 +1,188 @@
+"""
+Streaming JSONL readings for non-interactive batch jobs.
+
+Input lines are JSON objects such as::
+
+    {"question": "What should I focus on?", "spread": "3", "shuffle_count": 7}
+
+Only ``question`` is required; ``spread``, ``shuffle_count`` and
+``include_date`` fall back to the run's defaults, and an ``id`` field is
+copied to the output. Lines are grouped into chunks that worker processes
+turn into JSON readings. Results are written in input order, and only a
+fixed number of chunks are in flight at once, so memory stays bounded
+however long the input is.
+"""
+
+import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from arcanum import batch
+from arcanum.reading import Reading, ReadingService
+from arcanum.spreads import SpreadLayout
+
+DEFAULT_CHUNK_SIZE = 4096
+
+# Per-process state, set up once by _init_worker
+_reader: Optional[ReadingService] = None
+_spreads: dict[str, SpreadLayout] = {}
+_defaults: dict[str, Any] = {}
+
+
+def _init_worker(
+    spreads: Mapping[str, SpreadLayout],
+    defaults: dict[str, Any],
+    reversal_chance: float,
+) -> None:
+    global _reader, _spreads, _defaults
+    _reader = ReadingService(reversal_chance=reversal_chance)
+    _spreads = dict(spreads)
+    _defaults = defaults
+
+
+def reading_to_dict(reading: Reading) -> dict[str, Any]:
+    """JSON-ready form of a reading"""
+    return {
+        "question": reading.question,
+        "spread": reading.spread.name,
+        "seed": reading.seed,
+        "shuffle_count": reading.shuffle_count,
+        "timestamp": reading.timestamp.isoformat(),
+        "cards": [
+            {
+                "name": drawn.card.name,
+                "position": drawn.position,
+                "reversed": drawn.reversed,
+            }
+            for drawn in reading.cards
+        ],
+    }
+
+
+def _parse_line(line_number: int, line: str) -> tuple[tuple, str, dict[str, Any]]:
+    """Validate one input line into (group key, question, request)"""
+    request = json.loads(line)
+    question = request["question"]
+    spread_key = str(request.get("spread", _defaults["spread"]))
+    if spread_key not in _spreads:
+        raise ValueError(f"Unknown spread: {spread_key}")
+
+    key = (
+        spread_key,
+        int(request.get("shuffle_count", _defaults["shuffle_count"])),
+        bool(request.get("include_date", _defaults["include_date"])),
+    )
+    return key, question, request
+
+
+def _format(reading: Reading, request: dict[str, Any]) -> str:
+    result = reading_to_dict(reading)
+    if "id" in request:
+        result = {"id": request["id"], **result}
+    return json.dumps(result, ensure_ascii=False)
+
+
+def _error(line_number: int, error: Exception) -> str:
+    return json.dumps({"line": line_number, "error": str(error)}, ensure_ascii=False)
+
+
+def _process_chunk(first_line: int, lines: list[str]) -> str:
+    """Turn a chunk of input lines into newline-terminated JSONL output"""
+    output: dict[int, str] = {}
+    groups: dict[tuple, list[tuple[int, str, dict[str, Any]]]] = {}
+
+    for offset, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            key, question, request = _parse_line(first_line + offset, line)
+            groups.setdefault(key, []).append((offset, question, request))
+        except Exception as e:
+            output[offset] = _error(first_line + offset, e)
+
+    # Lines sharing spread and options are drawn together when NumPy is
+    # available; the results are identical to one perform_reading per line
+    for (spread_key, shuffle_count, include_date), items in groups.items():
+        spread = _spreads[spread_key]
+        if batch.NUMPY_AVAILABLE:
+            readings = _reader.perform_readings_batch(
+                [question for _, question, _ in items],
+                spread,
+                shuffle_count=shuffle_count,
+                include_date=include_date,
+            )
+        else:
+            readings = [
+                _reader.perform_reading(question, spread, shuffle_count, include_date)
+                for _, question, _ in items
+            ]
+
+        for (offset, _, request), reading in zip(items, readings):
+            output[offset] = _format(reading, request)
+
+    return "".join(f"{output[offset]}\n" for offset in sorted(output))
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[tuple[int, list[str]]]:
+    iterator = iter(lines)
+    first_line = 1
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield first_line, chunk
+        first_line += len(chunk)
+
+
+def stream_readings(
+    lines: Iterable[str],
+    spreads: Mapping[str, SpreadLayout],
+    default_spread: str,
+    shuffle_count: int = 7,
+    include_date: bool = False,
+    reversal_chance: float = 0.5,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Yield JSONL output chunks for JSONL input lines, in input order
+
+    Args:
+        lines: Input lines (a file object or sys.stdin works)
+        spreads: Spreads by the keys accepted in the "spread" field
+        default_spread: Spread key used when a line has none
+        shuffle_count: Default shuffle count
+        include_date: Default for daily readings
+        reversal_chance: Probability a card will be drawn reversed
+        workers: Worker processes (1 = run in this process)
+        chunk_size: Lines per unit of work
+        max_pending: Chunks in flight at once (default: 2 per worker)
+    """
+    defaults = {
+        "spread": default_spread,
+        "shuffle_count": shuffle_count,
+        "include_date": include_date,
+    }
+    init_args = (spreads, defaults, reversal_chance)
+
+    if workers <= 1:
+        _init_worker(*init_args)
+        for first_line, chunk in _chunks(lines, chunk_size):
+            yield _process_chunk(first_line, chunk)
+        return
+
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=init_args
+    ) as pool:
+        pending: deque[Future] = deque()
+        for first_line, chunk in _chunks(lines, chunk_size):
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_process_chunk, first_line, chunk))
+
+        while pending:
+            yield pending.popleft().result()
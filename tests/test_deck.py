@@ -1,7 +1,7 @@
 """Test the Deck.py module."""
 
 import pytest
-from arcanum.deck import Deck
+from arcanum.deck import Deck, STANDARD_CARDS, get_card_by_id, get_card_id
 from arcanum.card import ArcanaType
 
 
@@ -62,3 +62,23 @@ class TestDeck:
         assert "Ace of Cups" in card_names
         assert "King of Swords" in card_names
         assert "10 of Pentacles" in card_names
+
+
+class TestCardIds:
+    def test_ids_follow_deck_order(self) -> None:
+        """Card ids are positions in the standard deck, 0-77."""
+        cards = Deck().get_cards()
+
+        assert [get_card_id(c) for c in cards] == list(range(78))
+        assert get_card_by_id(0).name == "The Fool"
+        assert get_card_by_id(21).name == "The World"
+        assert get_card_by_id(77).name == "King of Pentacles"
+
+    def test_ids_round_trip(self) -> None:
+        """Every card survives id encoding."""
+        for card in STANDARD_CARDS:
+            assert get_card_by_id(get_card_id(card)) == card
+
+    def test_invalid_id_raises(self) -> None:
+        with pytest.raises(ValueError):
+            get_card_by_id(78)
@@ -0,0 +1,44 @@
+"""Test the backend's enhanced card index."""
+
+import json
+import os
+
+import pytest
+from services.card_catalog import get_card_catalog
+from services.enhanced_cards import EnhancedCardService, parse_fields
+
+
+class TestEnhancedCardService:
+    def test_first_index_reuses_the_catalog_cards(self) -> None:
+        """all_cards.json is parsed once, by the catalog, at startup."""
+        catalog = get_card_catalog()
+        if catalog.enhanced_cards is None:
+            pytest.skip("enhanced cards file not available")
+
+        index = EnhancedCardService(catalog.enhanced_cards_path).index()
+
+        assert index.get("ace_of_cups") is catalog.enhanced_cards["ace_of_cups"]
+        assert index.get("Ace of Cups") is index.get("ace_of_cups")
+
+    def test_reloads_when_the_file_changes(self, tmp_path) -> None:
+        path = tmp_path / "all_cards.json"
+        path.write_text(json.dumps({"the_fool": {"card_name": "The Fool"}}), encoding="utf-8")
+        service = EnhancedCardService(str(path), check_interval=0)
+        first = service.index()
+
+        path.write_text(
+            json.dumps({"the_fool": {"card_name": "The Fool", "keywords": ["leap"]}}),
+            encoding="utf-8",
+        )
+        mtime = path.stat().st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+        second = service.index()
+        assert second is not first
+        assert second.get("the_fool", parse_fields("keywords")) == {"keywords": ["leap"]}
+
+    def test_missing_file(self, tmp_path) -> None:
+        service = EnhancedCardService(str(tmp_path / "missing.json"))
+
+        with pytest.raises(FileNotFoundError):
+            service.index()
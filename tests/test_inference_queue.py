@@ -0,0 +1,127 @@
+"""Test the backend's inference job queue."""
+
+import threading
+from typing import Dict, List
+
+import pytest
+from inference_queue import JOBS_FINISHED, InferenceQueue, JobStatus
+from mlx_model_service import InferenceRequest, InferenceResponse
+
+
+class FakeModelService:
+    """Generates the user prompt back, once the test opens the gate"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.prompts: List[str] = []
+
+    def generate_text(self, request: InferenceRequest) -> InferenceResponse:
+        self.started.set()
+        self.gate.wait(5)
+        self.prompts.append(request.user_prompt)
+        if request.user_prompt == "fail":
+            raise RuntimeError("model exploded")
+        return InferenceResponse(request.user_prompt, 1, 0.0, "fake", "now")
+
+    def generate_text_stream(self, request, on_token):
+        for word in request.user_prompt.split():
+            if on_token(word):
+                break
+        return self.generate_text(request)
+
+
+def _request(prompt: str) -> InferenceRequest:
+    return InferenceRequest(system_prompt="", user_prompt=prompt)
+
+
+def _finished_counts() -> Dict[str, float]:
+    return {labels["status"]: value for _, labels, value in JOBS_FINISHED.samples()}
+
+
+@pytest.fixture
+def model():
+    model = FakeModelService()
+    yield model
+    model.gate.set()
+
+
+class TestInferenceQueue:
+    def test_jobs_run_in_order(self, model) -> None:
+        queue = InferenceQueue(model)
+        jobs = [queue.submit(_request(str(i))) for i in range(5)]
+
+        model.started.wait(5)
+        assert [queue.position(job) for job in jobs] == [0, 0, 1, 2, 3]
+        model.gate.set()
+
+        assert all(job.wait(5) for job in jobs)
+        assert model.prompts == ["0", "1", "2", "3", "4"]
+        assert [job.status for job in jobs] == [JobStatus.DONE] * 5
+        assert jobs[2].result()["text"] == "2"
+
+    def test_cancelled_job_never_runs(self, model) -> None:
+        queue = InferenceQueue(model)
+        first = queue.submit(_request("first"))
+        second = queue.submit(_request("second"))
+        third = queue.submit(_request("third"))
+
+        model.started.wait(5)
+        second.cancel()
+        model.gate.set()
+
+        assert third.wait(5)
+        assert second.status is JobStatus.CANCELLED
+        assert second.response is None
+        assert first.status is third.status is JobStatus.DONE
+        assert model.prompts == ["first", "third"]
+
+    def test_failure_is_recorded_on_the_job(self, model) -> None:
+        queue = InferenceQueue(model)
+        model.gate.set()
+
+        failed = queue.submit(_request("fail"))
+        after = queue.submit(_request("after"))
+
+        assert after.wait(5)
+        assert failed.status is JobStatus.FAILED
+        assert failed.error == "model exploded"
+        assert failed.result() is None
+        assert after.status is JobStatus.DONE
+
+    def test_done_callback(self, model) -> None:
+        queue = InferenceQueue(model)
+        model.gate.set()
+        finished = []
+
+        job = queue.submit(_request("Q"))
+        queue.add_done_callback(job, finished.append)
+        job.wait(5)
+        queue.add_done_callback(job, finished.append)
+
+        assert finished == [job, job]
+
+    def test_metrics(self, model) -> None:
+        before = _finished_counts()
+        queue = InferenceQueue(model)
+        jobs = [queue.submit(_request(p)) for p in ("a", "fail", "b", "c")]
+        model.started.wait(5)
+        jobs[3].cancel()
+
+        metrics = queue.metrics()
+        assert metrics["submitted"] == 4
+        assert metrics["running"] == jobs[0].id
+
+        model.gate.set()
+        assert all(job.wait(5) for job in jobs)
+
+        metrics = queue.metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["running"] is None
+        assert (metrics["completed"], metrics["failed"], metrics["cancelled"]) == (2, 1, 1)
+        assert metrics["wait_time"]["count"] == 3
+        assert metrics["run_time"]["count"] == 3
+
+        after = _finished_counts()
+        for status, count in (("done", 2), ("failed", 1), ("cancelled", 1)):
+            assert after[status] - before.get(status, 0) == count
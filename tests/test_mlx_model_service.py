@@ -0,0 +1,37 @@
+"""Test the backend's model service with the mock model."""
+
+import pytest
+from mlx_model_service import InferenceRequest, MLXModelService
+
+
+class FakeTokenizer:
+    def encode(self, text, add_special_tokens=True):
+        # One token per character, plus BOS if asked for
+        return [0] * (len(text) + add_special_tokens)
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = MLXModelService(models_directory=str(tmp_path))
+    assert service.load_model("mock-tarot-model")
+    return service
+
+
+class TestTokenCounting:
+    def test_stream_and_batch_count_the_same(self, service, monkeypatch) -> None:
+        """Both generate paths report tokens for the same text the same way."""
+        # The mock stamps its text with the time; keep both runs identical
+        monkeypatch.setattr("mlx_model_service.time.strftime", lambda *args: "12:00:00")
+        request = InferenceRequest(system_prompt="Be kind.", user_prompt="Q?")
+
+        batch = service.generate_text(request)
+        streamed = service.generate_text_stream(request, lambda text: None)
+
+        assert streamed.text == batch.text
+        assert streamed.tokens_generated == batch.tokens_generated > 0
+
+    def test_real_models_use_the_tokenizer(self, service) -> None:
+        service._current_model = object()
+        service._tokenizer = FakeTokenizer()
+
+        assert service._count_tokens("The Tower") == 9
@@ -0,0 +1,96 @@
+"""Test the backend's prompt_store.py module."""
+
+from services.prompt_store import PromptStore
+from services.state_store import MemoryStateStore, SQLiteStateStore, WriteBehindCache
+
+
+class TestPromptStore:
+    def test_put_get(self) -> None:
+        prompts = PromptStore(MemoryStateStore())
+
+        prompt_id = prompts.put("system", "user")
+
+        stored = prompts.get(prompt_id)
+        assert (stored.system_prompt, stored.user_prompt) == ("system", "user")
+        assert prompts.get("unknown") is None
+        assert (prompts.hits, prompts.misses) == (1, 1)
+
+    def test_shared_between_workers(self, tmp_path) -> None:
+        """An id made by one worker's store is found through another's."""
+        path = str(tmp_path / "state.db")
+        first = WriteBehindCache(SQLiteStateStore(path), flush_interval=None)
+        second = WriteBehindCache(SQLiteStateStore(path), flush_interval=None)
+
+        prompt_id = PromptStore(first).put("system", "user")
+
+        assert PromptStore(second).get(prompt_id).user_prompt == "user"
+        first.close()
+        second.close()
+
+    def test_expired_prompts(self, monkeypatch) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr("services.prompt_store.time.time", lambda: clock[0])
+        store = MemoryStateStore()
+        prompts = PromptStore(store, ttl=60)
+
+        old = prompts.put("system", "old")
+        clock[0] += 45
+        recent = prompts.put("system", "recent")  # nothing has expired yet
+        clock[0] += 30
+
+        assert prompts.get(old) is None
+        assert store.get("prompts", old) is None
+        assert prompts.get(recent).user_prompt == "recent"
+
+        clock[0] += 60
+        prompts.put("system", "new")  # prunes the recent prompt
+        assert len(store.scan("prompts")) == 1
+        assert prompts.expirations == 2
+
+    def test_oldest_prompts_are_evicted(self, monkeypatch) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr("services.prompt_store.time.time", lambda: clock[0])
+        store = MemoryStateStore()
+        prompts = PromptStore(store, ttl=60, maxsize=3)
+
+        ids = []
+        for i in range(5):
+            ids.append(prompts.put("system", str(i)))
+            clock[0] += 1
+
+        assert [prompts.get(prompt_id) is not None for prompt_id in ids] == [
+            False, False, True, True, True
+        ]
+        assert len(store.scan("prompts")) == 3
+        assert prompts.stats()["evictions"] == 2
+        assert prompts.stats()["size"] == 3
+
+    def test_pruning_does_not_decode_prompts(self, monkeypatch) -> None:
+        """Expiry is indexed in memory, not read back from every stored prompt."""
+        clock = [1000.0]
+        monkeypatch.setattr("services.prompt_store.time.time", lambda: clock[0])
+        prompts = PromptStore(MemoryStateStore(), ttl=60, maxsize=10)
+        decoded = []
+        decode = prompts._prompts.decode
+        prompts._prompts.decode = lambda value: decoded.append(value) or decode(value)
+
+        for i in range(50):
+            prompts.put("system", str(i))
+            clock[0] += 10
+
+        assert decoded == []
+        assert prompts.stats()["size"] == 6
+        assert prompts.expirations + prompts.evictions == 44
+
+    def test_prompts_from_an_earlier_run_are_pruned(self, monkeypatch) -> None:
+        clock = [1000.0]
+        monkeypatch.setattr("services.prompt_store.time.time", lambda: clock[0])
+        store = MemoryStateStore()
+        old = PromptStore(store, ttl=60).put("system", "old")
+
+        clock[0] += 120
+        prompts = PromptStore(store, ttl=60)
+        prompts.put("system", "new")
+
+        assert store.get("prompts", old) is None
+        assert prompts.expirations == 1
@@ -0,0 +1,289 @@
+"""Test the reading.py module."""
+
+from datetime import date
+
+import pytest
+from arcanum.cache import LRUCache
+from arcanum.drawn_card import DrawnCard
+from arcanum.reading import LazyReading, Reading, ReadingService
+from arcanum.shuffle import ShuffleAlgorithm, ShuffleService
+from arcanum.spreads import (
+    ConfiguredSpread,
+    SingleCardSpread,
+    SpreadPosition,
+    ThreeCardSpread,
+    CelticCrossSpread,
+)
+
+QUESTIONS = [
+    "What should I focus on this week?",
+    "Will the new job work out?",
+    "  How do I heal this friendship?  ",
+    "",
+    "What does the year ahead hold?",
+]
+
+
+class TestReadingService:
+    def test_same_question_gives_same_reading(self) -> None:
+        """Readings are deterministic for a question and shuffle count."""
+        reader = ReadingService()
+        spread = ThreeCardSpread()
+
+        first = reader.perform_reading("Career guidance", spread, shuffle_count=5)
+        second = reader.perform_reading("Career guidance", spread, shuffle_count=5)
+
+        assert first.seed == second.seed
+        assert [str(c) for c in first.cards] == [str(c) for c in second.cards]
+
+    def test_legacy_shuffle_is_default(self) -> None:
+        """Existing seeds keep their full-shuffle readings by default."""
+        spread = CelticCrossSpread()
+        legacy = ReadingService(legacy_shuffle=True)
+
+        assert ReadingService().perform_reading("Q", spread).cards == (
+            legacy.perform_reading("Q", spread).cards
+        )
+
+    def test_partial_shuffle_reading(self) -> None:
+        """The partial draw path fills every position with distinct cards."""
+        reader = ReadingService(legacy_shuffle=False)
+
+        reading = reader.perform_reading("Career guidance", CelticCrossSpread())
+
+        assert len(reading.cards) == 10
+        assert len({c.card for c in reading.cards}) == 10
+        assert [c.position for c in reading.cards] == [
+            p.name for p in CelticCrossSpread().positions
+        ]
+
+    def test_algorithm_per_reading(self) -> None:
+        """A reading can pick its algorithm; the cache keeps them apart."""
+        reader = ReadingService()
+
+        riffled = reader.perform_reading(
+            "Q", "celtic-cross", algorithm=ShuffleAlgorithm.RIFFLE
+        )
+        default = reader.perform_reading("Q", "celtic-cross")
+
+        assert riffled.algorithm == ShuffleAlgorithm.RIFFLE
+        assert default.algorithm == ShuffleAlgorithm.FULL_SHUFFLE
+        assert riffled.cards != default.cards
+
+    def test_generate_seeds_matches_generate_seed(self) -> None:
+        """Bulk seed hashing gives the same seeds as one-at-a-time hashing."""
+        seeds = ShuffleService.generate_seeds(QUESTIONS, 7)
+
+        assert seeds == [ShuffleService.generate_seed(q, 7) for q in QUESTIONS]
+
+
+class TestReadingCache:
+    def test_repeat_question_hits_cache(self) -> None:
+        """Re-submitting a question is served from the cache."""
+        reader = ReadingService()
+        spread = CelticCrossSpread()
+
+        first = reader.perform_reading("Career guidance", spread)
+        second = reader.perform_reading("  CAREER guidance ", spread)
+
+        assert second.cards == first.cards
+        assert second.seed == first.seed
+        assert second.question == "  CAREER guidance "
+        assert reader.cache.stats()["hits"] == 1
+        assert reader.cache.stats()["misses"] == 1
+
+    def test_cached_cards_are_fresh_objects(self) -> None:
+        """Mutating a returned reading cannot corrupt the cache."""
+        reader = ReadingService()
+        spread = ThreeCardSpread()
+
+        first = reader.perform_reading("Q", spread)
+        first.cards[0].reversed = not first.cards[0].reversed
+        second = reader.perform_reading("Q", spread)
+
+        assert second.cards[0].reversed != first.cards[0].reversed
+
+    def test_key_includes_spread_and_shuffle_count(self) -> None:
+        reader = ReadingService()
+
+        reader.perform_reading("Q", ThreeCardSpread(), shuffle_count=3)
+        reader.perform_reading("Q", ThreeCardSpread(), shuffle_count=4)
+        reader.perform_reading("Q", CelticCrossSpread(), shuffle_count=3)
+
+        assert reader.cache.stats()["hits"] == 0
+
+    def test_cache_can_be_disabled(self) -> None:
+        reader = ReadingService(cache_size=0)
+
+        reader.perform_reading("Q", ThreeCardSpread())
+        reader.perform_reading("Q", ThreeCardSpread())
+
+        assert len(reader.cache) == 0
+        assert reader.cache.stats()["hits"] == 0
+
+    def test_daily_seed_uses_the_cache_key_date(self, monkeypatch) -> None:
+        """Across midnight, the seed and cache key still agree on the date."""
+        import arcanum.reading
+        import arcanum.shuffle
+
+        class Today(date):
+            @classmethod
+            def today(cls):
+                return date(2026, 1, 1)
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date(2026, 1, 2)
+
+        # The reading reads the date just before midnight, the seed just after
+        monkeypatch.setattr(arcanum.reading, "date", Today)
+        monkeypatch.setattr(arcanum.shuffle, "date", Tomorrow)
+        reading = ReadingService().perform_reading("Q", "celtic-cross", include_date=True)
+
+        assert reading.seed == ShuffleService.generate_seed(
+            "Q", 7, include_date=True, today=date(2026, 1, 1)
+        )
+
+    def test_entries_expire(self) -> None:
+        """Entries past their expiry count as misses and are dropped."""
+        now = [1000.0]
+        cache = LRUCache(maxsize=2, clock=lambda: now[0])
+        cache.put("daily", 1, expires_at=1500.0)
+
+        assert cache.get("daily") == 1
+        now[0] = 1500.0
+        assert cache.get("daily") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+
+class TestPackedReading:
+    def test_drawn_card_round_trip(self) -> None:
+        """Packing a drawn card into one integer loses nothing."""
+        reading = ReadingService().perform_reading("Q", CelticCrossSpread())
+        names = [p.name for p in CelticCrossSpread().positions]
+
+        for index, drawn in enumerate(reading.cards):
+            value = drawn.pack(index)
+            assert 0 <= value < 2**16
+            assert DrawnCard.unpack(value, names) == drawn
+
+    def test_drawn_card_has_slots(self) -> None:
+        """DrawnCard instances carry no per-instance __dict__."""
+        reading = ReadingService().perform_reading("Q", ThreeCardSpread())
+
+        assert not hasattr(reading.cards[0], "__dict__")
+
+    @pytest.mark.parametrize(
+        "spread", [SingleCardSpread(), ThreeCardSpread(), CelticCrossSpread()]
+    )
+    def test_reading_round_trip(self, spread) -> None:
+        """A reading rebuilt from bytes equals the original."""
+        reading = ReadingService().perform_reading("Will it work out? ✨", spread)
+
+        data = reading.to_bytes()
+
+        assert len(data) < 64
+        assert Reading.from_bytes(data, spread) == reading
+
+
+class TestSeedRecord:
+    @pytest.mark.parametrize("algorithm", list(ShuffleAlgorithm))
+    @pytest.mark.parametrize("spread", ["single-focus", "celtic-cross", "year-ahead"])
+    def test_round_trip(self, spread, algorithm) -> None:
+        """The cards are drawn again exactly from the 16-byte record."""
+        reader = ReadingService(reversal_chance=0.3, algorithm=algorithm)
+        reading = reader.perform_reading("Where am I headed?", spread)
+
+        data = reading.to_seed_bytes()
+        rebuilt = LazyReading.from_seed_bytes(data, question=reading.question)
+
+        assert len(data) == 16
+        assert rebuilt.spread is reading.spread
+        assert rebuilt.cards == reading.cards
+        assert rebuilt.seed == reading.seed
+        assert rebuilt.algorithm == algorithm
+        assert rebuilt.reversal_chance == 0.3
+        assert rebuilt.shuffle_count == reading.shuffle_count
+        assert rebuilt.timestamp.date() == reading.timestamp.date()
+        assert rebuilt.to_seed_bytes() == data
+
+    def test_cards_are_drawn_on_access(self) -> None:
+        reading = ReadingService().perform_reading("Q", "past-present-future")
+        rebuilt = LazyReading.from_seed_bytes(reading.to_seed_bytes())
+
+        assert "cards" not in vars(rebuilt)
+        assert str(rebuilt).endswith(str(reading.cards[-1]))
+        assert "cards" in vars(rebuilt)
+
+    def test_seed_is_indexable(self) -> None:
+        reading = ReadingService().perform_reading("Q", "single-focus")
+
+        data = reading.to_seed_bytes()
+
+        assert int.from_bytes(data[4:8], "little") == reading.seed
+
+    def test_spread_without_id(self) -> None:
+        spread = ConfiguredSpread(None, "Ad hoc", [SpreadPosition("Only", "")])
+        reading = ReadingService().perform_reading("Q", spread)
+
+        with pytest.raises(ValueError):
+            reading.to_seed_bytes()
+
+    def test_reversal_chance_must_round_trip(self) -> None:
+        reading = ReadingService(reversal_chance=1 / 3).perform_reading(
+            "Q", "single-focus"
+        )
+
+        with pytest.raises(ValueError):
+            reading.to_seed_bytes()
+
+    def test_unknown_version(self) -> None:
+        data = ReadingService().perform_reading("Q", "single-focus").to_seed_bytes()
+
+        with pytest.raises(ValueError):
+            LazyReading.from_seed_bytes(b"\x09" + data[1:])
+
+
+class TestReadingBatch:
+    @pytest.mark.parametrize("algorithm", list(ShuffleAlgorithm))
+    @pytest.mark.parametrize(
+        "spread", [SingleCardSpread(), ThreeCardSpread(), CelticCrossSpread()]
+    )
+    def test_batch_matches_single_readings(self, spread, algorithm) -> None:
+        """Every batched reading matches perform_reading card for card."""
+        pytest.importorskip("numpy")
+        reader = ReadingService(reversal_chance=0.3, algorithm=algorithm)
+
+        questions = QUESTIONS + [f"Question number {i}" for i in range(200)]
+        batch = reader.perform_readings_batch(questions, spread, shuffle_count=11)
+
+        assert len(batch) == len(questions)
+        assert batch.card_indices.shape == (len(questions), spread.card_count)
+        for question, batched in zip(questions, batch):
+            single = reader.perform_reading(question, spread, shuffle_count=11)
+            assert batched.seed == single.seed
+            assert batched.cards == single.cards
+
+    def test_batch_chunks_agree(self) -> None:
+        """Splitting the work into chunks does not change the results."""
+        np = pytest.importorskip("numpy")
+        from arcanum import batch
+
+        seeds = np.arange(50, dtype=np.uint32) * 2654435761
+        whole = batch.draw_indices(seeds, 78, 10, 0.5)
+        chunked = batch.draw_indices(seeds, 78, 10, 0.5, chunk_size=7)
+
+        assert (whole[0] == chunked[0]).all()
+        assert (whole[1] == chunked[1]).all()
@@ -0,0 +1,101 @@
+"""Test the backend's reading_text.py module."""
+
+import pytest
+from reading_text import ReadingTextStream, clean_reading_text
+
+BODY = (
+    "# Reading\n\n"
+    "The Tower in the first position speaks of sudden change.\n\n"
+    "The Star that follows it is a promise of renewal."
+)
+
+# Model outputs on which the stream and the full cleaner agree
+AGREEING = {
+    "heading": BODY,
+    "preamble before heading": "Okay, let me lay out the cards.\n\n" + BODY,
+    "end marker": BODY + "\n\nThat concludes the reading.###END###\nextra",
+    "short end marker": BODY + " That concludes the reading. Anything else",
+    "thinking": (
+        "(thinking) I need to weigh the Tower against the Star.\n\n"
+        "The Tower speaks of sudden change, and the Star of renewal."
+    ),
+    "thinking with end of reading": (
+        "(thinking) Two cards, past and future.\n\n\n"
+        "The Tower speaks of sudden change.[[END OF READING]] trailing"
+    ),
+    "no markers": "  The Tower speaks of sudden change.\n\nThe Star of renewal.  ",
+}
+
+
+def _stream(text: str, size: int, **kwargs) -> str:
+    cleaner = ReadingTextStream(**kwargs)
+    sent = [cleaner.feed(text[i : i + size]) for i in range(0, len(text), size)]
+    sent.append(cleaner.finish())
+    assert "".join(sent) == cleaner.text
+    return cleaner.text
+
+
+class TestReadingTextStream:
+    @pytest.mark.parametrize("name", sorted(AGREEING))
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 10_000])
+    def test_matches_clean_reading_text(self, name: str, size: int) -> None:
+        text = AGREEING[name]
+
+        assert _stream(text, size) == clean_reading_text(text)
+
+    def test_markers_split_across_chunks(self) -> None:
+        text = "Preamble\n# Reading\nThe Tower.\nThat concludes the reading.###END###tail"
+        heading = text.index("# Reading") + 4
+        end = text.index("###END###") + 3
+        chunks = [text[:heading], text[heading:end], text[end:]]
+
+        cleaner = ReadingTextStream()
+        sent = "".join(cleaner.feed(chunk) for chunk in chunks) + cleaner.finish()
+
+        assert sent == "# Reading\nThe Tower." == clean_reading_text(text)
+
+    def test_holds_back_a_partial_end_marker(self) -> None:
+        cleaner = ReadingTextStream()
+
+        sent = cleaner.feed(BODY + "\n\nThat concludes the rea")
+
+        assert sent and BODY.startswith(sent)
+        assert "That" not in sent
+        assert cleaner.feed("ding.###END###more") == BODY[len(sent) :]
+        assert cleaner.finished
+        assert cleaner.feed("ignored") == "" and cleaner.finish() == ""
+        assert cleaner.text == BODY
+
+    def test_thinking_stops_at_any_end_marker(self) -> None:
+        """clean_reading_text only cuts at [[END OF READING]] after thinking."""
+        text = (
+            "(thinking) One card.\n\n"
+            "The Star is renewal. That concludes the reading. Unrelated"
+        )
+
+        assert _stream(text, 5) == "The Star is renewal."
+        assert clean_reading_text(text) == text.split("\n\n", 1)[1]
+
+    def test_heading_stops_at_end_of_reading(self) -> None:
+        """clean_reading_text ignores [[END OF READING]] after a heading."""
+        text = BODY + "[[END OF READING]] trailing"
+
+        assert _stream(text, 5) == BODY
+        assert clean_reading_text(text) == text
+
+    def test_long_preamble_is_sent(self) -> None:
+        """Text before a late heading has already gone out once the window fills."""
+        preamble = "Thinking out loud about the spread. " * 4
+        text = preamble + BODY
+
+        assert _stream(text, 8, max_preamble=50) == text.strip()
+        assert _stream(text, 8, max_preamble=1000) == clean_reading_text(text) == BODY
+
+    def test_waits_for_preamble_window(self) -> None:
+        cleaner = ReadingTextStream(max_preamble=20)
+
+        assert cleaner.feed("(thin") == ""
+        assert cleaner.feed("king) still thinking") == ""
+        assert cleaner.feed("\n\n") == ""
+        assert cleaner.feed("The Star.") == ""  # held back as a possible marker
+        assert cleaner.finish() == "The Star."
@@ -0,0 +1,121 @@
+"""Test the rhythm.py module."""
+
+import pytest
+from arcanum import batch
+from arcanum.reading import ReadingService
+from arcanum.rhythm import RhythmHasher, rhythm_seed, rhythm_seeds
+from arcanum.shuffle import ShuffleService
+
+RHYTHMS = [
+    [512, 498, 505, 1020, 250, 251],
+    [120.4, 119.6, 240, 60],
+    [9000, 15000, 3],
+    [500] * 8,
+]
+
+
+class TestRhythmSeed:
+    def test_deterministic(self) -> None:
+        assert rhythm_seed(RHYTHMS[0]) == rhythm_seed(list(RHYTHMS[0]))
+        assert 0 <= rhythm_seed(RHYTHMS[0]) < 2**32
+
+    def test_order_matters(self) -> None:
+        assert rhythm_seed([100, 200, 300]) != rhythm_seed([300, 200, 100])
+
+    def test_quantized(self) -> None:
+        """Intervals within the same 10 ms step give the same seed."""
+        assert rhythm_seed([501, 999, 250]) == rhythm_seed([499, 1001, 248])
+        assert rhythm_seed([500, 1000]) != rhythm_seed([520, 1000])
+
+    def test_long_pauses_are_capped(self) -> None:
+        assert rhythm_seed([500, 10_000]) == rhythm_seed([500, 60_000])
+
+    def test_features(self) -> None:
+        steady = RhythmHasher()
+        steady.update([500] * 8)
+        uneven = RhythmHasher()
+        uneven.update([250, 750, 250, 750])
+
+        assert (steady.tempo, steady.jitter) == (120, 0)
+        assert (uneven.tempo, uneven.jitter) == (120, 500)
+
+    def test_chunking_does_not_matter(self) -> None:
+        intervals = [(i * 37) % 900 + 100 for i in range(1000)]
+
+        whole = rhythm_seed(intervals)
+
+        assert rhythm_seed(intervals, chunk_size=7) == whole
+        assert rhythm_seed(iter(intervals), chunk_size=64) == whole
+
+    def test_very_long_rhythm_from_a_generator(self) -> None:
+        taps = ((i * 7919) % 1500 for i in range(500_000))
+
+        assert 0 <= rhythm_seed(taps) < 2**32
+
+    def test_python_path_matches_numpy(self, monkeypatch) -> None:
+        pytest.importorskip("numpy")
+        expected = [rhythm_seed(r) for r in RHYTHMS]
+        monkeypatch.setattr(batch, "NUMPY_AVAILABLE", False)
+
+        assert [rhythm_seed(r) for r in RHYTHMS] == expected
+
+    def test_batch_matches_single(self) -> None:
+        pytest.importorskip("numpy")
+        rhythms = RHYTHMS + [[], None, [42]]
+
+        seeds = rhythm_seeds(rhythms)
+
+        assert seeds[:4] == [rhythm_seed(r) for r in RHYTHMS]
+        assert seeds[4:6] == [None, None]
+        assert seeds[6] == rhythm_seed([42])
+
+
+class TestRhythmReadings:
+    def test_empty_rhythm_keeps_the_question_seed(self) -> None:
+        assert ShuffleService.generate_seed("Q", 7, rhythm=[]) == (
+            ShuffleService.generate_seed("Q", 7)
+        )
+        assert ShuffleService.generate_seed("Q", 7, rhythm=RHYTHMS[0]) != (
+            ShuffleService.generate_seed("Q", 7)
+        )
+
+    def test_reading_with_rhythm(self) -> None:
+        reader = ReadingService()
+
+        first = reader.perform_reading("Q", "celtic-cross", rhythm=RHYTHMS[0])
+        again = ReadingService().perform_reading("Q", "celtic-cross", rhythm=RHYTHMS[0])
+        other = reader.perform_reading("Q", "celtic-cross", rhythm=RHYTHMS[1])
+
+        assert first.seed == ShuffleService.generate_seed("Q", 7, rhythm=RHYTHMS[0])
+        assert first.cards == again.cards
+        assert first.seed != other.seed
+
+    def test_generate_seeds_with_rhythms(self) -> None:
+        questions = ["a", "b", "c", "d"]
+        rhythms = [RHYTHMS[0], None, [], RHYTHMS[1]]
+
+        seeds = ShuffleService.generate_seeds(questions, 7, rhythms=rhythms)
+
+        assert seeds == [
+            ShuffleService.generate_seed(q, 7, rhythm=r)
+            for q, r in zip(questions, rhythms)
+        ]
+
+    def test_numpy_rhythms(self, monkeypatch) -> None:
+        np = pytest.importorskip("numpy")
+        taps = np.array(RHYTHMS[0], dtype=float)
+        questions = ["a", "b", "c"]
+        rhythms = [taps, None, np.array([])]
+        expected = [
+            ShuffleService.generate_seed(q, 7, rhythm=r)
+            for q, r in zip(questions, [RHYTHMS[0], None, []])
+        ]
+
+        reading = ReadingService().perform_reading("Q", "celtic-cross", rhythm=taps)
+        empty = ReadingService().perform_reading("Q", "celtic-cross", rhythm=np.array([]))
+
+        assert reading.seed == ShuffleService.generate_seed("Q", 7, rhythm=RHYTHMS[0])
+        assert empty.seed == ShuffleService.generate_seed("Q", 7)
+        assert ShuffleService.generate_seeds(questions, 7, rhythms=rhythms) == expected
+        monkeypatch.setattr(batch, "NUMPY_AVAILABLE", False)
+        assert ShuffleService.generate_seeds(questions, 7, rhythms=rhythms) == expected
@@ -0,0 +1,170 @@
+"""Test the shuffle.py and drawing.py modules."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from arcanum.deck import Deck
+from arcanum.drawing import DrawingService
+from arcanum.reading import ReadingService
+from arcanum.shuffle import ShuffleAlgorithm, ShuffleService, SplitMix64
+from arcanum.spreads import CelticCrossSpread
+
+
+class TestShuffleService:
+    def test_shuffle_is_deterministic(self) -> None:
+        """Same seed, same order."""
+        cards = Deck().get_cards()
+
+        assert ShuffleService.shuffle_cards(cards, 42) == ShuffleService.shuffle_cards(
+            cards, 42
+        )
+
+    def test_shuffle_matches_legacy_global_seed(self) -> None:
+        """Per-reading generators keep the orderings of existing seeds."""
+        cards = Deck().get_cards()
+        legacy = cards.copy()
+        random.seed(1234)
+        random.shuffle(legacy)
+
+        assert ShuffleService.shuffle_cards(cards, 1234) == legacy
+
+    def test_shuffle_leaves_global_state_alone(self) -> None:
+        """Shuffling must not reseed the module-level generator."""
+        random.seed(99)
+        expected = random.random()
+
+        random.seed(99)
+        ShuffleService.shuffle_cards(Deck().get_cards(), 7)
+
+        assert random.random() == expected
+
+    def test_partial_shuffle_draws_distinct_cards(self) -> None:
+        """A partial shuffle gives `count` unique cards, reproducibly."""
+        cards = Deck().get_cards()
+
+        drawn = ShuffleService.partial_shuffle(cards, 12, 2024)
+
+        assert len(drawn) == 12
+        assert len(set(drawn)) == 12
+        assert drawn == ShuffleService.partial_shuffle(cards, 12, 2024)
+        assert len(cards) == 78
+
+    def test_partial_shuffle_prefixes_agree(self) -> None:
+        """Drawing fewer cards gives the start of a longer draw."""
+        cards = Deck().get_cards()
+
+        ten = ShuffleService.partial_shuffle(cards, 10, 31)
+
+        assert ShuffleService.partial_shuffle(cards, 3, 31) == ten[:3]
+
+    def test_shuffle_for_dispatches_by_version(self) -> None:
+        cards = Deck().get_cards()
+
+        assert ShuffleService.shuffle_for(
+            ShuffleAlgorithm.FULL_SHUFFLE, cards, 3, 42
+        ) == ShuffleService.shuffle_cards(cards, 42)
+        assert ShuffleService.shuffle_for(
+            ShuffleAlgorithm.PARTIAL_SHUFFLE, cards, 3, 42
+        ) == ShuffleService.partial_shuffle(cards, 3, 42)
+        with pytest.raises(ValueError):
+            ShuffleService.shuffle_for(99, cards, 3, 42)
+
+
+class TestRiffleShuffle:
+    def test_splitmix_reference_value(self) -> None:
+        assert SplitMix64(0).next_uint64() == 0xE220A8397B1DCDAF
+
+    def test_riffle_keeps_every_card(self) -> None:
+        cards = Deck().get_cards()
+
+        riffled = ShuffleService.riffle_shuffle(cards, 7, 42)
+
+        assert sorted(riffled, key=cards.index) == cards
+        assert riffled == ShuffleService.riffle_shuffle(cards, 7, 42)
+
+    @staticmethod
+    def _rising_sequences(riffles: int, seed: int) -> int:
+        riffled = ShuffleService.riffle_shuffle(list(range(78)), riffles, seed)
+        where = {card: index for index, card in enumerate(riffled)}
+        return 1 + sum(where[card + 1] < where[card] for card in range(77))
+
+    def test_riffles_double_rising_sequences(self) -> None:
+        """r riffles leave at most 2**r rising sequences of the original order."""
+        for seed in range(20):
+            assert self._rising_sequences(1, seed) <= 2
+            assert self._rising_sequences(3, seed) <= 8
+
+    def test_many_riffles_look_random(self) -> None:
+        """A uniform deck averages (78 + 1) / 2 rising sequences."""
+        mean = sum(self._rising_sequences(21, seed) for seed in range(50)) / 50
+
+        assert 35 < mean < 44
+
+    @pytest.mark.parametrize("riffles", [0, 1, 7, 21])
+    def test_vectorized_matches_python(self, riffles) -> None:
+        np = pytest.importorskip("numpy")
+        seeds = np.arange(600, dtype=np.uint32) * 2654435761
+        indices, reversals = ShuffleService.riffle_indices(
+            seeds, 78, 10, riffles, 0.3, chunk_size=128
+        )
+        cards = list(range(78))
+
+        for seed, row, flags in zip(seeds, indices, reversals):
+            rng = SplitMix64(int(seed))
+            riffled = ShuffleService.riffle_shuffle(cards, riffles, int(seed), rng)
+            drawn = DrawingService(0.3).draw_cards(riffled, 10, rng=rng)
+            assert list(row) == [card.card for card in drawn]
+            assert list(flags) == [card.reversed for card in drawn]
+
+
+class TestDrawingService:
+    def test_draw_continues_shuffle_stream(self) -> None:
+        """Reversals come from the same generator as the shuffle."""
+        cards = Deck().get_cards()
+        rng = ShuffleService.create_rng(5)
+        shuffled = ShuffleService.shuffle_cards(cards, 5, rng)
+        drawn = DrawingService(0.5).draw_cards(shuffled, 3, rng=rng)
+
+        replay = random.Random(5)
+        replay.shuffle(cards)
+        assert [d.reversed for d in drawn] == [replay.random() < 0.5 for _ in range(3)]
+
+    def test_concurrent_readings_are_reproducible(self) -> None:
+        """Readings from many threads match the serial results."""
+        reader = ReadingService()
+        spread = CelticCrossSpread()
+        questions = [f"Question {i}" for i in range(400)]
+
+        def draw(question: str) -> list:
+            return reader.perform_reading(question, spread).cards
+
+        serial = [draw(q) for q in questions]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            threaded = list(pool.map(draw, questions))
+
+        assert threaded == serial
+
+    def test_same_seed_same_reversals_across_threads(self) -> None:
+        """shuffle_cards then draw_cards with the seed's generator is deterministic."""
+        cards = Deck().get_cards()
+
+        def draw(seed: int) -> list:
+            rng = ShuffleService.create_rng(seed)
+            shuffled = ShuffleService.shuffle_cards(cards, seed, rng)
+            return DrawingService(0.5).draw_cards(shuffled, 10, rng=rng)
+
+        seeds = [seed % 50 for seed in range(400)]
+        serial = [draw(seed) for seed in seeds]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            threaded = list(pool.map(draw, seeds))
+
+        assert threaded == serial
+        assert serial[0] == serial[50]
+        assert [d.reversed for d in serial[0]] != [d.reversed for d in serial[1]]
+
+    def test_draw_needs_the_shuffle_generator(self) -> None:
+        shuffled = ShuffleService.shuffle_cards(Deck().get_cards(), 5)
+
+        with pytest.raises(TypeError):
+            DrawingService(0.5).draw_cards(shuffled, 3)
@@ -0,0 +1,103 @@
+"""Test the spreads.py module."""
+
+import json
+
+import pytest
+from arcanum.reading import ReadingService
+from arcanum.spreads import (
+    CelticCrossSpread,
+    ConfiguredSpread,
+    SpreadRegistry,
+    ThreeCardSpread,
+    get_spread_registry,
+)
+
+CONFIG = {
+    "spreads": [
+        {
+            "id": "two-paths",
+            "name": "Two Paths",
+            "layout": "horizontal-2",
+            "positions": [
+                {"name": "Left", "short_description": "The first path"},
+                {"name": "Right", "short_description": "The second path"},
+            ],
+        },
+        {
+            "id": "past-present-future",
+            "name": "Three Cards",
+            "positions": [{"name": "Past"}, {"name": "Present"}, {"name": "Future"}],
+        },
+    ]
+}
+
+
+class TestSpreadRegistry:
+    def test_loads_config_spreads_by_id(self) -> None:
+        registry = SpreadRegistry.from_config(CONFIG)
+        spread = registry.get("two-paths")
+
+        assert isinstance(spread, ConfiguredSpread)
+        assert spread.name == "Two Paths"
+        assert spread.card_count == 2
+        assert spread.position_names == ("Left", "Right")
+        assert spread.positions[1].description == "The second path"
+
+    def test_config_overrides_builtin_and_keeps_the_rest(self) -> None:
+        registry = SpreadRegistry.from_config(CONFIG)
+
+        assert registry.get("past-present-future").name == "Three Cards"
+        assert isinstance(registry.get("celtic-cross"), CelticCrossSpread)
+        assert len(registry) == 4
+
+    def test_unknown_spread(self) -> None:
+        with pytest.raises(ValueError):
+            SpreadRegistry.builtin().get("nope")
+
+    def test_spreads_are_read_only(self) -> None:
+        spread = SpreadRegistry.from_config(CONFIG).get("two-paths")
+
+        with pytest.raises(AttributeError):
+            spread.name = "Other"
+        with pytest.raises(AttributeError):
+            spread.positions[0].name = "Other"
+
+    def test_positions_are_not_rebuilt(self) -> None:
+        spread = ThreeCardSpread()
+
+        assert spread.positions is spread.positions
+        assert spread.position_names is spread.position_names
+
+    def test_loaded_once_per_file(self, tmp_path) -> None:
+        path = tmp_path / "spreads-config.json"
+        path.write_text(json.dumps(CONFIG))
+
+        registry = get_spread_registry(path)
+
+        assert get_spread_registry(str(path)) is registry
+        assert "two-paths" in registry
+
+    def test_backend_config(self) -> None:
+        """Every spread in the shipped config is available by id."""
+        registry = get_spread_registry()
+
+        assert len(registry) == 11
+        assert registry.get("year-ahead").position_names[0] == "January"
+        assert registry.get("four-card-decision").card_count == 4
+
+
+class TestReadingWithRegistry:
+    def test_reading_by_spread_id(self) -> None:
+        reader = ReadingService(spreads=SpreadRegistry.from_config(CONFIG))
+        reading = reader.perform_reading("Which way?", "two-paths")
+
+        assert reading.spread.name == "Two Paths"
+        assert [c.position for c in reading.cards] == ["Left", "Right"]
+
+    def test_id_and_layout_give_the_same_cards(self) -> None:
+        reader = ReadingService(cache_size=0)
+
+        by_id = reader.perform_reading("Q", "celtic-cross")
+        by_layout = reader.perform_reading("Q", CelticCrossSpread())
+
+        assert [str(c) for c in by_id.cards] == [str(c) for c in by_layout.cards]
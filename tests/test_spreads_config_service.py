@@ -0,0 +1,80 @@
+"""Test the backend's SpreadsConfigService."""
+
+import json
+import os
+
+import pytest
+from services.spreads_config_service import SpreadsConfigService
+
+CONFIG = {
+    "layouts": {"single-center": {"name": "Single", "positions": [{"x": 50, "y": 30}]}},
+    "spreads": [
+        {
+            "id": "single-focus",
+            "name": "Single Focus",
+            "description": "One card",
+            "layout": "single-center",
+            "positions": [{"name": "Focus", "description": "The heart of it"}],
+        }
+    ],
+    "categories": {},
+    "metadata": {},
+}
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "spreads-config.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    return path
+
+
+def _rewrite(path, config, mtime_ns):
+    path.write_text(json.dumps(config), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestSpreadsConfigService:
+    def test_unchanged_file_is_not_reloaded(self, config_path) -> None:
+        service = SpreadsConfigService(str(config_path), check_interval=0)
+        first = service.snapshot()
+
+        assert service.snapshot() is first
+        assert service.snapshot().version == first.version
+
+    def test_reloads_when_mtime_changes(self, config_path) -> None:
+        """An edit with a new mtime is picked up on the next check."""
+        service = SpreadsConfigService(str(config_path), check_interval=0)
+        first = service.snapshot()
+
+        config = json.loads(json.dumps(CONFIG))
+        config["spreads"][0]["name"] = "Single Focus!"
+        _rewrite(config_path, config, config_path.stat().st_mtime_ns + 10**9)
+
+        second = service.snapshot()
+        assert second.version == first.version + 1
+        assert service.data["spreads"][0]["name"] == "Single Focus!"
+
+    def test_waits_for_the_check_interval(self, config_path) -> None:
+        service = SpreadsConfigService(str(config_path), check_interval=3600)
+        first = service.snapshot()
+
+        config = json.loads(json.dumps(CONFIG))
+        config["spreads"][0]["name"] = "Changed"
+        _rewrite(config_path, config, config_path.stat().st_mtime_ns + 10**9)
+
+        assert service.snapshot() is first
+
+    def test_bad_edit_keeps_the_last_good_config(self, config_path) -> None:
+        service = SpreadsConfigService(str(config_path), check_interval=0)
+        first = service.snapshot()
+
+        config_path.write_text("{not json", encoding="utf-8")
+        os.utime(config_path, ns=(config_path.stat().st_mtime_ns + 10**9,) * 2)
+
+        assert service.snapshot() is first
+        assert service.data["spreads"][0]["id"] == "single-focus"
+
+    def test_missing_file_raises_at_startup(self, tmp_path) -> None:
+        with pytest.raises(FileNotFoundError):
+            SpreadsConfigService(str(tmp_path / "missing.json"))
@@ -0,0 +1,123 @@
+"""Test the backend's background service startup."""
+
+import threading
+import time
+
+import pytest
+from services.startup import LazyService, ServiceInitializer, ServiceUnavailableError
+
+
+class TestServiceInitializer:
+    def test_dependencies_are_built_first(self) -> None:
+        built = []
+        services = ServiceInitializer(max_workers=4)
+
+        def factory(name, delay=0.0):
+            def build():
+                time.sleep(delay)
+                built.append(name)
+                return name
+
+            return build
+
+        services.register("config", factory("config", 0.05))
+        services.register("catalog", factory("catalog", 0.02))
+        services.register("index", factory("index"), depends_on=["config", "catalog"])
+        services.register("cache", factory("cache"), depends_on=["index"])
+
+        assert services.get("cache", timeout=5) == "cache"
+        assert built.index("index") > max(built.index("config"), built.index("catalog"))
+        assert built.index("cache") > built.index("index")
+        assert services.ready
+
+    def test_unregistered_dependency(self) -> None:
+        services = ServiceInitializer()
+
+        with pytest.raises(ValueError):
+            services.register("index", lambda: None, depends_on=["catalog"])
+
+    def test_failure_propagates_to_dependents(self) -> None:
+        def broken():
+            raise FileNotFoundError("all_cards.json")
+
+        services = ServiceInitializer()
+        services.register("catalog", broken)
+        services.register("index", lambda: "index", depends_on=["catalog"])
+        services.register("other", lambda: "other")
+
+        assert services.get("index", timeout=5) is None
+        assert services.get("other", timeout=5) == "other"
+        report = services.report()["components"]
+        assert report["catalog"]["status"] == "failed"
+        assert report["index"] == {
+            "status": "failed",
+            "required": True,
+            "seconds": report["index"]["seconds"],
+            "error": "dependency catalog failed",
+        }
+        assert not services.ready
+
+    def test_optional_failure_keeps_readiness(self) -> None:
+        services = ServiceInitializer()
+        services.register("catalog", lambda: "catalog")
+        services.register("warmup", lambda: 1 / 0, required=False)
+
+        services.get("warmup", timeout=5)
+
+        assert services.ready
+        assert services.report()["components"]["warmup"]["status"] == "failed"
+
+    @pytest.mark.parametrize("error", [SystemExit, KeyboardInterrupt, RuntimeError])
+    def test_any_raise_resolves_the_component(self, error) -> None:
+        """Waiting callers are released even when the factory doesn't raise an Exception."""
+        def broken():
+            raise error()
+
+        services = ServiceInitializer()
+        services.register("model", broken)
+        services.register("queue", lambda: "queue", depends_on=["model"])
+
+        assert services.get("queue", timeout=5) is None
+        assert services.get("model", timeout=5) is None
+        assert isinstance(services.exception("model"), error)
+        assert services.report()["components"]["model"]["error"] == error.__name__
+
+
+class TestLazyService:
+    def test_waits_for_the_component(self) -> None:
+        release = threading.Event()
+
+        def slow():
+            release.wait(5)
+            return {"the_fool": 0}
+
+        services = ServiceInitializer()
+        services.register("cards", slow)
+        cards = LazyService(services, "cards")
+        services.start()
+
+        threading.Timer(0.05, release.set).start()
+        assert "the_fool" in cards
+        assert len(cards) == 1
+        assert cards.get("the_fool") == 0
+        assert cards
+
+    def test_unavailable_service_carries_the_cause(self) -> None:
+        def broken():
+            raise FileNotFoundError("spreads-config.json")
+
+        services = ServiceInitializer()
+        services.register("spreads", broken)
+        services.register("practice", lambda: "practice", depends_on=["spreads"])
+        spreads = LazyService(services, "spreads")
+        practice = LazyService(services, "practice")
+
+        assert not spreads
+        with pytest.raises(ServiceUnavailableError) as raised:
+            spreads.registry
+        assert isinstance(raised.value.__cause__, FileNotFoundError)
+
+        # A dependent fails with the dependency's error as its cause
+        with pytest.raises(ServiceUnavailableError) as raised:
+            practice.upper
+        assert isinstance(raised.value.__cause__, FileNotFoundError)
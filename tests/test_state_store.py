@@ -0,0 +1,163 @@
+"""Test the backend's state_store.py module."""
+
+import multiprocessing
+
+import pytest
+from services.state_store import (
+    MemoryStateStore,
+    SQLiteStateStore,
+    StateMapping,
+    WriteBehindCache,
+    open_state_store,
+)
+
+
+def _worker_session(path: str, worker: int, count: int) -> None:
+    # Runs in a separate process, like one uvicorn worker
+    store = open_state_store(f"sqlite:///{path}")
+    sessions = StateMapping(store, "sessions")
+    started = sessions["shared"]
+    for i in range(count):
+        sessions[f"worker-{worker}-{i}"] = {"worker": worker, "question": started["question"]}
+    store.flush()
+
+
+def _worker_advance(path: str, session_id: str) -> None:
+    store = open_state_store(f"sqlite:///{path}")
+    sessions = StateMapping(store, "sessions")
+    session = sessions[session_id]
+    session["step"] += 1
+    sessions[session_id] = session
+    store.flush()
+
+
+@pytest.fixture(params=["memory", "sqlite", "write-behind"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        store = MemoryStateStore()
+    elif request.param == "sqlite":
+        store = SQLiteStateStore(str(tmp_path / "state.db"))
+    else:
+        store = WriteBehindCache(
+            SQLiteStateStore(str(tmp_path / "state.db")), flush_interval=None
+        )
+    yield store
+    store.close()
+
+
+class TestStateMapping:
+    def test_set_get_delete(self, store) -> None:
+        sessions = StateMapping(store, "sessions")
+        sessions["a"] = {"step": 1}
+        assert sessions["a"] == {"step": 1}
+        assert "a" in sessions
+        del sessions["a"]
+        assert "a" not in sessions
+        with pytest.raises(KeyError):
+            sessions["a"]
+
+    def test_namespaces_are_separate(self, store) -> None:
+        sessions = StateMapping(store, "sessions")
+        progress = StateMapping(store, "progress")
+        sessions["a"] = 1
+        progress["b"] = 2
+        assert list(sessions) == ["a"]
+        assert sessions.values() == [1]
+        assert len(progress) == 1
+
+    def test_reads_are_copies(self, store) -> None:
+        sessions = StateMapping(store, "sessions")
+        sessions["a"] = {"step": 1}
+        sessions["a"]["step"] = 2
+        assert sessions["a"] == {"step": 1}
+
+
+class TestWriteBehindCache:
+    def test_writes_wait_for_flush(self, tmp_path) -> None:
+        path = str(tmp_path / "state.db")
+        cached = WriteBehindCache(SQLiteStateStore(path), flush_interval=None)
+        other = SQLiteStateStore(path)
+
+        cached.write([("sessions", "a", "1"), ("sessions", "b", "2")])
+        assert cached.get("sessions", "a") == "1"
+        assert other.get("sessions", "a") is None
+
+        cached.flush()
+        assert other.scan("sessions") == {"a": "1", "b": "2"}
+        cached.close()
+        other.close()
+
+    def test_repeat_reads_come_from_memory(self, tmp_path) -> None:
+        cached = WriteBehindCache(
+            SQLiteStateStore(str(tmp_path / "state.db")), flush_interval=None
+        )
+        cached.write([("sessions", "a", "1")])
+        cached.flush()
+        for _ in range(3):
+            assert cached.get("sessions", "a") == "1"
+        assert cached.cache.hits == 3
+        cached.close()
+
+    def test_sees_writes_from_other_connections(self, tmp_path) -> None:
+        path = str(tmp_path / "state.db")
+        cached = WriteBehindCache(SQLiteStateStore(path), flush_interval=None)
+        other = SQLiteStateStore(path)
+
+        other.write([("sessions", "a", "1")])
+        assert cached.get("sessions", "a") == "1"
+        other.write([("sessions", "a", "2"), ("sessions", "b", None)])
+        assert cached.get("sessions", "a") == "2"
+        other.write([("sessions", "a", None)])
+        assert cached.get("sessions", "a") is None
+        cached.close()
+        other.close()
+
+
+class TestMultipleProcesses:
+    def test_sessions_survive_across_processes(self, tmp_path) -> None:
+        path = str(tmp_path / "state.db")
+        store = open_state_store(f"sqlite:///{path}")
+        sessions = StateMapping(store, "sessions")
+        sessions["shared"] = {"question": "What next?"}
+        sessions["advanced"] = {"step": 0}
+        store.flush()
+
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_worker_session, args=(path, worker, 20))
+            for worker in range(4)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(60)
+            assert process.exitcode == 0
+
+        # Each request of a session may land on a different worker
+        for _ in range(3):
+            process = context.Process(target=_worker_advance, args=(path, "advanced"))
+            process.start()
+            process.join(60)
+            assert process.exitcode == 0
+
+        assert len(sessions) == 2 + 4 * 20
+        assert sessions["worker-3-19"] == {"worker": 3, "question": "What next?"}
+        assert sessions["advanced"] == {"step": 3}
+        store.close()
+
+
+class TestOpenStateStore:
+    def test_memory_by_default(self, monkeypatch) -> None:
+        monkeypatch.delenv("ARCANUM_STATE_STORE", raising=False)
+        assert isinstance(open_state_store(), MemoryStateStore)
+
+    def test_sqlite_from_environment(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("ARCANUM_STATE_STORE", str(tmp_path / "state.db"))
+        store = open_state_store()
+        assert isinstance(store, WriteBehindCache)
+        assert isinstance(store.store, SQLiteStateStore)
+        store.close()
+
+    def test_unknown_store(self) -> None:
+        with pytest.raises(ValueError):
+            open_state_store("redis://localhost")
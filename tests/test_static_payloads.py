@@ -0,0 +1,142 @@
+"""Test the backend's static payload cache."""
+
+import gzip
+import json
+import os
+
+import pytest
+from services.static_payloads import PayloadSource, StaticPayload, StaticPayloadCache
+
+DOCUMENT = {"cards": [{"name": "The Fool", "number": 0}]}
+
+
+@pytest.fixture
+def payload():
+    built = StaticPayload.build(DOCUMENT, version=1)
+    # Stand in for brotli output so negotiation doesn't need the package
+    return StaticPayload(
+        body=built.body,
+        gzip_body=built.gzip_body,
+        brotli_body=b"brotli",
+        etag=built.etag,
+        version=built.version,
+    )
+
+
+class TestStaticPayload:
+    def test_build(self) -> None:
+        payload = StaticPayload.build(DOCUMENT, version=1)
+
+        assert json.loads(payload.body) == DOCUMENT
+        assert gzip.decompress(payload.gzip_body) == payload.body
+        assert payload.etag == StaticPayload.build(DOCUMENT, version=2).etag
+        assert payload.etag != StaticPayload.build({}, version=1).etag
+
+    def test_if_none_match(self, payload) -> None:
+        assert payload.matches(payload.etag)
+        assert payload.matches(f"W/{payload.etag}")
+        assert payload.matches(f'"stale", {payload.etag}')
+        assert payload.matches("*")
+        assert not payload.matches('"stale"')
+        assert not payload.matches(None)
+        assert not payload.matches("")
+
+    @pytest.mark.parametrize(
+        "header, encoding",
+        [
+            (None, None),
+            ("", None),
+            ("identity", None),
+            ("gzip", "gzip"),
+            ("gzip, deflate, br", "br"),
+            ("br;q=0, gzip", "gzip"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("br, gzip;q=0.8", "br"),
+            ("gzip;q=0, br;q=0", None),
+            ("*", "br"),
+            ("*, br;q=0", "gzip"),
+            ("*;q=0", None),
+            ("GZIP;q=1.0", "gzip"),
+            ("gzip;q=oops", None),
+        ],
+    )
+    def test_encoding_follows_q_values(self, payload, header, encoding) -> None:
+        body, chosen = payload.encode_for(header)
+
+        assert chosen == encoding
+        assert body == {
+            None: payload.body,
+            "gzip": payload.gzip_body,
+            "br": payload.brotli_body,
+        }[encoding]
+
+    def test_br_needs_the_brotli_package(self) -> None:
+        payload = StaticPayload.build(DOCUMENT, version=1)
+        payload = StaticPayload(
+            payload.body, payload.gzip_body, None, payload.etag, payload.version
+        )
+
+        assert payload.encode_for("br") == (payload.body, None)
+        assert payload.encode_for("br, gzip;q=0.1")[1] == "gzip"
+
+
+class TestStaticPayloadCache:
+    def test_rebuilds_when_the_file_changes(self, tmp_path) -> None:
+        path = tmp_path / "cards.json"
+        path.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+        cache = StaticPayloadCache(check_interval=0)
+        cache.add_file("cards", str(path))
+
+        first = cache.get("cards")
+        assert cache.get("cards") is first
+
+        path.write_text(json.dumps({"cards": []}), encoding="utf-8")
+        mtime = path.stat().st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+        second = cache.get("cards")
+        assert second.etag != first.etag
+        assert json.loads(second.body) == {"cards": []}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_keeps_the_last_good_payload(self, tmp_path) -> None:
+        path = tmp_path / "cards.json"
+        path.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+        cache = StaticPayloadCache(check_interval=0)
+        cache.add_file("cards", str(path))
+        first = cache.get("cards")
+
+        path.write_text("{not json", encoding="utf-8")
+        mtime = path.stat().st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime, mtime))
+
+        assert cache.get("cards") is first
+
+    def test_error_without_a_payload_is_raised(self, tmp_path) -> None:
+        cache = StaticPayloadCache()
+        cache.add_file("cards", str(tmp_path / "missing.json"))
+
+        with pytest.raises(FileNotFoundError):
+            cache.get("cards")
+
+    def test_version_is_checked_once_per_interval(self) -> None:
+        checks = []
+
+        def version():
+            checks.append(1)
+            return 1
+
+        cache = StaticPayloadCache(check_interval=3600)
+        cache.add("doc", PayloadSource(load=lambda: DOCUMENT, version=version))
+
+        for _ in range(5):
+            cache.get("doc")
+
+        assert len(checks) == 1
+        assert cache.stats() == {
+            "payloads": 1,
+            "hits": 4,
+            "misses": 1,
+            "hit_ratio": 0.8,
+        }
@@ -0,0 +1,45 @@
+"""Test the stats.py module."""
+
+import pytest
+from arcanum.stats import analyze, chi_square_sf
+
+np = pytest.importorskip("numpy")
+
+
+class TestChiSquare:
+    @pytest.mark.parametrize(
+        "statistic, dof, expected",
+        [(3.841, 1, 0.05), (11.070, 5, 0.05), (98.484, 77, 0.05), (0.0, 10, 1.0)],
+    )
+    def test_survival_function(self, statistic, dof, expected) -> None:
+        """p-values match standard chi-square tables."""
+        assert chi_square_sf(statistic, dof) == pytest.approx(expected, abs=1e-3)
+
+
+class TestAnalyze:
+    def test_counts_are_consistent(self) -> None:
+        """Every draw lands in exactly one cell of each matrix."""
+        report = analyze(5000, 3, workers=1, chunk_size=1024)
+
+        assert report.position_counts.shape == (78, 3)
+        assert (report.position_counts.sum(axis=0) == 5000).all()
+        assert report.cooccurrence.sum() == 5000 * 3 * 2
+        assert (report.cooccurrence == report.cooccurrence.T).all()
+        assert report.seed_buckets.sum() == 5000
+
+    def test_process_pool_matches_single_process(self) -> None:
+        """Splitting the work across processes gives the same counts."""
+        single = analyze(3000, 10, workers=1, chunk_size=1000)
+        pooled = analyze(3000, 10, workers=2, chunk_size=1000)
+
+        assert (single.position_counts == pooled.position_counts).all()
+        assert (single.cooccurrence == pooled.cooccurrence).all()
+        assert single.unique_seeds == pooled.unique_seeds
+
+    def test_fair_pipeline_passes(self) -> None:
+        """The current pipeline shows no bias at this sample size."""
+        report = analyze(20000, 10, workers=1)
+
+        assert report.position_test().p_value > 0.001
+        assert report.reversal_test().p_value > 0.001
+        assert report.to_dict()["samples"] == 20000
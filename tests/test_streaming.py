@@ -0,0 +1,86 @@
+"""Test the streaming.py module."""
+
+import json
+
+import pytest
+from arcanum import batch
+from arcanum.cli import spread_choices
+from arcanum.reading import ReadingService
+from arcanum.streaming import stream_readings
+
+SPREADS = spread_choices()
+
+
+def _lines(count: int) -> list[str]:
+    spreads = ["1", "3", "celtic"]
+    return [
+        json.dumps({"id": i, "question": f"Question {i}", "spread": spreads[i % 3]})
+        for i in range(count)
+    ]
+
+
+def _run(lines: list[str], **kwargs) -> list[dict]:
+    output = "".join(stream_readings(lines, SPREADS, "3", **kwargs))
+    rows = [json.loads(row) for row in output.splitlines()]
+    for row in rows:
+        row.pop("timestamp", None)
+    return rows
+
+
+class TestStreamReadings:
+    def test_output_in_input_order(self) -> None:
+        rows = _run(_lines(50), chunk_size=7)
+
+        assert [row["id"] for row in rows] == list(range(50))
+
+    def test_matches_perform_reading(self) -> None:
+        """Streamed readings are the same as one perform_reading per line."""
+        rows = _run(_lines(30), chunk_size=8)
+        reader = ReadingService()
+
+        for i, row in enumerate(rows):
+            spread = SPREADS[["1", "3", "celtic"][i % 3]]
+            reading = reader.perform_reading(f"Question {i}", spread)
+            assert row["seed"] == reading.seed
+            assert [c["name"] for c in row["cards"]] == [
+                c.card.name for c in reading.cards
+            ]
+            assert [c["reversed"] for c in row["cards"]] == [
+                c.reversed for c in reading.cards
+            ]
+
+    def test_without_numpy(self, monkeypatch) -> None:
+        """The per-line fallback gives the same output as the batch path."""
+        expected = _run(_lines(20))
+        monkeypatch.setattr(batch, "NUMPY_AVAILABLE", False)
+
+        assert _run(_lines(20)) == expected
+
+    def test_bad_lines_report_errors(self) -> None:
+        lines = ['{"question": "ok"}', "not json", '{"spread": "3"}', ""]
+        lines.append('{"question": "q", "spread": "nope"}')
+
+        rows = _run(lines)
+
+        assert rows[0]["question"] == "ok"
+        assert [row.get("line") for row in rows[1:]] == [2, 3, 5]
+        assert all("error" in row for row in rows[1:])
+
+    def test_line_options_override_defaults(self) -> None:
+        lines = ['{"question": "q", "shuffle_count": 3, "spread": "celtic"}']
+
+        rows = _run(lines, shuffle_count=9)
+
+        assert rows[0]["shuffle_count"] == 3
+        assert len(rows[0]["cards"]) == 10
+
+    def test_spread_by_registry_id(self) -> None:
+        rows = _run(['{"question": "q", "spread": "year-ahead"}'])
+
+        assert rows[0]["spread"] == "Year Ahead"
+        assert rows[0]["cards"][0]["position"] == "January"
+
+    def test_process_pool_matches_inline(self) -> None:
+        lines = _lines(40)
+
+        assert _run(lines, workers=2, chunk_size=6) == _run(lines)
@@ -0,0 +1,199 @@
+"""Test the backend's training data store."""
+
+import json
+import os
+import threading
+
+import pytest
+from services.training_store import TrainingStore
+
+CATEGORIES = ["Career & Work", "Love & Relationships", "Creative & Expression"]
+
+
+def _reading(number: int) -> dict:
+    special = number % 5 == 0
+    return {
+        "reading_id": f"R{number:03d}",
+        "spread_id": "inner-messenger-4" if special else "single-focus",
+        "question_category": CATEGORIES[number % len(CATEGORIES)],
+        "question": f"Question {number}?",
+        "cards": [{"position_name": "Focus", "card_name": "The Fool", "orientation": "Upright"}],
+        "spread_config": {"id": "inner-messenger-4"} if special else None,
+        "source": "special" if special else "common",
+    }
+
+
+def _write_readings(data_dir, readings) -> None:
+    path = data_dir / "readings" / "all_readings.json"
+    metadata = {
+        "total_readings": len(readings),
+        "common_readings": sum(1 for r in readings if r["source"] == "common"),
+        "special_readings": sum(1 for r in readings if r["source"] == "special"),
+    }
+    path.write_text(
+        json.dumps({"tarot_reading_dataset": {"metadata": metadata, "readings": readings}}),
+        encoding="utf-8",
+    )
+    # Make sure the edit is seen even within the filesystem's mtime resolution
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "readings").mkdir()
+    (tmp_path / "interpretations").mkdir()
+    _write_readings(tmp_path, [_reading(n) for n in range(1, 13)])
+    (tmp_path / "readings" / "reading_002.md").write_text("The Fool leaps.", encoding="utf-8")
+    (tmp_path / "interpretations" / "R002.json").write_text(
+        json.dumps({"reading_id": "R002", "status": "completed", "notes": "good"}),
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def store(data_dir):
+    store = TrainingStore(str(data_dir), check_interval=0)
+    store.refresh()
+    return store
+
+
+def _ids(page) -> list:
+    return [reading["reading_id"] for reading in page.readings]
+
+
+class TestListing:
+    def test_pages_cover_every_reading_once(self, store) -> None:
+        ids, cursor = [], None
+        while True:
+            page = store.list(limit=5, cursor=cursor)
+            assert page.total == 12
+            ids += _ids(page)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert ids == [f"R{n:03d}" for n in range(1, 13)]
+
+    def test_filters(self, store) -> None:
+        assert _ids(store.list(source="special")) == ["R005", "R010"]
+        assert _ids(store.list(status="completed")) == ["R002"]
+        assert store.list(category="Career & Work").total == 4
+
+        store.set_status("R004", "draft")
+        page = store.list(status="draft", source="common")
+        assert _ids(page) == ["R004"]
+        assert page.readings[0]["status"] == "draft"
+        assert store.progress()["draft"] == 1
+
+    def test_filtered_pages(self, store) -> None:
+        first = store.list(source="common", limit=6)
+        second = store.list(source="common", limit=6, cursor=first.next_cursor)
+
+        assert len(first.readings) == 6 and first.total == 10
+        assert _ids(second) == ["R008", "R009", "R011", "R012"]
+        assert second.next_cursor is None
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"status": "done"}, {"source": "rare"}, {"limit": 0}, {"limit": 501}]
+    )
+    def test_bad_arguments(self, store, kwargs) -> None:
+        with pytest.raises(ValueError):
+            store.list(**kwargs)
+
+
+class TestWrites:
+    def test_stores_sharing_an_index_allocate_unique_ids(self, data_dir) -> None:
+        """Two workers creating readings at once never reuse an id."""
+        stores = [TrainingStore(str(data_dir), check_interval=0) for _ in range(2)]
+        created = []
+        lock = threading.Lock()
+
+        def create(store):
+            for i in range(5):
+                reading_id = store.add_reading(
+                    {"question": f"New {i}?", "question_category": "Career & Work",
+                     "spread_id": "single-focus", "cards": []},
+                    placeholder=lambda reading_id: f"# {reading_id}",
+                )
+                with lock:
+                    created.append(reading_id)
+
+        threads = [threading.Thread(target=create, args=(store,)) for store in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(created) == [f"R{n:03d}" for n in range(13, 23)]
+        with open(data_dir / "readings" / "all_readings.json") as f:
+            dataset = json.load(f)["tarot_reading_dataset"]
+        assert len({r["reading_id"] for r in dataset["readings"]}) == 22
+        assert dataset["metadata"]["total_readings"] == 22
+        assert stores[0].list(limit=100).total == 22
+
+    def test_export_import_round_trip(self, store) -> None:
+        store.save_interpretation("R007", "The Tower falls.", notes="draft one")
+        store.set_status("R009", "completed")
+
+        export_dir = store.export_path("snapshot")
+        assert store.export_files(export_dir) == 12
+
+        copy = TrainingStore(export_dir, check_interval=0)
+        copy.import_files()
+        assert _ids(copy.list()) == _ids(store.list())
+        for reading_id in ("R002", "R007"):
+            original = store.get_interpretation(reading_id)
+            exported = copy.get_interpretation(reading_id)
+            for key in ("interpretation", "notes", "status"):
+                assert exported[key] == original[key]
+        assert copy.counts_by("status") == store.counts_by("status")
+        assert copy.counts_by("source") == {"common": 10, "special": 2}
+
+    @pytest.mark.parametrize("name", ["", "  ", "..", "../elsewhere", "/tmp/elsewhere", "a/../../b"])
+    def test_export_stays_under_the_exports_directory(self, store, name) -> None:
+        with pytest.raises(ValueError):
+            store.export_path(name)
+
+    def test_export_path(self, store, data_dir) -> None:
+        assert store.export_path("2026/october") == os.path.realpath(
+            data_dir / "exports" / "2026" / "october"
+        )
+
+
+class TestChangeDetection:
+    def test_edited_readings_file_is_reindexed(self, store, data_dir) -> None:
+        readings = [_reading(n) for n in range(1, 13)] + [_reading(15)]
+        _write_readings(data_dir, readings)
+
+        page = store.list(limit=100)
+        assert page.total == 13
+        assert _ids(page)[-1] == "R015"
+        assert store.get("R015")["source"] == "special"
+
+    def test_new_interpretation_file_is_indexed(self, store, data_dir) -> None:
+        assert store.get_interpretation("R003") is None
+
+        (data_dir / "readings" / "reading_003.md").write_text("Three of Cups.", encoding="utf-8")
+        os.utime(data_dir / "readings", ns=(0, 0))
+
+        assert store.get_interpretation("R003")["interpretation"] == "Three of Cups."
+        assert store.get("R003")["has_interpretation"]
+
+    def test_hand_edited_markdown_is_reread(self, store, data_dir) -> None:
+        md_file = data_dir / "readings" / "reading_002.md"
+        md_file.write_text("The Fool leaps again.", encoding="utf-8")
+        mtime = md_file.stat().st_mtime_ns + 10**9
+        os.utime(md_file, ns=(mtime, mtime))
+
+        assert store.get_interpretation("R002")["interpretation"] == "The Fool leaps again."
+
+    def test_unchanged_files_are_not_reimported(self, store, monkeypatch) -> None:
+        calls = []
+        monkeypatch.setattr(store, "import_files", lambda: calls.append(1))
+
+        store.list()
+        store.get("R001")
+
+        assert calls == []